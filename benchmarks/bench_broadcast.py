@@ -0,0 +1,124 @@
+"""
+Spectator broadcast benchmark.
+
+Publishes random moves to many viewers over local socket pairs, standing in
+for the network, and reports bytes per move and CPU time per viewer for
+move frames, sticker-delta frames and the unfolded net that
+CubeView.display_cube_state prints.
+
+Usage:
+    python benchmarks/bench_broadcast.py [--viewers N] [--moves M]
+                                         [--keyframe-interval K] [--seed S]
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import socket
+import sys
+import time
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from rubiks_cube import (  # noqa: E402
+    BroadcastPublisher,
+    BroadcastSubscriber,
+    CubeView,
+    Notation,
+    SlimCube,
+)
+
+
+def run(moves: list[str], viewers: int, keyframe_interval: int, deltas: bool):
+    """
+    Broadcast the moves and return (bytes per move per viewer, publisher
+    CPU seconds per move, viewer CPU seconds per move per viewer).
+    """
+    pairs = [socket.socketpair() for _ in range(viewers)]
+    subscribers = [BroadcastSubscriber() for _ in range(viewers)]
+    publisher_seconds = 0.0
+    viewer_seconds = 0.0
+    received = 0
+
+    def fan_out(frame: bytes) -> None:
+        for sender, _ in pairs:
+            sender.sendall(frame)
+
+    def drain() -> None:
+        nonlocal viewer_seconds, received
+        started = time.process_time()
+        for (_, receiver), subscriber in zip(pairs, subscribers):
+            data = receiver.recv(1 << 16)
+            received += len(data)
+            subscriber.feed(data)
+        viewer_seconds += time.process_time() - started
+
+    publisher = BroadcastPublisher(fan_out, keyframe_interval=keyframe_interval)
+    drain()
+    cube = SlimCube()
+    for move in moves:
+        started = time.process_time()
+        if deltas:
+            cube.apply([move])
+            publisher.publish_state(cube.encode())
+        else:
+            publisher.publish_move(move)
+        publisher_seconds += time.process_time() - started
+        drain()
+
+    expected = publisher.encode()
+    assert all(subscriber.encode() == expected for subscriber in subscribers)
+    for sender, receiver in pairs:
+        sender.close()
+        receiver.close()
+    count = len(moves)
+    return (
+        received / viewers / count,
+        publisher_seconds / count,
+        viewer_seconds / viewers / count,
+    )
+
+
+def net_bytes(moves: list[str]) -> float:
+    """
+    Return the average size of the printed unfolded net after each move.
+    """
+    cube = SlimCube()
+    total = 0
+    for move in moves:
+        cube.apply([move])
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            CubeView.display_cube_state(cube.to_cube())
+        total += len(output.getvalue().encode())
+    return total / len(moves)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--viewers", type=int, default=200)
+    parser.add_argument("--moves", type=int, default=2000)
+    parser.add_argument("--keyframe-interval", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    moves = [rng.choice(Notation.moves) for _ in range(args.moves)]
+
+    print(f"full net     {net_bytes(moves[:200]):8.1f} bytes/move/viewer")
+    for name, deltas in (("move frames", False), ("delta frames", True)):
+        size, publisher_cpu, viewer_cpu = run(
+            moves, args.viewers, args.keyframe_interval, deltas
+        )
+        print(
+            f"{name:12} {size:8.1f} bytes/move/viewer, "
+            f"publisher {publisher_cpu * 1e6:6.1f} us/move, "
+            f"viewer {viewer_cpu * 1e6:6.1f} us/move"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Throughput benchmark for the sharded dataset exporter.
+
+Exports random-walk samples into a temporary directory and reports samples
+per minute.
+
+Usage:
+    python benchmarks/bench_dataset_export.py [--samples N] [--shard-size S]
+                                              [--processes P]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from rubiks_cube import DatasetExporter  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=2000000)
+    parser.add_argument("--shard-size", type=int, default=100000)
+    parser.add_argument("--walk-length", type=int, default=20)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        exporter = DatasetExporter(
+            output_dir, args.shard_size, args.walk_length, processes=args.processes
+        )
+        started = time.perf_counter()
+        paths = exporter.export(args.samples)
+        elapsed = time.perf_counter() - started
+        size = sum(path.stat().st_size for path in paths)
+    print(f"{args.samples} samples in {len(paths)} shards, {size / 1e6:.1f} MB")
+    print(f"{elapsed:.1f} s, {args.samples / elapsed * 60:,.0f} samples/min")
+
+
+if __name__ == "__main__":
+    main()
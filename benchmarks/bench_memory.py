@@ -0,0 +1,72 @@
+"""
+Memory-per-cube benchmark.
+
+Keeps many scrambled cubes alive in each representation and reports the
+bytes allocated per cube, measured with tracemalloc.
+
+Usage:
+    python benchmarks/bench_memory.py [--cubes N] [--length L] [--seed S]
+"""
+
+import argparse
+import gc
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from rubiks_cube import (  # noqa: E402
+    CompactCube,
+    Notation,
+    SlimCube,
+    StateCodec,
+)
+
+
+def measure(build, count: int) -> float:
+    """
+    Return the bytes allocated per object when count objects are kept alive.
+    """
+    gc.collect()
+    tracemalloc.start()
+    objects = [build(i) for i in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # The list holding the objects is not part of their cost.
+    current -= sys.getsizeof(objects)
+    del objects
+    return current / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cubes", type=int, default=20000)
+    parser.add_argument("--length", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    states = [SlimCube() for _ in range(args.cubes)]
+    for cube in states:
+        cube.apply([rng.choice(Notation.moves) for _ in range(args.length)])
+    encodings = [cube.encode() for cube in states]
+    del states
+
+    results = {
+        "Cube": measure(lambda i: StateCodec.decode(encodings[i]), args.cubes),
+        "SlimCube": measure(lambda i: SlimCube(encodings[i]), args.cubes),
+        "CompactCube": measure(
+            lambda i: CompactCube.from_cube(StateCodec.decode(encodings[i])),
+            args.cubes,
+        ),
+    }
+    for name, size in results.items():
+        print(f"{name:12} {size:8.0f} bytes/cube")
+    print(f"SlimCube is {results['Cube'] / results['SlimCube']:.1f}x smaller than Cube")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Scaling benchmark for the parallel IDA* solver.
+
+Solves the same scrambles with 1, 2, 4, ... worker processes (up to the
+number of CPUs, or --max-processes) and reports wall time, speedup over one
+worker and parallel efficiency.
+
+Usage:
+    python benchmarks/bench_parallel_ida.py [--max-processes N] [--length L]
+                                            [--scrambles S] [--split-depth D]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from rubiks_cube import CompactCube, Notation  # noqa: E402
+from rubiks_cube.parallel_ida_solver import ParallelIDASolver  # noqa: E402
+
+
+def random_scramble(rng: random.Random, length: int) -> list[str]:
+    """
+    Draw a scramble that never turns the same face twice in a row.
+    """
+    moves: list[str] = []
+    while len(moves) < length:
+        move = rng.choice(Notation.moves)
+        if not moves or moves[-1][0] != move[0]:
+            moves.append(move)
+    return moves
+
+
+def process_counts(max_processes: int) -> list[int]:
+    """
+    Return 1, 2, 4, ... up to max_processes, always ending with max_processes.
+    """
+    counts = []
+    count = 1
+    while count < max_processes:
+        counts.append(count)
+        count *= 2
+    counts.append(max_processes)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-processes", type=int, default=min(os.cpu_count() or 1, 32))
+    parser.add_argument("--length", type=int, default=9)
+    parser.add_argument("--scrambles", type=int, default=3)
+    parser.add_argument("--split-depth", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    states = [
+        CompactCube.apply_sequence(CompactCube.solved, random_scramble(rng, args.length))
+        for _ in range(args.scrambles)
+    ]
+
+    baseline = None
+    print(f"{'processes':>9} {'time [s]':>9} {'nodes':>11} {'speedup':>8} {'efficiency':>10}")
+    for processes in process_counts(args.max_processes):
+        with ParallelIDASolver(processes, split_depth=args.split_depth) as solver:
+            started = time.perf_counter()
+            nodes = 0
+            for state in states:
+                nodes += solver.solve_state(state).nodes
+            elapsed = time.perf_counter() - started
+        if baseline is None:
+            baseline = elapsed
+        speedup = baseline / elapsed
+        print(
+            f"{processes:9d} {elapsed:9.2f} {nodes:11d}"
+            f" {speedup:8.2f} {speedup / processes:10.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
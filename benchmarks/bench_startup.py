@@ -0,0 +1,81 @@
+"""
+Startup-time benchmark for the rubiks_cube package.
+
+Runs fresh interpreters with ``python -X importtime`` and reports the
+cumulative import time of the package, both for a bare ``import rubiks_cube``
+and for an import that touches every public class.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+SCENARIOS = {
+    "import rubiks_cube": "import rubiks_cube",
+    "import all public classes": (
+        "import rubiks_cube\n"
+        "for name in rubiks_cube.__all__:\n"
+        "    getattr(rubiks_cube, name)"
+    ),
+}
+
+
+def measure_import_time(code: str, module: str = "rubiks_cube") -> float:
+    """
+    Run code in a fresh interpreter and return the time spent importing module.
+
+    Args:
+        code: Python source to execute.
+        module: Top-level module whose cumulative import time is summed,
+                including any submodules imported later by the code.
+
+    Returns:
+        Import time in milliseconds.
+    """
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name_column = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        name = name_column.strip()
+        # Nested imports are indented and already counted by their parent.
+        is_top_level = not name_column.startswith("  ")
+        if is_top_level and (name == module or name.startswith(f"{module}.")):
+            total_us += int(cumulative)
+    return total_us / 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    for label, code in SCENARIOS.items():
+        times = [measure_import_time(code) for _ in range(args.runs)]
+        print(
+            f"{label:30} median {statistics.median(times):7.2f} ms"
+            f"   min {min(times):7.2f} ms   max {max(times):7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
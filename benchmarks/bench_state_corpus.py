@@ -0,0 +1,83 @@
+"""
+State corpus benchmark.
+
+Builds a corpus of random-walk positions with a small in-memory run size,
+so the index goes through the external merge sort, then reports build
+rate, random record access, index lookups and uniform sampling.
+
+Usage:
+    python benchmarks/bench_state_corpus.py [--states N] [--run-size R]
+                                            [--lookups L] [--seed S]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from rubiks_cube import (  # noqa: E402
+    CompactCube,
+    CorpusWriter,
+    Notation,
+    StateCorpus,
+)
+
+
+def random_walk(count: int, seed: int):
+    """
+    Yield the states along one long random walk.
+    """
+    rng = random.Random(seed)
+    state = CompactCube.solved
+    for _ in range(count):
+        state = CompactCube.apply(state, rng.choice(Notation.moves))
+        yield state
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--states", type=int, default=1000000)
+    parser.add_argument("--run-size", type=int, default=100000)
+    parser.add_argument("--lookups", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "states.rcc"
+        started = time.perf_counter()
+        with CorpusWriter(path, run_size=args.run_size) as writer:
+            writer.extend(random_walk(args.states, args.seed))
+        elapsed = time.perf_counter() - started
+        size = path.stat().st_size + StateCorpus.index_path(path).stat().st_size
+        print(
+            f"build    {args.states / elapsed:12.0f} states/s "
+            f"({size / args.states:.1f} bytes/state on disk)"
+        )
+
+        with StateCorpus(path) as corpus:
+            rng = random.Random(args.seed)
+            numbers = [rng.randrange(len(corpus)) for _ in range(args.lookups)]
+            started = time.perf_counter()
+            states = [corpus[number] for number in numbers]
+            elapsed = time.perf_counter() - started
+            print(f"access   {args.lookups / elapsed:12.0f} records/s")
+
+            started = time.perf_counter()
+            found = sum(corpus.find(state) is not None for state in states)
+            elapsed = time.perf_counter() - started
+            assert found == args.lookups
+            print(f"find     {args.lookups / elapsed:12.0f} lookups/s")
+
+            started = time.perf_counter()
+            count = sum(1 for _ in corpus.sample(10000, args.seed))
+            elapsed = time.perf_counter() - started
+            print(f"sample   {count / elapsed:12.0f} cubes/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Throughput benchmark for the CFOP step solver.
+
+Solves a corpus of random scrambles and reports cubes per second and the
+average number of moves spent in every stage.
+
+Usage:
+    python benchmarks/bench_step_solver.py [--cubes N] [--length L] [--seed S]
+                                           [--cache-dir DIR]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from rubiks_cube import CompactCube, Notation, StepSolver  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cubes", type=int, default=5000)
+    parser.add_argument("--length", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--cache-dir", type=Path, default=None, help="store the tables here"
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    solver = StepSolver(args.cache_dir)
+    print(f"tables loaded in {time.perf_counter() - started:.2f} s")
+
+    rng = random.Random(args.seed)
+    states = [
+        CompactCube.apply_sequence(
+            CompactCube.solved, [rng.choice(Notation.moves) for _ in range(args.length)]
+        )
+        for _ in range(args.cubes)
+    ]
+
+    totals: dict[str, int] = {}
+    started = time.perf_counter()
+    for state in states:
+        for stage in solver.solve_state(state):
+            name = "F2L" if stage.name.startswith("F2L") else stage.name
+            totals[name] = totals.get(name, 0) + len(stage.moves)
+    elapsed = time.perf_counter() - started
+
+    print(f"{args.cubes / elapsed:,.0f} cubes/s")
+    for name, total in totals.items():
+        print(f"{name:6} {total / args.cubes:6.2f} moves")
+    print(f"{'total':6} {sum(totals.values()) / args.cubes:6.2f} moves")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Differential fuzzing of the cube engines against Cube.rotate_face.
+
+Runs seeded random move sequences through the reference sticker cube and
+every other engine, reports moves per second per engine and prints any
+disagreement shrunk to a short failing sequence.
+
+Usage:
+    python benchmarks/fuzz_engines.py [--sequences N] [--length L]
+                                      [--seed S] [--processes P]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from rubiks_cube import EngineFuzzer, Notation  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sequences", type=int, default=100000)
+    parser.add_argument("--length", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    report = EngineFuzzer(processes=args.processes).run(
+        args.sequences, args.length, args.seed
+    )
+    elapsed = time.perf_counter() - started
+    print(
+        f"{report.sequences} sequences, {report.moves} moves per engine "
+        f"in {elapsed:.1f} s"
+    )
+    for name, rate in report.rates.items():
+        print(f"{name:10} {rate:12.0f} moves/s")
+    for mismatch in report.mismatches:
+        print(
+            f"MISMATCH {mismatch.engine}: {Notation.format(mismatch.moves)} "
+            f"(shrunk from {mismatch.original_length} moves)"
+        )
+    sys.exit(1 if report.mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,93 @@
-from .colors import FaceColors
-from .face import Face
-from .cube import Cube
-from .cube_controller import CubeController
-from .validator import Validator
-from .cube_factory import CubeFactory
-from .cube_view import CubeView
-
-
-__all__ = [
-    "FaceColors",
-    "Cube",
-    "CubeController",
-    "CubeFactory",
-    "CubeView",
-    "Validator",
-]
+"""
+Rubik's Cube simulator.
+
+Public classes are imported lazily on first attribute access, so
+``import rubiks_cube`` stays cheap for short-lived processes that only need
+a part of the package.
+"""
+
+import importlib
+
+
+_lazy_attributes = {
+    "FaceColors": ".colors",
+    "Face": ".face",
+    "Cube": ".cube",
+    "CubeController": ".cube_controller",
+    "Validator": ".validator",
+    "CubeFactory": ".cube_factory",
+    "CubeView": ".cube_view",
+    "StateCodec": ".state_codec",
+    "CubieCube": ".cubie_cube",
+    "BatchValidator": ".batch_validator",
+    "StateCache": ".state_cache",
+    "CubeLibrary": ".cube_library",
+    "LibraryRecord": ".cube_library",
+    "Notation": ".notation",
+    "CompactCube": ".compact_cube",
+    "PatternDatabase": ".heuristics",
+    "IDASolver": ".ida_solver",
+    "SolveResult": ".ida_solver",
+    "ParallelIDASolver": ".parallel_ida_solver",
+    "SubgroupIndex": ".subgroup_enumerator",
+    "DistanceDistribution": ".subgroup_enumerator",
+    "AlgorithmLibrary": ".algorithm_library",
+    "Recognition": ".algorithm_library",
+    "StepSolver": ".step_solver",
+    "Stage": ".step_solver",
+    "StateDiffer": ".state_diff",
+    "StateDiff": ".state_diff",
+    "SlimCube": ".slim_cube",
+    "EngineFuzzer": ".engine_fuzzer",
+    "FuzzReport": ".engine_fuzzer",
+    "Mismatch": ".engine_fuzzer",
+    "BitboardCube": ".bitboard_cube",
+    "CycleAnalyzer": ".cycle_analysis",
+    "CycleAnalysis": ".cycle_analysis",
+    "Cycle": ".cycle_analysis",
+    "DatasetExporter": ".dataset_exporter",
+    "SharedCubeStore": ".shared_cube_store",
+    "SharedCubeView": ".shared_cube_store",
+    "SharedFace": ".shared_cube_store",
+    "CubeRecord": ".shared_cube_store",
+    "CubeSymmetry": ".symmetry",
+    "SolutionCache": ".solution_cache",
+    "CacheStats": ".solution_cache",
+    "AnytimeSolver": ".anytime_solver",
+    "AnytimeResult": ".anytime_solver",
+    "BroadcastPublisher": ".broadcast",
+    "BroadcastSubscriber": ".broadcast",
+    "KeypressMode": ".keypress_mode",
+    "RawTerminal": ".keypress_mode",
+    "StateCorpus": ".state_corpus",
+    "CorpusWriter": ".state_corpus",
+    "Scrambler": ".scrambler",
+}
+
+# Face is importable but, as before lazy loading, not exported by "import *".
+__all__ = [name for name in _lazy_attributes if name != "Face"]
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import the module defining a public name on first access.
+
+    Args:
+        name: Attribute requested from the package.
+
+    Returns:
+        The requested class.
+
+    Raises:
+        AttributeError: If the name is not part of the package.
+    """
+    module_name = _lazy_attributes.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_lazy_attributes))
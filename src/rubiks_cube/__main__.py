@@ -1,17 +1,38 @@
 from .utils import clear_terminal
+from .algorithm_library import AlgorithmLibrary
 from .cube_controller import CubeController
 from .cube_factory import CubeFactory
 from .cube_view import CubeView
+from .keypress_mode import KeypressMode, RawTerminal
+import argparse
+import contextlib
+import io
+import sys
 
 def main():
+    parser = argparse.ArgumentParser(prog="rubiks_cube")
+    parser.add_argument(
+        "--raw",
+        action="store_true",
+        help="turn faces with single keypresses instead of prompts",
+    )
+    args = parser.parse_args()
+
     cube = CubeFactory().create_solved_cube()
     #cube = CubeFactory().create_cube_from_file("input.json")
     controller = CubeController(cube)
+    library = AlgorithmLibrary.get()
     
     cube.shuffle(1)
+    if args.raw:
+        run_raw(cube, library)
+        return
     clear_terminal()
     while True:
         CubeView.display_cube_state(cube)
+        recognition = library.recognize(cube)
+        if recognition is not None:
+            print(f"{recognition.step} {recognition.case}: {recognition.algorithm}")
         
         print(
             "Choose the main face. r - red, o - orange, g - green, b - blue, w - white, y - yellow"
@@ -34,5 +55,35 @@ def main():
             print("\nThe puzzle is solved!")
             break
 
+def run_raw(cube, library):
+    """
+    Run the single-keypress mode on the terminal.
+    """
+    if not RawTerminal.supported():
+        sys.exit("Raw mode is not supported on this platform!")
+    if not sys.stdin.isatty():
+        sys.exit("Raw mode needs an interactive terminal!")
+    legend = "  ".join(
+        f"{key}: {move}" for key, move in KeypressMode.default_keymap.items()
+    )
+
+    def render():
+        # Draw off-screen and write the frame at once, moving the cursor
+        # home instead of starting a process to clear the screen.
+        frame = io.StringIO()
+        with contextlib.redirect_stdout(frame):
+            CubeView.display_cube_state(cube)
+            recognition = library.recognize(cube)
+            if recognition is not None:
+                print(f"{recognition.step} {recognition.case}: {recognition.algorithm}")
+            print(f"{legend}  q: quit")
+        sys.stdout.write("\033[H\033[J" + frame.getvalue())
+        sys.stdout.flush()
+
+    with RawTerminal() as terminal:
+        solved = KeypressMode(cube, terminal.read_keys, render).run()
+    if solved:
+        print("\nThe puzzle is solved!")
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,311 @@
+from operator import itemgetter
+from typing import NamedTuple
+from .compact_cube import CompactCube
+from .cube import Cube
+from .notation import Notation
+from .state_codec import StateCodec
+
+
+class Recognition(NamedTuple):
+    """
+    Last-layer case found on a cube.
+
+    Attributes:
+        step: 'OLL' (orient the last layer) or 'PLL' (permute it).
+        case: Case name within the step, e.g. '27' or 'T'.
+        algorithm: The case algorithm in published notation.
+        moves: Face turns solving the step from the current position,
+               including the U turns needed before and after the algorithm.
+    """
+
+    step: str
+    case: str
+    algorithm: str
+    moves: tuple[str, ...]
+
+
+class AlgorithmLibrary:
+    """
+    Last-layer algorithms with constant-time case recognition.
+
+    The last layer is the U (white) layer; recognition applies once the
+    first two layers are solved. For every case, each position that differs
+    from it only by U turns before or after the algorithm (AUF) is
+    generated once and indexed by its last-layer stickers. Recognizing a
+    cube is then a single dictionary lookup: by which stickers show the U
+    color for OLL, and by the full sticker colors for PLL. Since centers
+    never move in this model, a y rotation of the whole cube is the same as
+    an AUF and needs no separate handling.
+
+    Use AlgorithmLibrary.get() for the shared default library.
+    """
+
+    oll_algorithms = {
+        "1": "R U2 R2 F R F' U2 R' F R F'",
+        "2": "F R U R' U' F' f R U R' U' f'",
+        "3": "f R U R' U' f' U' F R U R' U' F'",
+        "4": "f R U R' U' f' U F R U R' U' F'",
+        "5": "r' U2 R U R' U r",
+        "6": "r U2 R' U' R U' r'",
+        "7": "r U R' U R U2 r'",
+        "8": "l' U' L U' L' U2 l",
+        "9": "R U R' U' R' F R2 U R' U' F'",
+        "10": "R U R' U R' F R F' R U2 R'",
+        "11": "r U R' U R' F R F' R U2 r'",
+        "12": "M' R' U' R U' R' U2 R U' R r'",
+        "13": "F U R U' R2 F' R U R U' R'",
+        "14": "R' F R U R' F' R F U' F'",
+        "15": "r' U' r R' U' R U r' U r",
+        "16": "r U r' R U R' U' r U' r'",
+        "17": "F R' F' R2 r' U R U' R' U' M'",
+        "18": "r U R' U R U2 r2 U' R U' R' U2 r",
+        "19": "r' R U R U R' U' M' R' F R F'",
+        "20": "r U R' U' M2 U R U' R' U' M'",
+        "21": "R U2 R' U' R U R' U' R U' R'",
+        "22": "R U2 R2 U' R2 U' R2 U2 R",
+        "23": "R2 D' R U2 R' D R U2 R",
+        "24": "r U R' U' r' F R F'",
+        "25": "F' r U R' U' r' F R",
+        "26": "R U2 R' U' R U' R'",
+        "27": "R U R' U R U2 R'",
+        "28": "r U R' U' M U R U' R'",
+        "29": "R U R' U' R U' R' F' U' F R U R'",
+        "30": "F R' F R2 U' R' U' R U R' F2",
+        "31": "R' U' F U R U' R' F' R",
+        "32": "L U F' U' L' U L F L'",
+        "33": "R U R' U' R' F R F'",
+        "34": "R U R2 U' R' F R U R U' F'",
+        "35": "R U2 R2 F R F' R U2 R'",
+        "36": "L' U' L U' L' U L U L F' L' F",
+        "37": "F R' F' R U R U' R'",
+        "38": "R U R' U R U' R' U' R' F R F'",
+        "39": "L F' L' U' L U F U' L'",
+        "40": "R' F R U R' U' F' U R",
+        "41": "R U R' U R U2 R' F R U R' U' F'",
+        "42": "R' U' R U' R' U2 R F R U R' U' F'",
+        "43": "F' U' L' U L F",
+        "44": "F U R U' R' F'",
+        "45": "F R U R' U' F'",
+        "46": "R' U' R' F R F' U R",
+        "47": "R' U' R' F R F' R' F R F' U R",
+        "48": "F R U R' U' R U R' U' F'",
+        "49": "r U' r2 U r2 U r2 U' r",
+        "50": "r' U r2 U' r2 U' r2 U r'",
+        "51": "F U R U' R' U R U' R' F'",
+        "52": "R U R' U R U' B U' B' R'",
+        "53": "l' U2 L U L' U' L U L' U l",
+        "54": "r U2 R' U' R U R' U' R U' r'",
+        "55": "R' F R U R U' R2 F' R2 U' R' U R U R'",
+        "56": "r' U' r U' R' U R U' R' U R r' U r",
+        "57": "R U R' U' M' U R U' r'",
+    }
+    pll_algorithms = {
+        "Aa": "x R' U R' D2 R U' R' D2 R2 x'",
+        "Ab": "x R2 D2 R U R' D2 R U' R x'",
+        "E": "x' R U' R' D R U R' D' R U R' D R U' R' D' x",
+        "F": "R' U' F' R U R' U' R' F R2 U' R' U' R U R' U R",
+        "Ga": "R2 U R' U R' U' R U' R2 U' D R' U R D'",
+        "Gb": "R' U' R U D' R2 U R' U R U' R U' R2 D",
+        "Gc": "R2 U' R U' R U R' U R2 U D' R U' R' D",
+        "Gd": "R U R' U' D R2 U' R U' R' U R' U R2 D'",
+        "H": "M2 U M2 U2 M2 U M2",
+        "Ja": "x R2 F R F' R U2 r' U r U2 x'",
+        "Jb": "R U R' F' R U R' U' R' F R2 U' R'",
+        "Na": "R U R' U R U R' F' R U R' U' R' F R2 U' R' U2 R U' R'",
+        "Nb": "R' U R U' R' F' U' F R U R' F R' F' R U' R",
+        "Ra": "R U' R' U' R U R D R' U' R D' R' U2 R'",
+        "Rb": "R2 F R U R U' R' F' R U2 R' U2 R",
+        "T": "R U R' U' R' F R2 U' R' U' R U R' F'",
+        "Ua": "M2 U M U2 M' U M2",
+        "Ub": "M2 U' M U2 M' U' M2",
+        "V": "R' U R' U' y R' F' R2 U' R' U R' F R F",
+        "Y": "F R U' R' U' R U R' F' R U R' U' R' F R F'",
+        "Z": "M' U M2 U M2 U M' U2 M2",
+    }
+
+    _default: "AlgorithmLibrary | None" = None
+
+    def __init__(
+        self,
+        oll_algorithms: dict[str, str] | None = None,
+        pll_algorithms: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Build the recognition index.
+
+        Args:
+            oll_algorithms: Case name to algorithm for OLL. Defaults to the
+                            57 standard cases.
+            pll_algorithms: Case name to algorithm for PLL. Defaults to the
+                            21 standard cases.
+
+        Raises:
+            ValueError: If an algorithm contains an unknown move.
+        """
+        if oll_algorithms is None:
+            oll_algorithms = AlgorithmLibrary.oll_algorithms
+        if pll_algorithms is None:
+            pll_algorithms = AlgorithmLibrary.pll_algorithms
+        self._oll_index: dict[bytes, Recognition] = {}
+        self._pll_index: dict[bytes, Recognition] = {}
+        self._compact_oll_index: dict[tuple[int, ...], Recognition] = {}
+        self._compact_pll_index: dict[tuple[int, ...], Recognition] = {}
+        for case, algorithm in oll_algorithms.items():
+            moves = Notation.expand(algorithm)
+            for before in range(4):
+                state = CompactCube.apply_sequence(
+                    CompactCube.solved, Notation.invert(moves) + _auf(before)
+                )
+                key = _last_layer(StateCodec.encode(CompactCube.to_cube(state)))
+                recognition = Recognition(
+                    "OLL", case, algorithm, tuple(_auf(-before) + moves)
+                )
+                self._oll_index.setdefault(key.translate(_u_color_mask), recognition)
+                self._compact_oll_index.setdefault(_orientation(state), recognition)
+        cases = [("skip", "")] + list(pll_algorithms.items())
+        for case, algorithm in cases:
+            moves = Notation.expand(algorithm)
+            for after in range(4):
+                for before in range(4):
+                    state = CompactCube.apply_sequence(
+                        CompactCube.solved,
+                        _auf(after) + Notation.invert(moves) + _auf(before),
+                    )
+                    if state == CompactCube.solved:
+                        continue
+                    key = _last_layer(StateCodec.encode(CompactCube.to_cube(state)))
+                    recognition = Recognition(
+                        "PLL",
+                        case,
+                        algorithm,
+                        tuple(_auf(-before) + moves + _auf(-after)),
+                    )
+                    self._pll_index.setdefault(key, recognition)
+                    self._compact_pll_index.setdefault(
+                        _compact_last_layer(state), recognition
+                    )
+
+    @classmethod
+    def get(cls) -> "AlgorithmLibrary":
+        """
+        Return the shared library of standard cases, building it if needed.
+        """
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def recognize(self, cube: Cube) -> Recognition | None:
+        """
+        Find the last-layer case of a cube.
+
+        Args:
+            cube: Cube to inspect. It is not modified.
+
+        Returns:
+            The OLL case if the last layer is not oriented, otherwise the PLL
+            case; None if the first two layers are not solved or the cube is
+            solved.
+        """
+        return self.recognize_state(StateCodec.encode(cube))
+
+    def recognize_state(self, state: bytes) -> Recognition | None:
+        """
+        Find the last-layer case of a 54-byte sticker encoding.
+
+        Args:
+            state: Encoding as produced by StateCodec.encode.
+
+        Returns:
+            Same as recognize().
+        """
+        if _first_two_layers(state) != _solved_first_two_layers:
+            return None
+        last_layer = _last_layer(state)
+        orientation = last_layer.translate(_u_color_mask)
+        if orientation != _oriented:
+            return self._oll_index.get(orientation)
+        return self._pll_index.get(last_layer)
+
+    def recognize_compact(self, state: tuple[int, ...]) -> Recognition | None:
+        """
+        Find the last-layer case of a CompactCube state.
+
+        Args:
+            state: Compact state.
+
+        Returns:
+            Same as recognize().
+        """
+        solved = CompactCube.solved
+        if state[4:8] != solved[4:8] or state[12:] != solved[12:]:
+            return None
+        orientation = _orientation(state)
+        if orientation != _compact_oriented:
+            return self._compact_oll_index.get(orientation)
+        return self._compact_pll_index.get(_compact_last_layer(state))
+
+    def recognize_states(self, states: list[bytes]) -> list[Recognition | None]:
+        """
+        Recognize many sticker encodings, e.g. for analytics over a library.
+        """
+        return [self.recognize_state(state) for state in states]
+
+
+_u_code = StateCodec.face_keys.index(Notation.face_keys["U"])
+
+
+def _auf(turns: int) -> list[str]:
+    """
+    Return the U turn adjusting the last layer by a number of quarter turns.
+    """
+    return [("U", "U2", "U'")[turns % 4 - 1]] if turns % 4 else []
+
+
+def _find_last_layer_indices() -> tuple[int, ...]:
+    """
+    Find the sticker indices of the U layer without its center: the U face
+    plus the side stickers that a U turn moves.
+    """
+    center = StateCodec.center_indices[_u_code]
+    indices = set(range(_u_code * StateCodec.face_size, center)) | set(
+        range(center + 1, (_u_code + 1) * StateCodec.face_size)
+    )
+    turned = StateCodec.encode(
+        CompactCube.to_cube(CompactCube.apply(CompactCube.solved, "U"))
+    )
+    indices |= {
+        i for i, (a, b) in enumerate(zip(turned, StateCodec.solved_state)) if a != b
+    }
+    return tuple(sorted(indices))
+
+
+_last_layer_indices = _find_last_layer_indices()
+_last_layer_getter = itemgetter(*_last_layer_indices)
+_first_two_layers = itemgetter(
+    *(i for i in range(StateCodec.state_len) if i not in _last_layer_indices)
+)
+_solved_first_two_layers = _first_two_layers(StateCodec.solved_state)
+# Translation table turning last-layer sticker codes into 1 for the U color.
+_u_color_mask = bytes(int(code == _u_code) for code in range(256))
+
+
+def _last_layer(state: bytes) -> bytes:
+    return bytes(_last_layer_getter(state))
+
+
+_oriented = _last_layer(StateCodec.solved_state).translate(_u_color_mask)
+
+
+def _orientation(state: tuple[int, ...]) -> tuple[int, ...]:
+    """
+    Twists of the U corners followed by flips of the U edges.
+    """
+    corners = [value % 3 for value in state[:4]]
+    return tuple(corners + [value % 2 for value in state[8:12]])
+
+
+def _compact_last_layer(state: tuple[int, ...]) -> tuple[int, ...]:
+    return state[:4] + state[8:12]
+
+
+_compact_oriented = _orientation(CompactCube.solved)
@@ -0,0 +1,314 @@
+from collections.abc import Iterator
+from typing import NamedTuple
+from .compact_cube import CompactCube
+from .cube import Cube
+from .ida_solver import IDASolver, SolveResult
+from .notation import Notation
+from .state_codec import StateCodec
+from .step_solver import StepSolver
+from .symmetry import CubeSymmetry
+from .validator import Validator
+import multiprocessing
+import time
+
+
+class AnytimeResult(NamedTuple):
+    """
+    Best solution known at some point of an anytime solve.
+
+    Attributes:
+        moves: Move tokens that solve the cube.
+        lower_bound: Proven lower bound on the optimal solution length.
+        elapsed: Seconds since the solve started.
+        source: How the solution was found, e.g. "steps:inverse" or
+                "search:original".
+    """
+
+    moves: list[str]
+    lower_bound: int
+    elapsed: float
+    source: str
+
+    @property
+    def length(self) -> int:
+        return len(self.moves)
+
+    @property
+    def gap(self) -> int:
+        """
+        At most this many moves could be saved by an optimal solution.
+        """
+        return max(0, len(self.moves) - self.lower_bound)
+
+    @property
+    def optimal(self) -> bool:
+        return self.gap == 0
+
+
+# Per-process worker state, set up once by _init_worker.
+_worker_solver: IDASolver | None = None
+_worker_cancel_event = None
+
+
+def _init_worker(cancel_event, table_size: int) -> None:
+    """
+    Create the worker's search solver.
+    """
+    global _worker_solver, _worker_cancel_event
+    _worker_solver = IDASolver(table_size=table_size)
+    _worker_solver.check_interval = AnytimeSolver.check_interval
+    _worker_cancel_event = cancel_event
+
+
+def _search_variant(
+    task: tuple[str, tuple[int, ...], int, float],
+) -> tuple[str, SolveResult]:
+    """
+    Search one variant of the state for a solution shorter than the best.
+
+    Args:
+        task: Variant name, its compact state, maximum depth and the
+              deadline as a time.time() value.
+    """
+    name, state, max_depth, deadline = task
+    if _worker_cancel_event.is_set():
+        return name, SolveResult(None, "cancelled", 0, 0.0, 0)
+    result = _worker_solver.solve_state(
+        state, max_depth, max(0.0, deadline - time.time()), _worker_cancel_event
+    )
+    return name, result
+
+
+class AnytimeSolver:
+    """
+    Solver that trades solve time for solution length.
+
+    A solution is found at once with the table-driven StepSolver, tried on
+    the state, its inverse and its symmetry conjugates while time allows,
+    keeping the shortest. The remaining time goes to an optimal IDA* search
+    for anything shorter; with several processes the original, inverse and
+    a conjugate state are searched in a race, since the pattern databases
+    prune them differently, and the first search to finish decides. Every
+    result carries a proven lower bound, so callers know how far from
+    optimal the answer can be.
+
+    With processes > 1 the solver owns a pool; use it as a context manager
+    or call close().
+    """
+
+    # Conjugate raced against the original and the inverse state: the
+    # rotation taking the U-D axis to the F-B axis.
+    race_symmetry = 1
+    # Search calls between deadline checks, under a millisecond apart, so
+    # budgets of tens of milliseconds are kept.
+    check_interval = 64
+
+    def __init__(
+        self,
+        step_solver: StepSolver | None = None,
+        processes: int = 1,
+        table_size: int = 1 << 18,
+    ) -> None:
+        """
+        Initialize the solver.
+
+        Args:
+            step_solver: Solver for the first solutions. Defaults to a new
+                         StepSolver.
+            processes: Number of search processes; 1 searches the original
+                       state in the calling process.
+            table_size: Transposition table slots per search.
+        """
+        self.step_solver = step_solver if step_solver is not None else StepSolver()
+        self.solver = IDASolver(table_size=table_size)
+        self.solver.check_interval = AnytimeSolver.check_interval
+        self.processes = processes
+        self._pool = None
+        if processes > 1:
+            self._cancel_event = multiprocessing.Event()
+            self._pool = multiprocessing.Pool(
+                processes,
+                initializer=_init_worker,
+                initargs=(self._cancel_event, table_size),
+            )
+
+    def __enter__(self) -> "AnytimeSolver":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stop the search processes.
+        """
+        if self._pool is None:
+            return
+        self._pool.terminate()
+        self._pool.join()
+        self._pool = None
+
+    def solve(self, cube: Cube, time_limit: float) -> AnytimeResult:
+        """
+        Return the best solution of a sticker Cube found within a time limit.
+
+        Raises:
+            ValueError: If the cube is not solvable.
+        """
+        Validator.validate_state(StateCodec.encode(cube))
+        return self.solve_state(CompactCube.from_cube(cube), time_limit)
+
+    def solve_state(self, state: tuple[int, ...], time_limit: float) -> AnytimeResult:
+        """
+        Return the best solution of a compact state found within a time
+        limit.
+
+        Args:
+            state: CompactCube state, assumed solvable.
+            time_limit: Seconds to spend. The first solution is always
+                        returned, even if finding it takes longer.
+
+        Returns:
+            The last result of improve().
+        """
+        result = None
+        for result in self.improve(state, time_limit):
+            pass
+        return result
+
+    def improve(
+        self, state: tuple[int, ...], time_limit: float
+    ) -> Iterator[AnytimeResult]:
+        """
+        Yield better and better results until the time limit or optimality.
+
+        Every result is shorter than the previous one or has a higher lower
+        bound.
+
+        Args:
+            state: CompactCube state, assumed solvable.
+            time_limit: Seconds to spend.
+        """
+        started = time.perf_counter()
+        deadline = started + time_limit
+        lower_bound = self.solver.heuristic(state)
+        if state == CompactCube.solved:
+            yield AnytimeResult([], 0, time.perf_counter() - started, "solved")
+            return
+
+        best = None
+        for name, variant, restore in AnytimeSolver._variants(state):
+            stages = self.step_solver.solve_state(variant)
+            moves = Notation.simplify(
+                restore([move for stage in stages for move in stage.moves])
+            )
+            if best is None or len(moves) < len(best.moves):
+                best = AnytimeResult(
+                    moves, lower_bound, time.perf_counter() - started, f"steps:{name}"
+                )
+                yield best
+            if best.optimal or time.perf_counter() >= deadline:
+                return
+
+        if self._pool is None:
+            searches = [
+                (
+                    "original",
+                    self.solver.solve_state(
+                        state,
+                        len(best.moves) - 1,
+                        max(0.0, deadline - time.perf_counter()),
+                    ),
+                )
+            ]
+        else:
+            searches = self._race(
+                state, len(best.moves) - 1, deadline - time.perf_counter()
+            )
+        for name, result in searches:
+            lower_bound = max(lower_bound, result.lower_bound)
+            if result.status == "solved":
+                moves = AnytimeSolver._restore(name, result.moves)
+                yield AnytimeResult(
+                    moves, len(moves), time.perf_counter() - started, f"search:{name}"
+                )
+                return
+            if result.status == "exhausted":
+                # Nothing shorter than the best solution exists.
+                lower_bound = len(best.moves)
+        if lower_bound > best.lower_bound:
+            yield best._replace(
+                lower_bound=lower_bound, elapsed=time.perf_counter() - started
+            )
+
+    def _race(
+        self, state: tuple[int, ...], max_depth: int, time_limit: float
+    ) -> list[tuple[str, SolveResult]]:
+        """
+        Search the original, inverse and conjugate states in the pool.
+
+        Returns:
+            The (variant name, SolveResult) pairs, the deciding one last.
+        """
+        deadline = time.time() + time_limit
+        tasks = [
+            ("original", state, max_depth, deadline),
+            ("inverse", CompactCube.inverse(state), max_depth, deadline),
+            (
+                "conjugate",
+                CubeSymmetry.conjugate(state, AnytimeSolver.race_symmetry),
+                max_depth,
+                deadline,
+            ),
+        ]
+        self._cancel_event.clear()
+        results = []
+        decided = None
+        for name, result in self._pool.imap_unordered(_search_variant, tasks):
+            if decided is None and result.status in ("solved", "exhausted"):
+                decided = (name, result)
+                self._cancel_event.set()
+            else:
+                results.append((name, result))
+        self._cancel_event.set()
+        if decided is not None:
+            results.append(decided)
+        return results
+
+    @staticmethod
+    def _variants(state: tuple[int, ...]):
+        """
+        Yield (name, state, restore) for the state, its inverse and their
+        conjugates, where restore turns a solution of the variant into one
+        of the original state.
+        """
+        inverse = CompactCube.inverse(state)
+        yield "original", state, lambda moves: moves
+        yield "inverse", inverse, Notation.invert
+        for symmetry in range(1, CubeSymmetry.count):
+            back = CubeSymmetry.inverse(symmetry)
+            yield (
+                f"conjugate {symmetry}",
+                CubeSymmetry.conjugate(state, symmetry),
+                lambda moves, back=back: CubeSymmetry.relabel(moves, back),
+            )
+            yield (
+                f"inverse conjugate {symmetry}",
+                CubeSymmetry.conjugate(inverse, symmetry),
+                lambda moves, back=back: Notation.invert(
+                    CubeSymmetry.relabel(moves, back)
+                ),
+            )
+
+    @staticmethod
+    def _restore(name: str, moves: list[str]) -> list[str]:
+        """
+        Turn a search solution of a raced variant into one of the state.
+        """
+        if name == "inverse":
+            return Notation.invert(moves)
+        if name == "conjugate":
+            return CubeSymmetry.relabel(
+                moves, CubeSymmetry.inverse(AnytimeSolver.race_symmetry)
+            )
+        return moves
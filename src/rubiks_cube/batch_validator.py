@@ -0,0 +1,289 @@
+from collections.abc import Iterable
+from itertools import combinations
+from .cubie_cube import CubieCube
+from .state_codec import StateCodec
+from .validator import Validator
+
+
+class BatchValidator:
+    """
+    Validates many encoded cube states in a single pass.
+
+    Where Validator raises on the first problem, the batch path returns one
+    result per record: None for a valid state, or the message Validator would
+    have raised for it. Every rule runs column by column over the whole
+    packed buffer: the same sticker of all records is one strided slice, and
+    a column is read as one big integer with a byte per record, so adding
+    weighted columns combines stickers of all records at once (the digits
+    never carry) and bytes.translate looks the results up in tables. Pieces,
+    twists, flips, duplicates and permutation parity are all checked that
+    way. Only records that fail are passed to Validator, to get its exact
+    message, so both paths always agree.
+    """
+
+    # Maps every byte to 0 if it is a valid color code and to 1 otherwise.
+    _invalid_code_table = bytes(0 if code < 6 else 1 for code in range(256))
+
+    @staticmethod
+    def validate_states(states: bytes | Iterable[bytes]) -> list[str | None]:
+        """
+        Validate a batch of sticker encodings.
+
+        Args:
+            states: Either one buffer of concatenated 54-byte records or an
+                    iterable of individual records.
+
+        Returns:
+            A list with one entry per record: None if the record is valid,
+            otherwise the reason it was rejected.
+
+        Raises:
+            ValueError: If a concatenated buffer is not a whole number of records.
+        """
+        buffer, reasons = BatchValidator._pack(states)
+        record_len = StateCodec.state_len
+        suspects = BatchValidator._find_invalid_codes(buffer)
+        suspects |= BatchValidator._find_invalid_centers(buffer, len(reasons))
+        suspects |= BatchValidator._find_invalid_pieces(buffer, len(reasons))
+
+        for index in sorted(suspects):
+            if reasons[index] is not None:
+                continue
+            try:
+                Validator.validate_state(
+                    buffer[index * record_len : (index + 1) * record_len]
+                )
+            except ValueError as error:
+                reasons[index] = str(error)
+        return reasons
+
+    @staticmethod
+    def _pack(states: bytes | Iterable[bytes]) -> tuple[bytes, list[str | None]]:
+        """
+        Pack records into one contiguous buffer.
+
+        Records of the wrong length are rejected right away and replaced by
+        the solved state in the buffer so they do not disturb later checks.
+
+        Args:
+            states: Concatenated buffer or iterable of records.
+
+        Returns:
+            The packed buffer and the initial list of reasons.
+        """
+        record_len = StateCodec.state_len
+        if isinstance(states, (bytes, bytearray, memoryview)):
+            buffer = bytes(states)
+            if len(buffer) % record_len != 0:
+                raise ValueError("Batch buffer length must be a multiple of 54!")
+            return buffer, [None] * (len(buffer) // record_len)
+
+        records = []
+        reasons = []
+        for state in states:
+            try:
+                Validator._validate_state_length(state)
+            except ValueError as error:
+                records.append(StateCodec.solved_state)
+                reasons.append(str(error))
+            else:
+                records.append(bytes(state))
+                reasons.append(None)
+        return b"".join(records), reasons
+
+    @staticmethod
+    def _find_invalid_codes(buffer: bytes) -> set[int]:
+        """
+        Find the records containing a byte outside the color codes.
+
+        Args:
+            buffer: Packed records.
+
+        Returns:
+            Indices of the offending records.
+        """
+        record_len = StateCodec.state_len
+        flags = buffer.translate(BatchValidator._invalid_code_table)
+        suspects = set()
+        position = flags.find(1)
+        while position != -1:
+            index = position // record_len
+            suspects.add(index)
+            position = flags.find(1, (index + 1) * record_len)
+        return suspects
+
+    @staticmethod
+    def _find_invalid_centers(buffer: bytes, count: int) -> set[int]:
+        """
+        Find the records whose centers do not match their faces.
+
+        Args:
+            buffer: Packed records.
+            count: Number of records in the buffer.
+
+        Returns:
+            Indices of the offending records.
+        """
+        suspects = set()
+        for code, index in enumerate(StateCodec.center_indices):
+            centers = buffer[index :: StateCodec.state_len]
+            if centers == bytes((code,)) * count:
+                continue
+            suspects.update(
+                record_index
+                for record_index, center in enumerate(centers)
+                if center != code
+            )
+        return suspects
+
+    @staticmethod
+    def _find_invalid_pieces(buffer: bytes, count: int) -> set[int]:
+        """
+        Find the records whose pieces cannot come from a solved cube.
+
+        A record is flagged if a corner or edge matches no real piece, a
+        piece appears other than once, the twists or flips do not cancel
+        out, or the corner and edge permutations differ in parity.
+
+        Args:
+            buffer: Packed records.
+            count: Number of records in the buffer.
+
+        Returns:
+            Indices of the offending records.
+        """
+        if count == 0:
+            return set()
+        # Invalid codes are flagged elsewhere; clamp them so that no digit
+        # can carry into the neighboring record.
+        buffer = buffer.translate(_clamp_table)
+        record_len = StateCodec.state_len
+        flags = []
+        inversions = 0
+        for facelets, value_table, radix, pieces in (
+            (CubieCube.corner_facelets, _corner_values, 3, 8),
+            (CubieCube.edge_facelets, _edge_values, 2, 12),
+        ):
+            # The colors of each piece as one code, looked up as
+            # piece * radix + orientation.
+            values = [
+                _combine(
+                    [buffer[index::record_len] for index in positions],
+                    [6**power for power in range(radix - 1, -1, -1)],
+                    count,
+                ).translate(value_table)
+                for positions in facelets
+            ]
+            # Unrecognized pieces map to the value 255.
+            flags.extend(value.translate(_unknown_table) for value in values)
+            piece_columns = [value.translate(_piece_tables[radix]) for value in values]
+            for piece in range(pieces):
+                one_hot = _one_hot_tables[piece]
+                occurrences = _combine(
+                    [column.translate(one_hot) for column in piece_columns],
+                    [1] * pieces,
+                    count,
+                )
+                flags.append(occurrences.translate(_not_one_table))
+            orientation = _combine(
+                [value.translate(_orientation_tables[radix]) for value in values],
+                [1] * pieces,
+                count,
+            )
+            flags.append(orientation.translate(_remainder_tables[radix]))
+            for first, second in combinations(piece_columns, 2):
+                pair = _combine([first, second], [16, 1], count)
+                inversions += int.from_bytes(pair.translate(_inversion_table), "big")
+        # Corner and edge inversion counts add up to an odd number exactly
+        # when their parities differ.
+        flags.append(
+            inversions.to_bytes(count, "big").translate(_remainder_tables[2])
+        )
+
+        flagged = _combine(flags, [1] * len(flags), count).translate(_nonzero_table)
+        suspects = set()
+        position = flagged.find(1)
+        while position != -1:
+            suspects.add(position)
+            position = flagged.find(1, position + 1)
+        return suspects
+
+
+def _combine(columns: list[bytes], weights: list[int], count: int) -> bytes:
+    """
+    Add weighted columns record by record.
+
+    Each column holds one byte per record. Read as big integers, the columns
+    add digit by digit, so the weighted sum of every record lands in its own
+    byte as long as it stays below 256.
+    """
+    total = 0
+    for column, weight in zip(columns, weights):
+        total += int.from_bytes(column, "big") * weight
+    return total.to_bytes(count, "big")
+
+
+def _table(function) -> bytes:
+    """
+    Tabulate a function of a byte for bytes.translate.
+    """
+    return bytes(function(value) for value in range(256))
+
+
+def _corner_value(code: int) -> int:
+    """
+    Identify the corner with the colors (a, b, c) given as a*36 + b*6 + c,
+    the same way CubieCube.from_facelets does.
+
+    Returns:
+        piece * 3 + twist, or 255 if no real corner has these colors.
+    """
+    if code >= 216:
+        return 255
+    colors = (code // 36, code // 6 % 6, code % 6)
+    for twist in range(3):
+        if colors[twist] in CubieCube._up_down_colors:
+            break
+    else:
+        return 255
+    piece = CubieCube._corner_lookup.get(
+        (colors[(twist + 1) % 3], colors[(twist + 2) % 3])
+    )
+    if piece is None or CubieCube.corner_colors[piece][0] != colors[twist]:
+        return 255
+    return piece * 3 + twist
+
+
+def _edge_value(code: int) -> int:
+    """
+    Identify the edge with the colors (a, b) given as a*6 + b.
+
+    Returns:
+        piece * 2 + flip, or 255 if no real edge has these colors.
+    """
+    found = CubieCube._edge_lookup.get((code // 6, code % 6)) if code < 36 else None
+    return 255 if found is None else found[0] * 2 + found[1]
+
+
+_clamp_table = _table(lambda code: code if code < 6 else 0)
+_corner_values = _table(_corner_value)
+_edge_values = _table(_edge_value)
+_unknown_table = _table(lambda value: 1 if value == 255 else 0)
+_piece_tables = {
+    radix: _table(lambda value, radix=radix: value // radix if value != 255 else 0)
+    for radix in (2, 3)
+}
+_orientation_tables = {
+    radix: _table(lambda value, radix=radix: value % radix if value != 255 else 0)
+    for radix in (2, 3)
+}
+_one_hot_tables = [
+    _table(lambda value, piece=piece: 1 if value == piece else 0) for piece in range(12)
+]
+_not_one_table = _table(lambda value: 0 if value == 1 else 1)
+_remainder_tables = {
+    radix: _table(lambda value, radix=radix: value % radix) for radix in (2, 3)
+}
+_nonzero_table = _table(lambda value: 1 if value else 0)
+# Pair of pieces (first, second) given as first * 16 + second: 1 if inverted.
+_inversion_table = _table(lambda value: 1 if value >> 4 > value & 15 else 0)
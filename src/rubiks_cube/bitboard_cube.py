@@ -0,0 +1,244 @@
+from .colors import FaceColors
+from .cube import Cube
+from .face import Face
+from .move_tables import sticker_permutations
+from .notation import Notation
+from .state_codec import StateCodec
+
+
+class BitboardCube:
+    """
+    Sticker cube with every face packed into one integer.
+
+    The eight non-center stickers of a face are stored 3 bits each, as the
+    color code of StateCodec, in clockwise ring order starting at the top
+    left corner: (0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 1), (2, 0),
+    (1, 0). Centers never move and are not stored. Turning a face rotates
+    its 24-bit ring by 6 bits, and the stickers carried over from the
+    neighbors are moved as masked rotations of their rings, so a turn is a
+    handful of integer operations with no per-turn branching.
+    """
+
+    __slots__ = ("_faces",)
+
+    ring_bits = 24
+    ring_mask = (1 << ring_bits) - 1
+    ring_cells = ((0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 1), (2, 0), (1, 0))
+
+    def __init__(self, faces: list[int] | None = None) -> None:
+        """
+        Initialize the cube from packed face rings.
+
+        Args:
+            faces: Six rings in StateCodec face order. Defaults to the
+                   solved cube.
+        """
+        self._faces = list(faces) if faces is not None else list(_solved_faces)
+
+    @staticmethod
+    def from_state(state: bytes) -> "BitboardCube":
+        """
+        Build a cube from a 54-byte sticker encoding.
+
+        Raises:
+            ValueError: If the state has the wrong length.
+        """
+        if len(state) != StateCodec.state_len:
+            raise ValueError("Cube state must contain 54 stickers!")
+        faces = []
+        for base in range(0, StateCodec.state_len, StateCodec.face_size):
+            ring = 0
+            for slot, offset in enumerate(_ring_offsets):
+                ring |= state[base + offset] << (3 * slot)
+            faces.append(ring)
+        return BitboardCube(faces)
+
+    def encode(self) -> bytes:
+        """
+        Return the 54-byte sticker encoding of this cube.
+        """
+        state = bytearray(StateCodec.solved_state)
+        for number, ring in enumerate(self._faces):
+            base = number * StateCodec.face_size
+            for slot, offset in enumerate(_ring_offsets):
+                state[base + offset] = (ring >> (3 * slot)) & 7
+        return bytes(state)
+
+    @staticmethod
+    def from_faces(faces: list[Face]) -> "BitboardCube":
+        """
+        Build a cube from six Face objects in StateCodec face order.
+        """
+        codes = StateCodec._color_codes
+        rings = []
+        for face in faces:
+            ring = 0
+            for slot, (row, col) in enumerate(BitboardCube.ring_cells):
+                ring |= codes[face._matrix[row][col]] << (3 * slot)
+            rings.append(ring)
+        return BitboardCube(rings)
+
+    def to_faces(self) -> list[Face]:
+        """
+        Build six new Face objects in StateCodec face order.
+        """
+        return [Face(self.get_face_matrix(key)) for key in StateCodec.face_keys]
+
+    @staticmethod
+    def from_cube(cube: Cube) -> "BitboardCube":
+        """
+        Build a cube with the sticker colors of a Cube.
+        """
+        return BitboardCube.from_faces(list(cube._faces_dict.values()))
+
+    def to_cube(self) -> Cube:
+        """
+        Build a new Cube with the sticker colors of this cube.
+        """
+        return Cube(self.to_faces())
+
+    def copy(self) -> "BitboardCube":
+        """
+        Return an independent copy of this cube.
+        """
+        return BitboardCube(self._faces)
+
+    def key(self) -> int:
+        """
+        Return the whole state packed into one integer, e.g. as a dict key.
+        """
+        key = 0
+        for ring in reversed(self._faces):
+            key = (key << BitboardCube.ring_bits) | ring
+        return key
+
+    def rotate(self, face_key: str, clockwise: bool) -> None:
+        """
+        Rotate a face and its neighbors, like Cube.rotate_face.
+
+        Args:
+            face_key: One of 'r', 'o', 'g', 'b', 'w', 'y'.
+            clockwise: True for clockwise, False for counter-clockwise.
+        """
+        _turn(self._faces, _rotation_ops[face_key, clockwise])
+
+    def apply(self, moves: list[str]) -> None:
+        """
+        Apply a move sequence in-place.
+
+        Args:
+            moves: Move tokens, e.g. Notation.parse("R U2 D'").
+        """
+        faces = self._faces
+        for move in moves:
+            _turn(faces, _move_ops[move])
+
+    def is_solved(self) -> bool:
+        """
+        Check if every sticker shows the color of its face.
+        """
+        return self._faces == _solved_faces
+
+    def get_face_matrix(self, face_key: str) -> list[list[FaceColors]]:
+        """
+        Return the colors of one face as a new matrix.
+
+        Args:
+            face_key: One of 'r', 'o', 'g', 'b', 'w', 'y'.
+
+        Returns:
+            3x3 list of FaceColors, as Face.get_face_matrix returns it.
+        """
+        colors = StateCodec.colors
+        number = StateCodec._key_codes[face_key]
+        ring = self._faces[number]
+        matrix = [[colors[number]] * Face.edge_len for _ in range(Face.edge_len)]
+        for slot, (row, col) in enumerate(BitboardCube.ring_cells):
+            matrix[row][col] = colors[(ring >> (3 * slot)) & 7]
+        return matrix
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitboardCube):
+            return NotImplemented
+        return self._faces == other._faces
+
+    __hash__ = None
+
+
+_ring_offsets = tuple(row * Face.edge_len + col for row, col in BitboardCube.ring_cells)
+_solved_faces = [
+    sum(code << (3 * slot) for slot in range(len(_ring_offsets)))
+    for code in range(len(StateCodec.face_keys))
+]
+
+
+def _turn(faces: list[int], ops) -> None:
+    """
+    Apply the precomputed operations of one move to the face rings.
+    """
+    keeps, moves = ops
+    ring_mask = BitboardCube.ring_mask
+    old = faces[:]
+    for face, keep in keeps:
+        faces[face] &= keep
+    for source, target, mask, left, right in moves:
+        bits = old[source] & mask
+        faces[target] |= ((bits << left) | (bits >> right)) & ring_mask
+
+
+def _build_ops(permutation: tuple[int, ...]):
+    """
+    Translate a sticker permutation into ring operations.
+
+    Stickers that move from one face to another (or within a face) by the
+    same number of ring slots are moved together by one masked rotation.
+
+    Returns:
+        (keeps, moves): for every changed face the mask of the bits that
+        stay, and (source face, target face, source mask, left shift, right
+        shift) for every group of moving stickers, the two shifts making up
+        one rotation of the ring.
+    """
+    slots = {offset: slot for slot, offset in enumerate(_ring_offsets)}
+    keeps: dict[int, int] = {}
+    moves: dict[tuple[int, int, int], int] = {}
+    for target, source in enumerate(permutation):
+        if target == source:
+            continue
+        target_face, target_offset = divmod(target, StateCodec.face_size)
+        source_face, source_offset = divmod(source, StateCodec.face_size)
+        target_slot = slots[target_offset]
+        source_slot = slots[source_offset]
+        shift = 3 * ((target_slot - source_slot) % len(_ring_offsets))
+        keeps[target_face] = keeps.get(target_face, 0) | (7 << (3 * target_slot))
+        group = (source_face, target_face, shift)
+        moves[group] = moves.get(group, 0) | (7 << (3 * source_slot))
+    return (
+        tuple((face, BitboardCube.ring_mask ^ bits) for face, bits in keeps.items()),
+        tuple(
+            (source, target, mask, shift, BitboardCube.ring_bits - shift)
+            for (source, target, shift), mask in moves.items()
+        ),
+    )
+
+
+def _build_move_ops():
+    """
+    Compose the quarter-turn permutations of every move token into ring
+    operations, so half turns cost one step too.
+    """
+    ops = {}
+    for move in Notation.moves:
+        permutation = tuple(range(StateCodec.state_len))
+        for rotation in Notation.to_rotations(move):
+            step = sticker_permutations[rotation]
+            permutation = tuple(permutation[index] for index in step)
+        ops[move] = _build_ops(permutation)
+    return ops
+
+
+_rotation_ops = {
+    rotation: _build_ops(permutation)
+    for rotation, permutation in sticker_permutations.items()
+}
+_move_ops = _build_move_ops()
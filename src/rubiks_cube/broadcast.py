@@ -0,0 +1,298 @@
+from collections.abc import Callable
+from .cube import Cube
+from .notation import Notation
+from .slim_cube import SlimCube
+from .state_codec import StateCodec
+import struct
+
+
+# Frame header: frame type and sequence number.
+_header = struct.Struct("<BI")
+_bitmap_len = (StateCodec.state_len + 7) // 8
+_move_codes = {move: code for code, move in enumerate(Notation.moves)}
+
+
+class BroadcastPublisher:
+    """
+    Publishes a cube as a stream of small binary frames for spectators.
+
+    Every frame starts with its type and a sequence number. A move frame
+    carries the index of one face turn in Notation.moves (6 bytes); any
+    other change is sent as a delta frame with a bitmap of the stickers
+    that differ from the previous frame followed by their new color codes.
+    Every keyframe_interval frames, and whenever keyframe() is called, the
+    full 54-byte state is sent instead, so spectators joining late or
+    losing frames resynchronize. Frames are self-delimiting and can be
+    sent as datagrams or concatenated on a byte stream.
+    """
+
+    keyframe_type = 0
+    move_type = 1
+    delta_type = 2
+
+    def __init__(
+        self,
+        send: Callable[[bytes], object],
+        state: bytes = StateCodec.solved_state,
+        keyframe_interval: int = 64,
+    ) -> None:
+        """
+        Initialize the publisher and send the first keyframe.
+
+        Args:
+            send: Called with every frame, e.g. the sendall of a socket or a
+                  fan-out to many viewers.
+            state: 54-byte sticker encoding of the starting cube.
+            keyframe_interval: Frames between keyframes.
+
+        Raises:
+            ValueError: If the state has the wrong length or the interval
+                        is not positive.
+        """
+        if len(state) != StateCodec.state_len:
+            raise ValueError("Cube state must contain 54 stickers!")
+        if keyframe_interval < 1:
+            raise ValueError("Keyframe interval must be positive!")
+        self.send = send
+        self.keyframe_interval = keyframe_interval
+        self._stickers = bytearray(state)
+        self._sequence = 0
+        self._since_keyframe = 0
+        self.bytes_sent = 0
+        self.keyframe()
+
+    def encode(self) -> bytes:
+        """
+        Return the 54-byte sticker encoding of the published cube.
+        """
+        return bytes(self._stickers)
+
+    def publish_move(self, move: str) -> bytes:
+        """
+        Turn the cube and publish the move.
+
+        Args:
+            move: One of Notation.moves.
+
+        Returns:
+            The frame sent.
+
+        Raises:
+            ValueError: If the move is unknown.
+        """
+        code = _move_codes.get(move)
+        if code is None:
+            raise ValueError(f"Unknown move: {move}!")
+        self._stickers[:] = SlimCube.move_getters[move](self._stickers)
+        if self._keyframe_due():
+            return self.keyframe()
+        return self._send(BroadcastPublisher.move_type, bytes((code,)))
+
+    def publish_state(self, state: bytes) -> bytes:
+        """
+        Publish an arbitrary new state as the stickers that changed.
+
+        Args:
+            state: 54-byte sticker encoding.
+
+        Returns:
+            The frame sent.
+
+        Raises:
+            ValueError: If the state has the wrong length.
+        """
+        if len(state) != StateCodec.state_len:
+            raise ValueError("Cube state must contain 54 stickers!")
+        previous = self._stickers
+        self._stickers = bytearray(state)
+        if self._keyframe_due():
+            return self.keyframe()
+        bitmap = 0
+        changed = bytearray()
+        for index, (old, new) in enumerate(zip(previous, state)):
+            if old != new:
+                bitmap |= 1 << index
+                changed.append(new)
+        return self._send(
+            BroadcastPublisher.delta_type,
+            bitmap.to_bytes(_bitmap_len, "little") + changed,
+        )
+
+    def publish_cube(self, cube: Cube) -> bytes:
+        """
+        Publish the state of a sticker Cube, see publish_state().
+        """
+        return self.publish_state(StateCodec.encode(cube))
+
+    def keyframe(self) -> bytes:
+        """
+        Send the full state now, e.g. when spectators join.
+
+        Returns:
+            The frame sent.
+        """
+        self._since_keyframe = 0
+        return self._send(BroadcastPublisher.keyframe_type, bytes(self._stickers))
+
+    def _keyframe_due(self) -> bool:
+        self._since_keyframe += 1
+        return self._since_keyframe >= self.keyframe_interval
+
+    def _send(self, frame_type: int, payload: bytes) -> bytes:
+        frame = _header.pack(frame_type, self._sequence) + payload
+        self._sequence = (self._sequence + 1) & 0xFFFFFFFF
+        self.send(frame)
+        self.bytes_sent += len(frame)
+        return frame
+
+
+class BroadcastSubscriber:
+    """
+    Rebuilds the published cube from the frames of a BroadcastPublisher.
+
+    The subscriber waits for a keyframe before it has a state. If a frame
+    is missing, which shows as a gap in the sequence numbers, it ignores
+    moves and deltas until the next keyframe instead of showing a wrong
+    cube.
+    """
+
+    def __init__(self) -> None:
+        self._stickers: bytearray | None = None
+        self._expected: int | None = None
+        self._buffer = bytearray()
+        self.frames = 0
+        self.skipped = 0
+
+    @property
+    def synced(self) -> bool:
+        """
+        Whether the subscriber holds the published state.
+        """
+        return self._stickers is not None
+
+    def feed(self, data: bytes) -> int:
+        """
+        Apply all complete frames of a chunk of a byte stream.
+
+        Incomplete trailing bytes are kept until the next chunk arrives.
+        Frames received before an error are consumed, so they are not
+        applied again by the next call. If the frame boundaries are lost,
+        the buffered bytes are dropped and the subscriber waits for the
+        next keyframe.
+
+        Args:
+            data: Bytes received from the stream.
+
+        Returns:
+            Number of complete frames received.
+
+        Raises:
+            ValueError: If the stream contains an unknown frame type or move.
+        """
+        buffer = self._buffer
+        buffer += data
+        offset = 0
+        count = 0
+        try:
+            while True:
+                try:
+                    length = BroadcastSubscriber._frame_length(buffer, offset)
+                except ValueError:
+                    offset = len(buffer)
+                    self._stickers = None
+                    raise
+                if length is None or offset + length > len(buffer):
+                    break
+                frame = bytes(buffer[offset : offset + length])
+                offset += length
+                count += 1
+                self.receive(frame)
+        finally:
+            del buffer[:offset]
+        return count
+
+    def receive(self, frame: bytes) -> None:
+        """
+        Apply one frame.
+
+        Raises:
+            ValueError: If the frame is truncated or malformed, or its type
+                        or move is unknown; the subscriber then waits for
+                        the next keyframe.
+        """
+        if len(frame) < _header.size:
+            self._stickers = None
+            raise ValueError("Frame is shorter than its header!")
+        frame_type, sequence = _header.unpack_from(frame)
+        payload = frame[_header.size :]
+        self.frames += 1
+        if sequence != self._expected:
+            self._stickers = None
+        self._expected = (sequence + 1) & 0xFFFFFFFF
+        try:
+            length = BroadcastSubscriber._frame_length(frame, 0)
+        except ValueError:
+            self._stickers = None
+            raise
+        if length != len(frame):
+            self._stickers = None
+            raise ValueError(f"Frame has {len(frame)} bytes, expected {length}!")
+        if frame_type == BroadcastPublisher.keyframe_type:
+            self._stickers = bytearray(payload)
+        elif self._stickers is None:
+            self.skipped += 1
+        elif frame_type == BroadcastPublisher.move_type:
+            if payload[0] >= len(Notation.moves):
+                self._stickers = None
+                raise ValueError(f"Unknown move code: {payload[0]}!")
+            move = Notation.moves[payload[0]]
+            self._stickers[:] = SlimCube.move_getters[move](self._stickers)
+        else:
+            bitmap = int.from_bytes(payload[:_bitmap_len], "little")
+            colors = iter(payload[_bitmap_len:])
+            stickers = self._stickers
+            while bitmap:
+                low = bitmap & -bitmap
+                stickers[low.bit_length() - 1] = next(colors)
+                bitmap ^= low
+
+    def encode(self) -> bytes | None:
+        """
+        Return the 54-byte sticker encoding, or None while not synced.
+        """
+        return bytes(self._stickers) if self._stickers is not None else None
+
+    def to_cube(self) -> Cube | None:
+        """
+        Build a new Cube with the current state, or None while not synced.
+        """
+        state = self.encode()
+        return StateCodec.decode(state) if state is not None else None
+
+    @staticmethod
+    def _frame_length(buffer: bytes | bytearray, offset: int) -> int | None:
+        """
+        Return the length of the frame starting at offset, or None if its
+        header is not complete yet.
+
+        Raises:
+            ValueError: If the frame type is unknown or a delta bitmap marks
+                        stickers beyond the cube.
+        """
+        available = len(buffer) - offset
+        if available < _header.size:
+            return None
+        frame_type = buffer[offset]
+        if frame_type == BroadcastPublisher.keyframe_type:
+            return _header.size + StateCodec.state_len
+        if frame_type == BroadcastPublisher.move_type:
+            return _header.size + 1
+        if frame_type == BroadcastPublisher.delta_type:
+            if available < _header.size + _bitmap_len:
+                return None
+            start = offset + _header.size
+            bitmap = int.from_bytes(buffer[start : start + _bitmap_len], "little")
+            if bitmap >> StateCodec.state_len:
+                raise ValueError("Delta bitmap marks stickers beyond the cube!")
+            return _header.size + _bitmap_len + bitmap.bit_count()
+        raise ValueError(f"Unknown frame type: {frame_type}!")
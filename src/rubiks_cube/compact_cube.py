@@ -0,0 +1,140 @@
+from .cube import Cube
+from .cubie_cube import CubieCube
+from .notation import Notation
+
+
+class CompactCube:
+    """
+    Immutable, hashable cube states for search engines.
+
+    A compact state is a tuple of 20 small ints: 8 corners followed by 12
+    edges. Corner position i holds piece * 3 + twist and edge position i
+    holds piece * 2 + flip, using the CubieCube piece order. Moves are
+    applied through precomputed per-position lookup tables, so a face turn
+    is a single tuple comprehension with no arithmetic.
+    """
+
+    corner_count = 8
+    edge_count = 12
+    solved = tuple(3 * i for i in range(8)) + tuple(2 * i for i in range(12))
+
+    @staticmethod
+    def from_cubie(cubie_cube: CubieCube) -> tuple[int, ...]:
+        """
+        Convert a CubieCube into a compact state.
+        """
+        return tuple(
+            piece * 3 + twist for piece, twist in zip(cubie_cube.cp, cubie_cube.co)
+        ) + tuple(piece * 2 + flip for piece, flip in zip(cubie_cube.ep, cubie_cube.eo))
+
+    @staticmethod
+    def to_cubie(state: tuple[int, ...]) -> CubieCube:
+        """
+        Convert a compact state into a CubieCube.
+        """
+        corners = state[: CompactCube.corner_count]
+        edges = state[CompactCube.corner_count :]
+        return CubieCube(
+            [value // 3 for value in corners],
+            [value % 3 for value in corners],
+            [value // 2 for value in edges],
+            [value % 2 for value in edges],
+        )
+
+    @staticmethod
+    def from_cube(cube: Cube) -> tuple[int, ...]:
+        """
+        Convert a sticker Cube into a compact state.
+
+        Raises:
+            ValueError: If the stickers do not form valid pieces.
+        """
+        return CompactCube.from_cubie(CubieCube.from_cube(cube))
+
+    @staticmethod
+    def to_cube(state: tuple[int, ...]) -> Cube:
+        """
+        Build a new sticker Cube from a compact state.
+        """
+        return CompactCube.to_cubie(state).to_cube()
+
+    @staticmethod
+    def apply(state: tuple[int, ...], move: str) -> tuple[int, ...]:
+        """
+        Return the state after one move.
+
+        Args:
+            state: Compact state.
+            move: Move token such as "R", "U2" or "F'".
+        """
+        return tuple([table[state[source]] for source, table in _transitions[move]])
+
+    @staticmethod
+    def multiply(first: tuple[int, ...], second: tuple[int, ...]) -> tuple[int, ...]:
+        """
+        Compose two states: the permutation of first followed by second.
+
+        Applying a move is the same as multiplying by the state the move
+        produces from solved, as in CubieCube.multiply.
+        """
+        corners = []
+        for value in second[: CompactCube.corner_count]:
+            source = first[value // 3]
+            corners.append(source - source % 3 + (source + value) % 3)
+        edges = []
+        for value in second[CompactCube.corner_count :]:
+            source = first[CompactCube.corner_count + (value >> 1)]
+            edges.append(source ^ (value & 1))
+        return tuple(corners + edges)
+
+    @staticmethod
+    def inverse(state: tuple[int, ...]) -> tuple[int, ...]:
+        """
+        Return the state that multiplied with state gives solved.
+        """
+        inverse = [0] * len(state)
+        for position, value in enumerate(state[: CompactCube.corner_count]):
+            inverse[value // 3] = position * 3 + -value % 3
+        for position, value in enumerate(state[CompactCube.corner_count :]):
+            inverse[CompactCube.corner_count + (value >> 1)] = position * 2 + (value & 1)
+        return tuple(inverse)
+
+    @staticmethod
+    def apply_sequence(state: tuple[int, ...], moves: list[str]) -> tuple[int, ...]:
+        """
+        Return the state after a sequence of moves.
+        """
+        for move in moves:
+            state = tuple([table[state[source]] for source, table in _transitions[move]])
+        return state
+
+
+def _build_transitions() -> dict[str, tuple[tuple[int, tuple[int, ...]], ...]]:
+    """
+    Build, for every move, the (source position, value table) pair of each
+    target position.
+    """
+    corner_tables = [
+        tuple((value // 3) * 3 + (value % 3 + twist) % 3 for value in range(24))
+        for twist in range(3)
+    ]
+    edge_tables = [
+        tuple((value // 2) * 2 + (value % 2 ^ flip) for value in range(24))
+        for flip in range(2)
+    ]
+    transitions = {}
+    for move in Notation.moves:
+        cubie_cube = CubieCube()
+        for _ in range(Notation.quarter_turns(move)):
+            cubie_cube.move(Notation.face_keys[move[0]])
+        transitions[move] = tuple(
+            (source, corner_tables[twist])
+            for source, twist in zip(cubie_cube.cp, cubie_cube.co)
+        ) + tuple(
+            (CompactCube.corner_count + source, edge_tables[flip])
+            for source, flip in zip(cubie_cube.ep, cubie_cube.eo)
+        )
+    return transitions
+
+
+_transitions = _build_transitions()
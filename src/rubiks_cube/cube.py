@@ -1,5 +1,5 @@
 from .face import Face
-from .colors import FaceColors
+from .move_tables import face_keys, sticker_cycles
 import random
 
 
@@ -12,20 +12,6 @@ class Cube:
     displaying the cube in the console.
     """
 
-    @staticmethod
-    def _orient_edge(edge: list[FaceColors], condition: bool) -> list[FaceColors]:
-        """
-        Reverse an edge slice if a given condition is True.
-
-        Args:
-            edge: List of FaceColors representing one edge of a face.
-            condition: Whether to reverse the order of the edge.
-
-        Returns:
-            A list of FaceColors, reversed if condition is True, otherwise unchanged.
-        """
-        return edge[::-1] if condition else edge
-
     def __init__(self, faces: tuple[Face, Face, Face, Face, Face, Face]) -> None:
         """
         Initialize the Cube with six Face instances.
@@ -45,6 +31,7 @@ class Cube:
         self._yellow_face = yellow_face
 
         self._faces_dict = self._create_face_dict()
+        self._face_keys = {face: key for key, face in self._faces_dict.items()}
         self._setup_face_connections()
 
     def _create_face_dict(self) -> dict[str, Face]:
@@ -67,30 +54,35 @@ class Cube:
             "y": self._yellow_face,
         }
 
-    def shuffle(self, target_count: int = 35, max_count: int = 100) -> None:
+    def shuffle(
+        self,
+        target_count: int = 35,
+        max_count: int = 100,
+        rng: random.Random | int | None = None,
+    ) -> None:
         """
         Perform a random sequence of face rotations to shuffle the cube.
 
         Args:
-            target_count: Desired number of random moves (default 35).
-            max_count: Hard limit on moves to avoid infinite loops (default 100).
+            target_count: Exact number of random moves (default 35).
+            max_count: Longest shuffle allowed (default 100).
+            rng: Random instance or seed to draw the moves from; the global
+                 random module is used if omitted. The same seed always
+                 gives the same shuffle.
+
+        Raises:
+            ValueError: If target_count exceeds max_count.
 
         The method avoids immediate inverse moves on the same face.
         """
-        good_move_count = 0
-        attempts = 0
-        face_keys = list(self._faces_dict.keys())
-        last_move: tuple[str, bool] = ()
-
-        while good_move_count < target_count and attempts < max_count:
-            attempts += 1
-            key = random.choice(face_keys)
-            clockwise = random.choice((True, False))
-            if last_move and (key == last_move[0] and clockwise != last_move[1]):
-                continue
+        if target_count > max_count:
+            raise ValueError("Shuffle length exceeds the maximum!")
+        if rng is None:
+            rng = random
+        elif not isinstance(rng, random.Random):
+            rng = random.Random(rng)
+        for key, clockwise in _random_rotations(target_count, rng):
             self.rotate_face(self._faces_dict[key], clockwise)
-            last_move = (key, clockwise)
-            good_move_count += 1
 
     def _setup_face_connections(self) -> None:
         """
@@ -118,249 +110,22 @@ class Cube:
             self._red_face, self._orange_face, self._blue_face, self._green_face
         )
 
-    def _rotate_edge_surface(
-        self,
-        edge_surface: tuple[
-            list[FaceColors], list[FaceColors], list[FaceColors], list[FaceColors]
-        ],
-        rotated_face: Face,
-        clockwise: bool,
-    ) -> tuple[list[FaceColors], list[FaceColors], list[FaceColors], list[FaceColors]]:
-        """
-        Rotate the tuple of four edge slices based on face rotation direction.
-
-        Orange, Blue, and Yellow faces invert the rotation direction due to
-        extraction order.
-
-        Args:
-            edge_surface: Tuple of four lists of FaceColors (edges of adjacent faces).
-            rotated_face: The Face object being rotated.
-            clockwise: Direction of rotation on the rotated face.
-
-        Returns:
-            A tuple of four edge lists, rotated by one position.
-        """
-        equator_clockwise = (
-            not clockwise
-            if rotated_face in (self._orange_face, self._blue_face, self._yellow_face)
-            else clockwise
-        )
-        if equator_clockwise:
-            return edge_surface[-1:] + edge_surface[:-1]
-        return edge_surface[1:] + edge_surface[:1]
-
-    def _get_red_orange_equator(
-        self, rotated_face: Face
-    ) -> tuple[list[FaceColors], list[FaceColors], list[FaceColors], list[FaceColors]]:
-        """
-        Extract the four edge slices around the red or orange face.
-
-        Args:
-            rotated_face: Either the red_face or orange_face.
-
-        Returns:
-            Tuple of edges from green, white, blue, and yellow faces.
-        """
-        i, j = (-1, 0) if rotated_face == self._red_face else (0, -1)
-        return (
-            self._green_face.get_col(i),
-            self._white_face.get_col(i),
-            self._blue_face.get_col(j),
-            self._yellow_face.get_col(j),
-        )
-
-    def _get_green_blue_equator(
-        self, rotated_face: Face
-    ) -> tuple[list[FaceColors], list[FaceColors], list[FaceColors], list[FaceColors]]:
-        """
-        Extract the four edge slices around the green or blue face.
-
-        Args:
-            rotated_face: Either the green_face or blue_face.
-
-        Returns:
-            Tuple of edges from orange, white, red, and yellow faces.
-        """
-        i, j = (-1, 0) if rotated_face == self._green_face else (0, -1)
-        return (
-            self._orange_face.get_col(i),
-            self._white_face.get_row(i),
-            self._red_face.get_col(j),
-            self._yellow_face.get_row(i),
-        )
-
-    def _get_white_yellow_equator(
-        self, rotated_face: Face
-    ) -> tuple[list[FaceColors], list[FaceColors], list[FaceColors], list[FaceColors]]:
-        """
-        Extract the four edge slices around the white or yellow face.
-
-        Args:
-            rotated_face: Either the white_face or yellow_face.
-
-        Returns:
-            Tuple of edges from green, orange, blue, and red faces.
-        """
-        i = 0 if rotated_face == self._white_face else -1
-        return (
-            self._green_face.get_row(i),
-            self._orange_face.get_row(i),
-            self._blue_face.get_row(i),
-            self._red_face.get_row(i),
-        )
-
-    def _get_edge_surface(
-        self, rotated_face: Face
-    ) -> tuple[list[FaceColors], list[FaceColors], list[FaceColors], list[FaceColors]]:
-        """
-        Dispatch to the appropriate equator getter based on rotated face.
-
-        Args:
-            rotated_face: The Face object being rotated.
-
-        Returns:
-            Tuple of four edge lists from the relevant equator.
-        """
-        if rotated_face in (self._red_face, self._orange_face):
-            return self._get_red_orange_equator(rotated_face)
-        if rotated_face in (self._green_face, self._blue_face):
-            return self._get_green_blue_equator(rotated_face)
-        return self._get_white_yellow_equator(rotated_face)
-
-    def _set_red_orange_equator(
-        self,
-        edge_surface: tuple[
-            list[FaceColors], list[FaceColors], list[FaceColors], list[FaceColors]
-        ],
-        rotated_face: Face,
-        clockwise: bool,
-    ) -> None:
-        """
-        Place rotated edge slices back onto the green, white, blue, and yellow faces
-        after rotating the red or orange face.
-
-        Args:
-            edge_surface: Rotated tuple of four edge lists.
-            rotated_face: The red_face or orange_face.
-            clockwise: Direction of the original rotation.
-        """
-        i, j = (-1, 0) if rotated_face == self._red_face else (0, -1)
-        edge_for_green, edge_for_white, edge_for_blue, edge_for_yellow = edge_surface
-        is_red = rotated_face == self._red_face
-        orient_condition = is_red == clockwise
-
-        final_edge_for_green = Cube._orient_edge(edge_for_green, orient_condition)
-        final_edge_for_blue = Cube._orient_edge(edge_for_blue, orient_condition)
-        final_edge_for_white = Cube._orient_edge(edge_for_white, not orient_condition)
-        final_edge_for_yellow = Cube._orient_edge(edge_for_yellow, not orient_condition)
-
-        self._green_face.set_col(i, final_edge_for_green)
-        self._white_face.set_col(i, final_edge_for_white)
-        self._blue_face.set_col(j, final_edge_for_blue)
-        self._yellow_face.set_col(j, final_edge_for_yellow)
-
-    def _set_green_blue_equator(
-        self,
-        edge_surface: tuple[
-            list[FaceColors], list[FaceColors], list[FaceColors], list[FaceColors]
-        ],
-        rotated_face: Face,
-        clockwise: bool,
-    ) -> None:
-        """
-        Place rotated edge slices back onto the orange, white, red, and yellow faces
-        after rotating the green or blue face.
-
-        Args:
-            edge_surface: Rotated tuple of four edge lists.
-            rotated_face: The green_face or blue_face.
-            clockwise: Direction of the original rotation.
-        """
-        i, j = (-1, 0) if rotated_face == self._green_face else (0, -1)
-        edge_for_orange, edge_for_white, edge_for_red, edge_for_yellow = edge_surface
-        is_green = rotated_face == self._green_face
-        orient_condition = is_green == clockwise
-
-        final_edge_for_orange = Cube._orient_edge(edge_for_orange, orient_condition)
-        final_edge_for_red = Cube._orient_edge(edge_for_red, orient_condition)
-        final_edge_for_white = Cube._orient_edge(edge_for_white, not orient_condition)
-        final_edge_for_yellow = Cube._orient_edge(edge_for_yellow, not orient_condition)
-
-        self._orange_face.set_col(i, final_edge_for_orange)
-        self._white_face.set_row(i, final_edge_for_white)
-        self._red_face.set_col(j, final_edge_for_red)
-        self._yellow_face.set_row(i, final_edge_for_yellow)
-
-    def _set_white_yellow_equator(
-        self,
-        edge_surface: tuple[
-            list[FaceColors], list[FaceColors], list[FaceColors], list[FaceColors]
-        ],
-        rotated_face: Face,
-    ) -> None:
-        """
-        Place rotated edge slices back onto the four side faces after rotating
-        the white or yellow face.
-
-        Args:
-            edge_surface: Tuple of four edge lists from green, orange, blue, red.
-            rotated_face: The white_face or yellow_face.
-        """
-        i = 0 if rotated_face == self._white_face else -1
-        edge_for_green, edge_for_orange, edge_for_blue, edge_for_red = edge_surface
-
-        self._green_face.set_row(i, edge_for_green)
-        self._orange_face.set_row(i, edge_for_orange)
-        self._blue_face.set_row(i, edge_for_blue)
-        self._red_face.set_row(i, edge_for_red)
-
-    def _set_edge_surface(
-        self,
-        edge_surface: tuple[
-            list[FaceColors], list[FaceColors], list[FaceColors], list[FaceColors]
-        ],
-        rotated_face: Face,
-        clockwise: bool,
-    ) -> None:
-        """
-        Dispatch to the appropriate equator setter based on rotated face.
-
-        Args:
-            edge_surface: Rotated tuple of four edge lists.
-            rotated_face: The Face object that was rotated.
-            clockwise: Rotation direction of that face.
-        """
-        if rotated_face in (self._red_face, self._orange_face):
-            self._set_red_orange_equator(edge_surface, rotated_face, clockwise)
-        elif rotated_face in (self._green_face, self._blue_face):
-            self._set_green_blue_equator(edge_surface, rotated_face, clockwise)
-        else:
-            self._set_white_yellow_equator(edge_surface, rotated_face)
-
-    def _rotate_neighbors(self, rotated_face: Face, clockwise: bool) -> None:
-        """
-        Rotate the edge slices on neighboring faces when one face is rotated.
-
-        Args:
-            rotated_face: The Face object being rotated.
-            clockwise: Direction of rotation.
-        """
-        edge_surface = self._get_edge_surface(rotated_face)
-        rotated_edge_surface = self._rotate_edge_surface(
-            edge_surface, rotated_face, clockwise
-        )
-        self._set_edge_surface(rotated_edge_surface, rotated_face, clockwise)
-
     def rotate_face(self, rotated_face: Face, clockwise: bool) -> None:
         """
         Rotate a single face and update its neighbors accordingly.
 
+        The stickers to move are looked up in the shared move tables, so a
+        turn is the same few list assignments whichever face is turned.
+
         Args:
             rotated_face: The Face to rotate.
             clockwise: True for clockwise, False for counter-clockwise.
         """
-        rotated_face.rotate(clockwise)
-        self._rotate_neighbors(rotated_face, clockwise)
+        matrices = [face._matrix for face in self._faces_dict.values()]
+        sources, targets = _turn_cells[self._face_keys[rotated_face], clockwise]
+        colors = [matrices[face][row][col] for face, row, col in sources]
+        for (face, row, col), color in zip(targets, colors):
+            matrices[face][row][col] = color
 
     def is_solved(self) -> bool:
         """
@@ -385,3 +150,59 @@ class Cube:
             The corresponding Face instance.
         """
         return self._faces_dict[key]
+
+
+def _build_turn_cells() -> dict[
+    tuple[str, bool],
+    tuple[tuple[tuple[int, int, int], ...], tuple[tuple[int, int, int], ...]],
+]:
+    """
+    Translate the sticker cycles of every quarter turn into (face number,
+    row, col) cells: the cells to read and the cells to write them to.
+    """
+    edge_len = Face.edge_len
+    face_size = edge_len * edge_len
+
+    def cell(index: int) -> tuple[int, int, int]:
+        face, offset = divmod(index, face_size)
+        return (face, *divmod(offset, edge_len))
+
+    turn_cells = {}
+    for move, cycles in sticker_cycles.items():
+        sources = tuple(cell(index) for cycle in cycles for index in cycle)
+        targets = tuple(
+            cell(index) for cycle in cycles for index in cycle[1:] + cycle[:1]
+        )
+        turn_cells[move] = (sources, targets)
+    return turn_cells
+
+
+_turn_cells = _build_turn_cells()
+
+
+# Rotations allowed after each rotation: anything but its inverse.
+_all_rotations = tuple((key, clockwise) for key in face_keys for clockwise in (True, False))
+_next_rotations = {
+    last: tuple(
+        rotation
+        for rotation in _all_rotations
+        if last is None or rotation != (last[0], not last[1])
+    )
+    for last in (None, *_all_rotations)
+}
+
+
+def _random_rotations(count: int, rng: random.Random) -> list[tuple[str, bool]]:
+    """
+    Draw a random sequence of (face key, clockwise) rotations that never
+    undoes the previous rotation.
+
+    Every rotation is drawn from the allowed ones directly, so the sequence
+    has exactly count rotations.
+    """
+    rotations = []
+    last = None
+    for _ in range(count):
+        last = rng.choice(_next_rotations[last])
+        rotations.append(last)
+    return rotations
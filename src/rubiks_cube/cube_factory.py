@@ -2,20 +2,26 @@ from .cube import Cube
 from pathlib import Path
 from .colors import FaceColors
 from .face import Face
+from .state_cache import StateCache
+from .state_codec import StateCodec
 from .validator import Validator
 import json
+import os
 
 
 class CubeFactory:
-    data_dir = Path("src/rubiks_cube/")
-    _color_keys_to_enum = {
-        "r": FaceColors.RED,
-        "o": FaceColors.ORANGE,
-        "g": FaceColors.GREEN,
-        "b": FaceColors.BLUE,
-        "w": FaceColors.WHITE,
-        "y": FaceColors.YELLOW,
-    }
+    data_dir = Path(__file__).parent
+
+    def __init__(self, cache: StateCache | None = None) -> None:
+        """
+        Initialize the factory.
+
+        Args:
+            cache: Optional cache of validated file states. When given, files
+                   that have not changed since they were last loaded are not
+                   read or validated again.
+        """
+        self.cache = cache
 
     def create_solved_cube(self) -> Cube:
         """
@@ -55,32 +61,19 @@ class CubeFactory:
         """
         if file_dir is None:
             file_dir = CubeFactory.data_dir
-        full_path = file_dir / file_name
-        Validator.validate_file_path(full_path)
+        full_path = Path(file_dir) / file_name
+        if self.cache is not None:
+            state = self.cache.get(full_path)
+            if state is not None:
+                return StateCodec.decode(state)
 
+        Validator.validate_file_path(full_path)
+        file_stat = os.stat(full_path)
         with open(full_path) as f:
             faces_data = json.load(f)["faces"]
 
-        faces_keys = list(faces_data.values())
         Validator.validate_file_data(faces_data)
-
-        enum_matrixes = self._convert_key_matrix(faces_keys)
-        converted_faces = [Face(matrix) for matrix in enum_matrixes]
-        return Cube(converted_faces)
-
-    def _convert_key_matrix(
-        self, key_matrixes: list[list[list[str]]]
-    ) -> list[list[list[FaceColors]]]:
-        """
-        Convert matrices of color keys to matrices of FaceColors enums.
-
-        Args:
-            key_matrixes: List of six 3x3 lists of string color keys.
-
-        Returns:
-            List of six 3x3 lists of FaceColors enums.
-        """
-        return [
-            [[CubeFactory._color_keys_to_enum[cell] for cell in row] for row in matrix]
-            for matrix in key_matrixes
-        ]
+        state = StateCodec.encode_key_matrixes(faces_data)
+        if self.cache is not None:
+            self.cache.put(full_path, file_stat, state)
+        return StateCodec.decode(state)
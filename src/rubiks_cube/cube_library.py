@@ -0,0 +1,262 @@
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+from typing import NamedTuple, TextIO
+from .cube import Cube
+from .cube_factory import CubeFactory
+from .state_codec import StateCodec
+from .validator import Validator
+import json
+import multiprocessing
+
+
+class LibraryRecord(NamedTuple):
+    """
+    One position read from a cube library.
+
+    Attributes:
+        index: Zero-based position of the record in the file.
+        state: Validated 54-byte sticker encoding, or None if invalid.
+        error: Reason the record was rejected, or None if valid.
+    """
+
+    index: int
+    state: bytes | None
+    error: str | None
+
+    def to_cube(self) -> Cube:
+        """
+        Build a new Cube from a valid record.
+        """
+        return StateCodec.decode(self.state)
+
+
+def _decode_record(item: tuple[int, str | dict]) -> LibraryRecord:
+    """
+    Parse and validate a single library record.
+
+    Runs in worker processes, so it must stay a module-level function.
+
+    Args:
+        item: Record index and either the raw JSON text or the parsed object.
+
+    Returns:
+        The decoded record; failures are reported in its error field.
+    """
+    index, raw = item
+    try:
+        data = json.loads(raw) if isinstance(raw, str) else raw
+        if not isinstance(data, dict):
+            raise ValueError("Cube record must be a JSON object!")
+        faces = data["faces"]
+        Validator.validate_file_data(faces)
+        return LibraryRecord(index, StateCodec.encode_key_matrixes(faces), None)
+    except KeyError as error:
+        return LibraryRecord(index, None, f"Missing key: {error}")
+    except (TypeError, ValueError) as error:
+        return LibraryRecord(index, None, str(error))
+
+
+class CubeLibrary:
+    """
+    Streams many cube positions from a single library file.
+
+    Supported formats:
+        - JSON Lines (.jsonl): one {"faces": {...}} object per line.
+        - JSON (.json): an object with a "cubes" array of {"faces": {...}}
+          objects, or a single {"faces": {...}} object as read by CubeFactory.
+
+    Files are read incrementally, so memory use does not grow with the
+    number of records. Invalid records are reported through their error
+    field and do not stop the stream; only a file that is not valid JSON at
+    all aborts it. Validation can be spread across a process pool.
+    """
+
+    read_size = 1 << 16
+
+    def __init__(self, processes: int = 1, batch_size: int = 512) -> None:
+        """
+        Initialize the loader.
+
+        Args:
+            processes: Number of worker processes used to decode records;
+                       1 decodes in the calling process.
+            batch_size: Number of records handed to the pool at a time, which
+                        bounds how many records are held in memory.
+        """
+        self.processes = processes
+        self.batch_size = batch_size
+
+    def iter_records(
+        self, file_name: str, file_dir: str | Path | None = None
+    ) -> Iterator[LibraryRecord]:
+        """
+        Yield every record of a library file in order.
+
+        Args:
+            file_name: Name of the .json or .jsonl library file.
+            file_dir: Directory of the file. Defaults to CubeFactory.data_dir.
+
+        Yields:
+            LibraryRecord for each position, valid or not.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the extension is not supported or the file is not
+                        well-formed JSON.
+        """
+        if file_dir is None:
+            file_dir = CubeFactory.data_dir
+        full_path = Path(file_dir) / file_name
+        Validator.validate_library_path(full_path)
+
+        with open(full_path) as f:
+            if full_path.suffix == ".jsonl":
+                raw_records = CubeLibrary._iter_json_lines(f)
+            else:
+                raw_records = CubeLibrary._iter_json_array(f)
+            yield from self._decode(enumerate(raw_records))
+
+    def iter_cubes(
+        self, file_name: str, file_dir: str | Path | None = None
+    ) -> Iterator[Cube]:
+        """
+        Yield a new Cube for every valid record, skipping invalid ones.
+
+        Args:
+            file_name: Name of the .json or .jsonl library file.
+            file_dir: Directory of the file. Defaults to CubeFactory.data_dir.
+        """
+        for record in self.iter_records(file_name, file_dir):
+            if record.error is None:
+                yield record.to_cube()
+
+    def _decode(
+        self, items: Iterable[tuple[int, str | dict]]
+    ) -> Iterator[LibraryRecord]:
+        """
+        Decode raw records, in batches across a pool if configured.
+        """
+        if self.processes <= 1:
+            yield from map(_decode_record, items)
+            return
+        items = iter(items)
+        with multiprocessing.Pool(self.processes) as pool:
+            while batch := list(islice(items, self.batch_size)):
+                chunk_size = max(1, len(batch) // self.processes)
+                yield from pool.map(_decode_record, batch, chunk_size)
+
+    @staticmethod
+    def _iter_json_lines(f: TextIO) -> Iterator[str]:
+        """
+        Yield the non-blank lines of a JSON Lines file.
+        """
+        for line in f:
+            if line.strip():
+                yield line
+
+    @staticmethod
+    def _iter_json_array(f: TextIO) -> Iterator[dict]:
+        """
+        Yield the records of a JSON library file without loading it whole.
+
+        Yields the items of the top-level "cubes" array one by one, or the
+        top-level object itself if it is a single {"faces": ...} record.
+
+        Raises:
+            ValueError: If the file is not well-formed JSON.
+        """
+        reader = _JsonReader(f, CubeLibrary.read_size)
+        reader.expect("{")
+        if reader.peek() == "}":
+            return
+        while True:
+            key = reader.value()
+            reader.expect(":")
+            if key == "cubes":
+                reader.expect("[")
+                if reader.peek() == "]":
+                    reader.expect("]")
+                else:
+                    while True:
+                        yield reader.value()
+                        if reader.expect(",]") == "]":
+                            break
+            elif key == "faces":
+                yield {"faces": reader.value()}
+            else:
+                reader.value()
+            if reader.expect(",}") == "}":
+                return
+
+
+class _JsonReader:
+    """
+    Minimal incremental JSON tokenizer over a text file.
+
+    Structural characters are consumed one at a time while complete values
+    are decoded with json.JSONDecoder.raw_decode, reading more text whenever
+    the buffered part is not enough.
+    """
+
+    def __init__(self, f: TextIO, read_size: int) -> None:
+        self._file = f
+        self._read_size = read_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def _read_more(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._file.read(self._read_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        Return the next non-whitespace character without consuming it.
+        """
+        while True:
+            while self._position < len(self._buffer):
+                char = self._buffer[self._position]
+                if not char.isspace():
+                    return char
+                self._position += 1
+            if not self._read_more():
+                raise ValueError("Unexpected end of library file!")
+
+    def expect(self, allowed: str) -> str:
+        """
+        Consume the next structural character, which must be in allowed.
+        """
+        char = self.peek()
+        if char not in allowed:
+            raise ValueError(
+                f"Malformed library file: expected {' or '.join(allowed)}, got {char!r}!"
+            )
+        self._position += 1
+        return char
+
+    def value(self) -> object:
+        """
+        Decode and consume the next complete JSON value.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise ValueError("Malformed library file: invalid JSON value!")
+                continue
+            # A number at the very end of the buffer may continue in the next chunk.
+            if end == len(self._buffer) and self._read_more():
+                continue
+            self._position = end
+            return value
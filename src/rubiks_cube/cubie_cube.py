@@ -0,0 +1,345 @@
+from .cube import Cube
+from .state_codec import StateCodec
+
+
+class CubieCube:
+    """
+    Piece-level representation of a 3x3 Rubik's Cube.
+
+    The cube is described by 8 corners and 12 edges. For every position the
+    permutation arrays hold the index of the piece that occupies it and the
+    orientation arrays hold its twist (0-2 for corners) or flip (0-1 for
+    edges). Centers never move, so they are not stored.
+
+    Face letters follow the standard notation with red in front and white on
+    top: U=white, D=yellow, F=red, B=orange, L=green, R=blue.
+    """
+
+    corner_names = ("URF", "UFL", "ULB", "UBR", "DFR", "DLF", "DBL", "DRB")
+    edge_names = (
+        "UR", "UF", "UL", "UB", "DR", "DF", "DL", "DB", "FR", "FL", "BL", "BR"
+    )
+
+    # Sticker indices (see StateCodec) of every corner, starting with the
+    # white/yellow sticker and going clockwise around the corner.
+    corner_facelets = (
+        (38, 27, 2),
+        (44, 0, 20),
+        (42, 18, 11),
+        (36, 9, 29),
+        (45, 8, 33),
+        (51, 26, 6),
+        (53, 17, 24),
+        (47, 35, 15),
+    )
+    # Sticker indices of every edge, starting with the white/yellow sticker
+    # or, for the middle layer, with the red/orange sticker.
+    edge_facelets = (
+        (37, 28),
+        (41, 1),
+        (43, 19),
+        (39, 10),
+        (46, 34),
+        (48, 7),
+        (52, 25),
+        (50, 16),
+        (5, 30),
+        (3, 23),
+        (14, 21),
+        (12, 32),
+    )
+    corner_colors = tuple(
+        tuple(index // StateCodec.face_size for index in facelets)
+        for facelets in corner_facelets
+    )
+    edge_colors = tuple(
+        tuple(index // StateCodec.face_size for index in facelets)
+        for facelets in edge_facelets
+    )
+    _up_down_colors = (4, 5)
+    _corner_lookup = {colors[1:]: piece for piece, colors in enumerate(corner_colors)}
+    _edge_lookup = {
+        **{colors: (piece, 0) for piece, colors in enumerate(edge_colors)},
+        **{colors[::-1]: (piece, 1) for piece, colors in enumerate(edge_colors)},
+    }
+
+    # Clockwise quarter turns as (cp, co, ep, eo) in "replaced by" form:
+    # after the move, position i holds the piece that was at cp[i].
+    basic_moves = {
+        "w": (
+            (3, 0, 1, 2, 4, 5, 6, 7),
+            (0, 0, 0, 0, 0, 0, 0, 0),
+            (3, 0, 1, 2, 4, 5, 6, 7, 8, 9, 10, 11),
+            (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+        ),
+        "b": (
+            (4, 1, 2, 0, 7, 5, 6, 3),
+            (2, 0, 0, 1, 1, 0, 0, 2),
+            (8, 1, 2, 3, 11, 5, 6, 7, 4, 9, 10, 0),
+            (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+        ),
+        "r": (
+            (1, 5, 2, 3, 0, 4, 6, 7),
+            (1, 2, 0, 0, 2, 1, 0, 0),
+            (0, 9, 2, 3, 4, 8, 6, 7, 1, 5, 10, 11),
+            (0, 1, 0, 0, 0, 1, 0, 0, 1, 1, 0, 0),
+        ),
+        "y": (
+            (0, 1, 2, 3, 5, 6, 7, 4),
+            (0, 0, 0, 0, 0, 0, 0, 0),
+            (0, 1, 2, 3, 5, 6, 7, 4, 8, 9, 10, 11),
+            (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+        ),
+        "g": (
+            (0, 2, 6, 3, 4, 1, 5, 7),
+            (0, 1, 2, 0, 0, 2, 1, 0),
+            (0, 1, 10, 3, 4, 5, 9, 7, 8, 2, 6, 11),
+            (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+        ),
+        "o": (
+            (0, 1, 3, 7, 4, 5, 2, 6),
+            (0, 0, 1, 2, 0, 0, 2, 1),
+            (0, 1, 2, 11, 4, 5, 6, 10, 8, 9, 3, 7),
+            (0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 1, 1),
+        ),
+    }
+
+    def __init__(
+        self,
+        cp: list[int] | None = None,
+        co: list[int] | None = None,
+        ep: list[int] | None = None,
+        eo: list[int] | None = None,
+    ) -> None:
+        """
+        Initialize the cube from permutation and orientation arrays.
+
+        Any array left as None takes its solved value.
+
+        Args:
+            cp: Corner permutation, 8 piece indices.
+            co: Corner orientation, 8 values in 0-2.
+            ep: Edge permutation, 12 piece indices.
+            eo: Edge orientation, 12 values in 0-1.
+        """
+        self.cp = list(cp) if cp is not None else list(range(8))
+        self.co = list(co) if co is not None else [0] * 8
+        self.ep = list(ep) if ep is not None else list(range(12))
+        self.eo = list(eo) if eo is not None else [0] * 12
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CubieCube):
+            return NotImplemented
+        return (
+            self.cp == other.cp
+            and self.co == other.co
+            and self.ep == other.ep
+            and self.eo == other.eo
+        )
+
+    def __repr__(self) -> str:
+        return f"CubieCube(cp={self.cp}, co={self.co}, ep={self.ep}, eo={self.eo})"
+
+    @classmethod
+    def from_facelets(cls, state: bytes) -> "CubieCube":
+        """
+        Reconstruct the pieces from a 54-byte sticker encoding.
+
+        Args:
+            state: Sticker encoding as produced by StateCodec.
+
+        Returns:
+            The corresponding CubieCube.
+
+        Raises:
+            ValueError: If some corner or edge does not match any real piece.
+        """
+        cp, co, ep, eo = [], [], [], []
+        up_down = CubieCube._up_down_colors
+        for position, facelets in enumerate(CubieCube.corner_facelets):
+            colors = [state[index] for index in facelets]
+            for twist in range(3):
+                if colors[twist] in up_down:
+                    break
+            else:
+                raise ValueError(
+                    f"Unrecognized corner at {CubieCube.corner_names[position]}!"
+                )
+            key = (colors[(twist + 1) % 3], colors[(twist + 2) % 3])
+            piece = CubieCube._corner_lookup.get(key)
+            if piece is None or CubieCube.corner_colors[piece][0] != colors[twist]:
+                raise ValueError(
+                    f"Unrecognized corner at {CubieCube.corner_names[position]}!"
+                )
+            cp.append(piece)
+            co.append(twist)
+        for position, (first, second) in enumerate(CubieCube.edge_facelets):
+            found = CubieCube._edge_lookup.get((state[first], state[second]))
+            if found is None:
+                raise ValueError(
+                    f"Unrecognized edge at {CubieCube.edge_names[position]}!"
+                )
+            ep.append(found[0])
+            eo.append(found[1])
+        return cls(cp, co, ep, eo)
+
+    def to_facelets(self) -> bytes:
+        """
+        Convert the pieces into a 54-byte sticker encoding.
+
+        Returns:
+            Sticker encoding as used by StateCodec.
+        """
+        state = bytearray(StateCodec.solved_state)
+        for position, facelets in enumerate(CubieCube.corner_facelets):
+            colors = CubieCube.corner_colors[self.cp[position]]
+            twist = self.co[position]
+            for n in range(3):
+                state[facelets[(n + twist) % 3]] = colors[n]
+        for position, (first, second) in enumerate(CubieCube.edge_facelets):
+            colors = CubieCube.edge_colors[self.ep[position]]
+            flip = self.eo[position]
+            state[first] = colors[flip]
+            state[second] = colors[1 - flip]
+        return bytes(state)
+
+    @classmethod
+    def from_cube(cls, cube: Cube) -> "CubieCube":
+        """
+        Build the piece-level model of a sticker Cube.
+
+        Args:
+            cube: Cube instance to convert.
+
+        Returns:
+            The corresponding CubieCube.
+
+        Raises:
+            ValueError: If the stickers do not form valid pieces.
+        """
+        return cls.from_facelets(StateCodec.encode(cube))
+
+    def to_cube(self) -> Cube:
+        """
+        Build a new sticker Cube with the same state.
+
+        Returns:
+            A Cube instance.
+        """
+        return StateCodec.decode(self.to_facelets())
+
+    def copy(self) -> "CubieCube":
+        """
+        Return an independent copy of this cube.
+        """
+        return CubieCube(self.cp, self.co, self.ep, self.eo)
+
+    def multiply(self, other: "CubieCube") -> "CubieCube":
+        """
+        Compose two cube states: apply this one, then other.
+
+        Args:
+            other: The state (for example a move) applied afterwards.
+
+        Returns:
+            A new CubieCube with the combined state.
+        """
+        cp, co, ep, eo = self.cp, self.co, self.ep, self.eo
+        return CubieCube(
+            [cp[i] for i in other.cp],
+            [(co[i] + twist) % 3 for i, twist in zip(other.cp, other.co)],
+            [ep[i] for i in other.ep],
+            [eo[i] ^ flip for i, flip in zip(other.ep, other.eo)],
+        )
+
+    def move(self, face_key: str, clockwise: bool = True) -> None:
+        """
+        Turn one face in-place, matching Cube.rotate_face.
+
+        Args:
+            face_key: Color key of the turned face ('r','o','g','b','w','y').
+            clockwise: True for clockwise, False for counter-clockwise.
+        """
+        move_cp, move_co, move_ep, move_eo = _move_table[face_key, clockwise]
+        cp, co, ep, eo = self.cp, self.co, self.ep, self.eo
+        self.cp = [cp[i] for i in move_cp]
+        self.co = [(co[i] + twist) % 3 for i, twist in zip(move_cp, move_co)]
+        self.ep = [ep[i] for i in move_ep]
+        self.eo = [eo[i] ^ flip for i, flip in zip(move_ep, move_eo)]
+
+    def find_corner(self, name: str) -> tuple[str, int]:
+        """
+        Locate a corner piece.
+
+        Args:
+            name: Corner name, e.g. 'URF'.
+
+        Returns:
+            The name of the position holding the piece and its twist.
+        """
+        position = self.cp.index(CubieCube.corner_names.index(name))
+        return CubieCube.corner_names[position], self.co[position]
+
+    def find_edge(self, name: str) -> tuple[str, int]:
+        """
+        Locate an edge piece.
+
+        Args:
+            name: Edge name, e.g. 'UF'.
+
+        Returns:
+            The name of the position holding the piece and its flip.
+        """
+        position = self.ep.index(CubieCube.edge_names.index(name))
+        return CubieCube.edge_names[position], self.eo[position]
+
+    @staticmethod
+    def _permutation_parity(permutation: list[int]) -> int:
+        """
+        Return 0 for an even permutation and 1 for an odd one.
+        """
+        parity = 0
+        for i in range(len(permutation)):
+            for j in range(i):
+                if permutation[j] > permutation[i]:
+                    parity ^= 1
+        return parity
+
+    def corner_parity(self) -> int:
+        """
+        Return the parity (0 even, 1 odd) of the corner permutation.
+        """
+        return CubieCube._permutation_parity(self.cp)
+
+    def edge_parity(self) -> int:
+        """
+        Return the parity (0 even, 1 odd) of the edge permutation.
+        """
+        return CubieCube._permutation_parity(self.ep)
+
+    def is_solved(self) -> bool:
+        """
+        Check if every piece is in its home position with zero orientation.
+        """
+        return self == CubieCube()
+
+
+def _build_move_table() -> dict[tuple[str, bool], tuple[tuple[int, ...], ...]]:
+    """
+    Expand the clockwise basic moves with their counter-clockwise inverses.
+    """
+    table = {}
+    for key, (cp, co, ep, eo) in CubieCube.basic_moves.items():
+        move = CubieCube(cp, co, ep, eo)
+        inverse = move.multiply(move).multiply(move)
+        table[key, True] = (cp, co, ep, eo)
+        table[key, False] = (
+            tuple(inverse.cp),
+            tuple(inverse.co),
+            tuple(inverse.ep),
+            tuple(inverse.eo),
+        )
+    return table
+
+
+_move_table = _build_move_table()
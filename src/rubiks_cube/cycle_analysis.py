@@ -0,0 +1,170 @@
+from typing import NamedTuple
+from .compact_cube import CompactCube
+from .cubie_cube import CubieCube
+import math
+
+
+class Cycle(NamedTuple):
+    """
+    One cycle of pieces moved by a cube state.
+
+    Attributes:
+        kind: "corner" or "edge".
+        positions: Positions (CubieCube order) visited by the cycle; the
+                   piece at each position moves to the next one.
+        orientation: Net twist (corners, 0-2) or flip (edges, 0-1) a piece
+                     picks up going once around the cycle.
+        order: Repetitions after which the cycle's pieces are home and
+               oriented: its length, times 3 or 2 if the net twist or flip
+               is not zero.
+    """
+
+    kind: str
+    positions: tuple[int, ...]
+    orientation: int
+    order: int
+
+
+class CycleAnalysis(NamedTuple):
+    """
+    Cycle structure of a cube state.
+
+    Attributes:
+        state: The analysed compact state.
+        order: Number of repetitions that return the cube to solved.
+        cycles: Cycles of moved pieces, corners first. Pieces that stay in
+                place but are twisted or flipped form cycles of length 1.
+    """
+
+    state: tuple[int, ...]
+    order: int
+    cycles: list[Cycle]
+
+
+class CycleAnalyzer:
+    """
+    Order and powers of move sequences, computed from their permutation.
+
+    A sequence is reduced once to its compact state. Its order is the least
+    common multiple of the orders of its piece cycles, and the state after k
+    repetitions is found by exponentiation by squaring, so neither needs the
+    sequence to be repeated move by move.
+    """
+
+    @staticmethod
+    def analyze(moves: list[str]) -> CycleAnalysis:
+        """
+        Decompose the permutation of a move sequence into cycles.
+
+        Args:
+            moves: Move tokens, e.g. Notation.parse("R U2 D' B D'").
+
+        Returns:
+            CycleAnalysis of the state the sequence produces from solved.
+        """
+        return CycleAnalyzer.analyze_state(
+            CompactCube.apply_sequence(CompactCube.solved, moves)
+        )
+
+    @staticmethod
+    def analyze_state(state: tuple[int, ...]) -> CycleAnalysis:
+        """
+        Decompose a compact state into corner and edge cycles.
+
+        Args:
+            state: Compact state.
+
+        Returns:
+            CycleAnalysis with the order and the cycles of the state.
+        """
+        cycles = []
+        for kind, start, count, radix in (
+            ("corner", 0, CompactCube.corner_count, 3),
+            ("edge", CompactCube.corner_count, CompactCube.edge_count, 2),
+        ):
+            seen = [False] * count
+            for first in range(count):
+                if seen[first]:
+                    continue
+                # In "replaced by" form position p receives the piece from
+                # state[p] // radix, so following the sources walks the
+                # cycle backwards.
+                positions = []
+                orientation = 0
+                position = first
+                while not seen[position]:
+                    seen[position] = True
+                    positions.append(position)
+                    value = state[start + position]
+                    orientation += value % radix
+                    position = value // radix
+                orientation %= radix
+                if len(positions) == 1 and not orientation:
+                    continue
+                positions.reverse()
+                cycles.append(
+                    Cycle(
+                        kind,
+                        tuple(positions[-1:] + positions[:-1]),
+                        orientation,
+                        len(positions) * (radix if orientation else 1),
+                    )
+                )
+        order = math.lcm(*(cycle.order for cycle in cycles)) if cycles else 1
+        return CycleAnalysis(state, order, cycles)
+
+    @staticmethod
+    def order(moves: list[str]) -> int:
+        """
+        Return how many times a sequence must be repeated to return to
+        solved.
+        """
+        return CycleAnalyzer.analyze(moves).order
+
+    @staticmethod
+    def power(state: tuple[int, ...], exponent: int) -> tuple[int, ...]:
+        """
+        Return the state after repeating state exponent times.
+
+        Args:
+            state: Compact state, e.g. of a move sequence.
+            exponent: Number of repetitions; negative values repeat the
+                      inverse.
+
+        Returns:
+            Compact state of the repetitions, computed with
+            O(log exponent) multiplications.
+        """
+        if exponent < 0:
+            state = CompactCube.inverse(state)
+            exponent = -exponent
+        result = CompactCube.solved
+        while exponent:
+            if exponent & 1:
+                result = CompactCube.multiply(result, state)
+            state = CompactCube.multiply(state, state)
+            exponent >>= 1
+        return result
+
+    @staticmethod
+    def describe(analysis: CycleAnalysis) -> str:
+        """
+        Format a cycle structure with piece names, e.g.
+        "(URF UBR)+ (UF UL UB)".
+
+        A trailing "+" or "-" marks a corner cycle with a net clockwise or
+        counter-clockwise twist, and "'" an edge cycle with a net flip.
+        """
+        parts = []
+        for cycle in analysis.cycles:
+            if cycle.kind == "corner":
+                names = CubieCube.corner_names
+                mark = ("", "+", "-")[cycle.orientation]
+            else:
+                names = CubieCube.edge_names
+                mark = "'" if cycle.orientation else ""
+            parts.append(
+                "(" + " ".join(names[position] for position in cycle.positions) + ")"
+                + mark
+            )
+        return " ".join(parts)
@@ -0,0 +1,237 @@
+from pathlib import Path
+from .notation import Notation
+from .slim_cube import SlimCube
+from .state_codec import StateCodec
+import ast
+import json
+import multiprocessing
+import os
+import random
+import struct
+import zipfile
+
+
+def _npy_bytes(data: bytes, shape: tuple[int, ...]) -> bytes:
+    """
+    Wrap raw uint8 data in the .npy format (version 1.0).
+
+    The header is padded so that the data starts at a multiple of 64 bytes,
+    as numpy itself does.
+    """
+    header = repr(
+        {"descr": "|u1", "fortran_order": False, "shape": shape}
+    ).encode("latin1")
+    prefix_len = len(b"\x93NUMPY") + 2 + 2
+    padding = -(prefix_len + len(header) + 1) % 64
+    header += b" " * padding + b"\n"
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header + data
+
+
+def _npy_data(payload: bytes) -> tuple[bytes, tuple[int, ...]]:
+    """
+    Return the raw data and shape of a uint8 .npy payload.
+
+    Raises:
+        ValueError: If the payload is not a uint8 .npy array.
+    """
+    if payload[:6] != b"\x93NUMPY":
+        raise ValueError("Not an .npy array!")
+    major = payload[6]
+    if major == 1:
+        (header_len,) = struct.unpack("<H", payload[8:10])
+        start = 10
+    else:
+        (header_len,) = struct.unpack("<I", payload[8:12])
+        start = 12
+    header = ast.literal_eval(payload[start : start + header_len].decode("latin1"))
+    if header["descr"] not in ("|u1", "u1") or header["fortran_order"]:
+        raise ValueError("Only C-ordered uint8 arrays are supported!")
+    return payload[start + header_len :], tuple(header["shape"])
+
+
+def _walk_moves() -> dict[str, tuple[str, ...]]:
+    """
+    List, for every previous face letter, the moves allowed next: a walk
+    never turns the same face twice in a row, so it never cancels itself
+    trivially.
+    """
+    allowed = {"": Notation.moves}
+    for letter in Notation.face_keys:
+        allowed[letter] = tuple(move for move in Notation.moves if move[0] != letter)
+    return allowed
+
+
+_allowed_moves = _walk_moves()
+# Walks in a row that may find no new state before a shard is given up.
+_max_idle_walks = 1000
+
+
+def _write_shard(task: tuple[str, int, int, int, int]) -> str:
+    """
+    Generate one shard of samples and write it atomically.
+
+    Runs in worker processes, so it must stay a module-level function. The
+    random stream depends only on the seed and the shard number, so a shard
+    has the same contents whichever process writes it and whenever.
+
+    Args:
+        task: Output directory, shard number, sample count, walk length and
+              seed.
+
+    Returns:
+        Path of the written shard.
+
+    Raises:
+        ValueError: If walks stop finding new states before the shard is
+                    full.
+    """
+    output_dir, number, count, walk_length, seed = task
+    rng = random.Random(f"{seed}:{number}")
+    labels: dict[bytes, int] = {}
+    move_getters = SlimCube.move_getters
+    idle_walks = 0
+    while len(labels) < count:
+        if idle_walks == _max_idle_walks:
+            raise ValueError("Walk length is too short to fill a shard!")
+        found = len(labels)
+        stickers = bytearray(StateCodec.solved_state)
+        last_face = ""
+        for depth in range(1, walk_length + 1):
+            move = rng.choice(_allowed_moves[last_face])
+            stickers[:] = move_getters[move](stickers)
+            last_face = move[0]
+            state = bytes(stickers)
+            # A state met again keeps the shortest walk that reached it.
+            if labels.get(state, depth) >= depth:
+                labels[state] = depth
+                if len(labels) == count:
+                    break
+        idle_walks = idle_walks + 1 if len(labels) == found else 0
+
+    path = Path(output_dir) / DatasetExporter.shard_name.format(number)
+    temporary = path.with_suffix(".tmp")
+    with zipfile.ZipFile(temporary, "w", zipfile.ZIP_STORED) as archive:
+        archive.writestr(
+            "states.npy",
+            _npy_bytes(b"".join(labels), (count, StateCodec.state_len)),
+        )
+        archive.writestr("labels.npy", _npy_bytes(bytes(labels.values()), (count,)))
+    os.replace(temporary, path)
+    return str(path)
+
+
+class DatasetExporter:
+    """
+    Writes (state, distance) training samples as sharded .npz files.
+
+    Samples come from random walks off the solved cube that never turn the
+    same face twice in a row. Every state along a walk is a sample, labeled
+    with the number of moves that reached it, which is an upper bound on its
+    distance from solved. Each shard holds a uint8 array "states" of shape
+    (n, 54) in the StateCodec encoding and a uint8 array "labels" of shape
+    (n,), and contains no state twice. Shards are written by a process pool
+    from independent random streams, and shards already on disk are kept, so
+    an interrupted export resumes where it stopped. The files are written
+    with the standard library only and load with numpy.load.
+    """
+
+    manifest_name = "manifest.json"
+    shard_name = "shard-{:05d}.npz"
+
+    def __init__(
+        self,
+        output_dir: str | Path,
+        shard_size: int = 100000,
+        walk_length: int = 20,
+        seed: int = 0,
+        processes: int = 1,
+    ) -> None:
+        """
+        Initialize the exporter.
+
+        Args:
+            output_dir: Directory receiving the shards and manifest.
+            shard_size: Samples per shard.
+            walk_length: Moves per random walk, at most 255.
+            seed: Seed from which every shard derives its random stream.
+            processes: Number of worker processes; 1 writes in the calling
+                       process.
+
+        Raises:
+            ValueError: If walk_length does not fit in a uint8 label.
+        """
+        if not 1 <= walk_length <= 255:
+            raise ValueError("Walk length must be between 1 and 255!")
+        self.output_dir = Path(output_dir)
+        self.shard_size = shard_size
+        self.walk_length = walk_length
+        self.seed = seed
+        self.processes = processes
+
+    def export(self, samples: int) -> list[Path]:
+        """
+        Write shards until the export holds the requested number of samples.
+
+        Args:
+            samples: Total number of samples; the last shard may be smaller.
+
+        Returns:
+            Paths of all shards of the export, in order.
+
+        Raises:
+            ValueError: If the directory holds an export with other settings.
+        """
+        manifest = {
+            "samples": samples,
+            "shard_size": self.shard_size,
+            "walk_length": self.walk_length,
+            "seed": self.seed,
+        }
+        manifest_path = self.output_dir / DatasetExporter.manifest_name
+        if manifest_path.exists():
+            if json.loads(manifest_path.read_text()) != manifest:
+                raise ValueError("Output directory belongs to another export!")
+        else:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            manifest_path.write_text(json.dumps(manifest))
+
+        tasks = [
+            (
+                str(self.output_dir),
+                number,
+                min(self.shard_size, samples - start),
+                self.walk_length,
+                self.seed,
+            )
+            for number, start in enumerate(range(0, samples, self.shard_size))
+        ]
+        paths = [
+            self.output_dir / DatasetExporter.shard_name.format(task[1])
+            for task in tasks
+        ]
+        pending = [task for task, path in zip(tasks, paths) if not path.exists()]
+        if self.processes <= 1:
+            for task in pending:
+                _write_shard(task)
+        else:
+            with multiprocessing.Pool(self.processes) as pool:
+                for _ in pool.imap_unordered(_write_shard, pending):
+                    pass
+        return paths
+
+    @staticmethod
+    def read_shard(path: str | Path) -> tuple[list[bytes], bytes]:
+        """
+        Load a shard without numpy.
+
+        Args:
+            path: Shard file written by export().
+
+        Returns:
+            The 54-byte states and their labels.
+        """
+        with zipfile.ZipFile(path) as archive:
+            states, shape = _npy_data(archive.read("states.npy"))
+            labels, _ = _npy_data(archive.read("labels.npy"))
+        width = shape[1]
+        return [states[i : i + width] for i in range(0, len(states), width)], labels
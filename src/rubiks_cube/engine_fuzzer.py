@@ -0,0 +1,280 @@
+from collections.abc import Callable
+from typing import NamedTuple
+from .bitboard_cube import BitboardCube
+from .compact_cube import CompactCube
+from .cube_factory import CubeFactory
+from .cubie_cube import CubieCube
+from .notation import Notation
+from .slim_cube import SlimCube
+from .state_codec import StateCodec
+import multiprocessing
+import random
+import time
+
+
+def run_cube(moves: list[str]) -> bytes:
+    """
+    Reference engine: turn a sticker Cube with Cube.rotate_face.
+    """
+    cube = CubeFactory().create_solved_cube()
+    Notation.apply(cube, moves)
+    return StateCodec.encode(cube)
+
+
+def run_slim_cube(moves: list[str]) -> bytes:
+    """
+    Turn a SlimCube through the shared sticker permutations.
+    """
+    cube = SlimCube()
+    cube.apply(moves)
+    return cube.encode()
+
+
+def run_bitboard_cube(moves: list[str]) -> bytes:
+    """
+    Turn a BitboardCube by masked rotations of its face rings.
+    """
+    cube = BitboardCube()
+    cube.apply(moves)
+    return cube.encode()
+
+
+def run_cubie_cube(moves: list[str]) -> bytes:
+    """
+    Turn a CubieCube quarter turn by quarter turn.
+    """
+    cubie_cube = CubieCube()
+    for move in moves:
+        for face_key, clockwise in Notation.to_rotations(move):
+            cubie_cube.move(face_key, clockwise)
+    return cubie_cube.to_facelets()
+
+
+def run_compact_cube(moves: list[str]) -> bytes:
+    """
+    Apply the moves to a CompactCube state.
+    """
+    state = CompactCube.apply_sequence(CompactCube.solved, moves)
+    return CompactCube.to_cubie(state).to_facelets()
+
+
+class Mismatch(NamedTuple):
+    """
+    A move sequence on which an engine disagrees with the reference.
+
+    Attributes:
+        engine: Name of the disagreeing engine.
+        moves: Shrunk move sequence that still shows the disagreement.
+        original_length: Length of the random sequence that first failed.
+        expected: Sticker encoding produced by the reference engine.
+        actual: Sticker encoding produced by the engine.
+    """
+
+    engine: str
+    moves: list[str]
+    original_length: int
+    expected: bytes
+    actual: bytes
+
+
+class FuzzReport(NamedTuple):
+    """
+    Result of a fuzzing run.
+
+    Attributes:
+        sequences: Number of random sequences run through every engine.
+        moves: Number of moves in those sequences.
+        rates: Moves per second of every engine, the reference included.
+        mismatches: At most one shrunk mismatch per disagreeing engine.
+    """
+
+    sequences: int
+    moves: int
+    rates: dict[str, float]
+    mismatches: list[Mismatch]
+
+
+class _BatchResult(NamedTuple):
+    sequences: int
+    moves: int
+    seconds: dict[str, float]
+    failures: dict[str, list[str]]
+
+
+def _run_batch(
+    task: tuple[int, int, int, int, dict[str, Callable[[list[str]], bytes]]],
+) -> _BatchResult:
+    """
+    Generate one batch of sequences and run it through every engine.
+
+    Runs in worker processes, so it must stay a module-level function. The
+    sequences depend only on the seed and batch number, so a run finds the
+    same failures whatever the number of processes.
+
+    Args:
+        task: Seed, batch number, sequence count, sequence length and the
+              engines by name, the reference first.
+
+    Returns:
+        Batch totals with the first failing sequence of every engine.
+    """
+    seed, batch, count, length, engines = task
+    rng = random.Random(f"{seed}:{batch}")
+    sequences = [
+        [rng.choice(Notation.moves) for _ in range(length)] for _ in range(count)
+    ]
+    seconds = {}
+    failures = {}
+    expected = None
+    for name, engine in engines.items():
+        started = time.perf_counter()
+        states = [engine(moves) for moves in sequences]
+        seconds[name] = time.perf_counter() - started
+        if expected is None:
+            expected = states
+            continue
+        for moves, wanted, state in zip(sequences, expected, states):
+            if state != wanted:
+                failures[name] = moves
+                break
+    return _BatchResult(count, count * length, seconds, failures)
+
+
+class EngineFuzzer:
+    """
+    Differential fuzzing of cube engines against Cube.rotate_face.
+
+    Random move sequences are run through the reference engine and every
+    other engine, and the final sticker encodings are compared. A sequence
+    on which an engine disagrees is shrunk to a short one that still
+    disagrees. The time each engine spends is recorded too, so a run doubles
+    as a throughput benchmark.
+
+    An engine is a function that applies a list of move tokens to a solved
+    cube and returns its 54-byte sticker encoding. To be used with several
+    processes it must be defined at module level.
+    """
+
+    default_engines = {
+        "slim": run_slim_cube,
+        "bitboard": run_bitboard_cube,
+        "cubie": run_cubie_cube,
+        "compact": run_compact_cube,
+    }
+
+    def __init__(
+        self,
+        engines: dict[str, Callable[[list[str]], bytes]] | None = None,
+        reference: Callable[[list[str]], bytes] = run_cube,
+        processes: int = 1,
+    ) -> None:
+        """
+        Initialize the fuzzer.
+
+        Args:
+            engines: Engines to check by name. Defaults to default_engines.
+            reference: Engine whose results count as correct.
+            processes: Number of worker processes; 1 runs in the calling
+                       process.
+
+        Raises:
+            ValueError: If an engine is named "reference".
+        """
+        if engines is None:
+            engines = EngineFuzzer.default_engines
+        if "reference" in engines:
+            raise ValueError("Engine name 'reference' is reserved!")
+        self.engines = {"reference": reference, **engines}
+        self.processes = processes
+
+    def run(
+        self,
+        sequences: int,
+        length: int = 25,
+        seed: int = 0,
+        batch_size: int = 1000,
+    ) -> FuzzReport:
+        """
+        Run random sequences through every engine and compare the results.
+
+        Args:
+            sequences: Number of random sequences.
+            length: Moves per sequence.
+            seed: Seed of the random sequences.
+            batch_size: Sequences per worker task.
+
+        Returns:
+            FuzzReport with throughput and shrunk mismatches.
+        """
+        tasks = [
+            (seed, batch, min(batch_size, sequences - start), length, self.engines)
+            for batch, start in enumerate(range(0, sequences, batch_size))
+        ]
+        if self.processes <= 1:
+            results = list(map(_run_batch, tasks))
+        else:
+            with multiprocessing.Pool(self.processes) as pool:
+                results = pool.map(_run_batch, tasks)
+
+        moves = sum(result.moves for result in results)
+        seconds = {
+            name: sum(result.seconds[name] for result in results)
+            for name in self.engines
+        }
+        failures: dict[str, list[str]] = {}
+        for result in results:
+            for name, failing in result.failures.items():
+                failures.setdefault(name, failing)
+        return FuzzReport(
+            sum(result.sequences for result in results),
+            moves,
+            {
+                name: moves / elapsed if elapsed else float("inf")
+                for name, elapsed in seconds.items()
+            },
+            [self.shrink(name, failing) for name, failing in failures.items()],
+        )
+
+    def check(self, name: str, moves: list[str]) -> bool:
+        """
+        Return True if an engine agrees with the reference on a sequence.
+        """
+        return self.engines[name](moves) == self.engines["reference"](moves)
+
+    def shrink(self, name: str, moves: list[str]) -> Mismatch:
+        """
+        Shorten a failing sequence while the engine keeps disagreeing.
+
+        Removes runs of moves, from half the sequence down to single moves,
+        until no single move can be removed.
+
+        Args:
+            name: Engine that disagrees on moves.
+            moves: Failing move sequence.
+
+        Returns:
+            Mismatch with the shrunk sequence.
+        """
+        current = list(moves)
+        chunk = max(1, len(current) // 2)
+        while current:
+            removed = False
+            start = 0
+            while start < len(current):
+                candidate = current[:start] + current[start + chunk :]
+                if not self.check(name, candidate):
+                    current = candidate
+                    removed = True
+                else:
+                    start += chunk
+            if chunk == 1 and not removed:
+                break
+            if not removed:
+                chunk = max(1, chunk // 2)
+        return Mismatch(
+            name,
+            current,
+            len(moves),
+            self.engines["reference"](current),
+            self.engines[name](current),
+        )
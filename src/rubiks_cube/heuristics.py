@@ -0,0 +1,178 @@
+from collections import deque
+from collections.abc import Callable
+from .compact_cube import CompactCube, _transitions
+from .notation import Notation
+import math
+
+
+class PatternDatabase:
+    """
+    Lower bound on the solving distance, exact for one projection of the cube.
+
+    The projection keeps either the corners or the edges of a compact state
+    and reduces every value through a lookup table (for example keeping only
+    the twist of each corner). The distance of every reachable projected
+    state is found once by breadth-first search from the solved cube over all
+    18 face turns and stored in a flat byte table, which makes the lookup an
+    admissible heuristic for face-turn-metric searches.
+
+    Use PatternDatabase.get(name); built databases are cached per process.
+    """
+
+    unvisited = 255
+    _cache: dict[str, "PatternDatabase"] = {}
+    _specs = {
+        "corner_orientation": (0, 8, tuple(value % 3 for value in range(24)), 3),
+        "edge_orientation": (8, 20, tuple(value % 2 for value in range(24)), 2),
+        "corner_permutation": (0, 8, tuple(value // 3 for value in range(24)), None),
+    }
+
+    def __init__(self, name: str, table: bytes | None = None) -> None:
+        """
+        Initialize a database, building its table unless one is given.
+
+        Args:
+            name: One of 'corner_orientation', 'edge_orientation' or
+                  'corner_permutation'.
+            table: Previously built distance table to reuse.
+
+        Raises:
+            KeyError: If the name is unknown.
+        """
+        start, stop, reduce, radix = PatternDatabase._specs[name]
+        self.name = name
+        self._start = start
+        self._stop = stop
+        self._reduce = reduce
+        self._radix = radix
+        count = stop - start
+        self.size = radix**count if radix is not None else math.factorial(count)
+        self.table = table if table is not None else self._build()
+
+    @classmethod
+    def get(cls, name: str) -> "PatternDatabase":
+        """
+        Return the cached database with the given name, building it if needed.
+        """
+        if name not in cls._cache:
+            cls._cache[name] = cls(name)
+        return cls._cache[name]
+
+    def __call__(self, state: tuple[int, ...]) -> int:
+        reduce = self._reduce
+        return self.table[
+            self._rank([reduce[value] for value in state[self._start : self._stop]])
+        ]
+
+    def __reduce__(self) -> tuple:
+        return PatternDatabase, (self.name, bytes(self.table))
+
+    def _rank(self, projected: list[int] | tuple[int, ...]) -> int:
+        """
+        Map a projected state to its index in the table.
+        """
+        if self._radix is not None:
+            rank = 0
+            for value in projected:
+                rank = rank * self._radix + value
+            return rank
+        return _permutation_rank(projected)
+
+    def _build(self) -> bytearray:
+        """
+        Fill the distance table by breadth-first search from solved.
+        """
+        start, stop, reduce = self._start, self._stop, self._reduce
+        # Representative full value for every reduced value.
+        representative = {}
+        for value in range(24):
+            representative.setdefault(reduce[value], value)
+        moves = []
+        for move in Notation.moves:
+            pairs = _transitions[move][start:stop]
+            moves.append(
+                tuple(
+                    (
+                        source - start,
+                        {
+                            reduced: reduce[table[value]]
+                            for reduced, value in representative.items()
+                        },
+                    )
+                    for source, table in pairs
+                )
+            )
+
+        solved = tuple(reduce[value] for value in CompactCube.solved[start:stop])
+        distances = {solved: 0}
+        queue = deque([solved])
+        while queue:
+            projected = queue.popleft()
+            distance = distances[projected] + 1
+            for move in moves:
+                child = tuple([table[projected[source]] for source, table in move])
+                if child not in distances:
+                    distances[child] = distance
+                    queue.append(child)
+
+        table = bytearray([PatternDatabase.unvisited]) * self.size
+        for projected, distance in distances.items():
+            table[self._rank(projected)] = distance
+        return table
+
+
+class MaxHeuristic:
+    """
+    Combines admissible heuristics by taking the largest of their bounds.
+    """
+
+    def __init__(self, *heuristics: Callable[[tuple[int, ...]], int]) -> None:
+        self.heuristics = heuristics
+
+    def __call__(self, state: tuple[int, ...]) -> int:
+        return max(heuristic(state) for heuristic in self.heuristics)
+
+
+def misplaced_pieces(state: tuple[int, ...]) -> int:
+    """
+    Cheap admissible heuristic: a face turn moves only four corners and four
+    edges, so at least a quarter of the wrong pieces of each kind need one
+    move each.
+
+    Args:
+        state: Compact state.
+
+    Returns:
+        Lower bound on the number of face turns needed.
+    """
+    solved = CompactCube.solved
+    wrong_corners = sum(1 for i in range(8) if state[i] != solved[i])
+    wrong_edges = sum(1 for i in range(8, 20) if state[i] != solved[i])
+    return max((wrong_corners + 3) // 4, (wrong_edges + 3) // 4)
+
+
+def default_heuristic() -> MaxHeuristic:
+    """
+    Return the standard combination of pattern databases used by solvers.
+    """
+    return MaxHeuristic(
+        PatternDatabase.get("corner_permutation"),
+        PatternDatabase.get("corner_orientation"),
+        PatternDatabase.get("edge_orientation"),
+    )
+
+
+def _permutation_rank(permutation: list[int] | tuple[int, ...]) -> int:
+    """
+    Lehmer-code rank of a permutation of 0..n-1.
+    """
+    n = len(permutation)
+    rank = 0
+    for i in range(n):
+        value = permutation[i]
+        smaller = 0
+        for j in range(i + 1, n):
+            if permutation[j] < value:
+                smaller += 1
+        rank = rank * (n - i) + smaller
+    return rank
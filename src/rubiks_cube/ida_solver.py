@@ -0,0 +1,291 @@
+from collections.abc import Callable
+from typing import NamedTuple, Protocol
+from .compact_cube import CompactCube, _transitions
+from .cube import Cube
+from .heuristics import default_heuristic
+from .notation import Notation
+from .state_codec import StateCodec
+from .validator import Validator
+import math
+import time
+
+
+class CancelEvent(Protocol):
+    def is_set(self) -> bool: ...
+
+
+class SolveResult(NamedTuple):
+    """
+    Outcome of a solver run.
+
+    Attributes:
+        moves: Solution as move tokens, or None if none was found.
+        status: 'solved', 'timeout', 'cancelled' or 'exhausted' (no solution
+                within max_depth).
+        nodes: Number of search nodes visited, pruned leaves included.
+        elapsed: Wall-clock time in seconds.
+        lower_bound: Proven lower bound on the optimal solution length.
+    """
+
+    moves: list[str] | None
+    status: str
+    nodes: int
+    elapsed: float
+    lower_bound: int
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class TranspositionTable:
+    """
+    Fixed-size table remembering subtrees that were searched without success.
+
+    Each slot stores a key (compact state plus the face of the move that led
+    to it, since that face restricts the next moves) and the largest depth
+    budget under which its subtree was exhausted. A new entry replaces the
+    slot when the slot is free, holds the same key, was written by an older
+    search iteration, or holds a smaller budget; otherwise the more
+    expensive entry is kept.
+    """
+
+    def __init__(self, size: int = 1 << 18) -> None:
+        """
+        Initialize an empty table.
+
+        Args:
+            size: Number of slots.
+
+        Raises:
+            ValueError: If size is not positive.
+        """
+        if size < 1:
+            raise ValueError("Table size must be positive!")
+        self.size = size
+        self._keys: list[object] = [None] * size
+        self._budgets = [0] * size
+        self._generations = [0] * size
+        self.generation = 0
+
+    def probe(self, key: object, budget: int) -> bool:
+        """
+        Check whether the subtree of key is known to fail within budget.
+        """
+        slot = hash(key) % self.size
+        return self._keys[slot] == key and self._budgets[slot] >= budget
+
+    def store(self, key: object, budget: int) -> None:
+        """
+        Record that the subtree of key has no solution within budget.
+        """
+        slot = hash(key) % self.size
+        if (
+            self._keys[slot] is None
+            or self._keys[slot] == key
+            or self._generations[slot] != self.generation
+            or self._budgets[slot] <= budget
+        ):
+            self._keys[slot] = key
+            self._budgets[slot] = budget
+            self._generations[slot] = self.generation
+
+    def clear(self) -> None:
+        """
+        Forget all entries.
+        """
+        self._keys = [None] * self.size
+        self._budgets = [0] * self.size
+        self._generations = [0] * self.size
+        self.generation = 0
+
+
+class _SearchStopped(Exception):
+    def __init__(self, status: str) -> None:
+        super().__init__(status)
+        self.status = status
+
+
+class IDASolver:
+    """
+    Optimal solver based on iterative-deepening A*.
+
+    Searches the face-turn metric (18 moves) over CompactCube states. Move
+    sequences are pruned so the same face is never turned twice in a row
+    and commuting opposite faces are only tried in one order (U before D,
+    R before L, F before B). Any admissible heuristic can be plugged in; the
+    default combines the corner permutation, corner orientation and edge
+    orientation pattern databases.
+    """
+
+    # Search calls between deadline checks, each about one heuristic lookup.
+    check_interval = 256
+    face_order = "URFDLB"
+
+    def __init__(
+        self,
+        heuristic: Callable[[tuple[int, ...]], int] | None = None,
+        table_size: int = 1 << 18,
+    ) -> None:
+        """
+        Initialize the solver.
+
+        Args:
+            heuristic: Admissible lower bound on the distance of a compact
+                       state. Defaults to default_heuristic().
+            table_size: Number of transposition table slots.
+        """
+        self.heuristic = heuristic if heuristic is not None else default_heuristic()
+        self.table = TranspositionTable(table_size)
+        self._successors = IDASolver._build_successors()
+        self._nodes = 0
+        self._deadline: float | None = None
+        self._cancel_event: CancelEvent | None = None
+
+    @staticmethod
+    def _build_successors() -> dict[str | None, tuple[tuple[str, str], ...]]:
+        """
+        List the allowed (move, face) pairs after a move on each face.
+        """
+        order = IDASolver.face_order
+        successors = {}
+        for last_face in (None, *order):
+            allowed = []
+            for move in Notation.moves:
+                face = move[0]
+                if face == last_face:
+                    continue
+                if (
+                    last_face is not None
+                    and Notation.opposite_faces[face] == last_face
+                    and order.index(face) < order.index(last_face)
+                ):
+                    continue
+                allowed.append((move, face))
+            successors[last_face] = tuple(allowed)
+        return successors
+
+    def solve(
+        self,
+        cube: Cube,
+        max_depth: int = 20,
+        timeout: float | None = None,
+        cancel_event: CancelEvent | None = None,
+    ) -> SolveResult:
+        """
+        Find an optimal solution for a sticker Cube.
+
+        Args:
+            cube: Cube to solve. It is not modified.
+            max_depth: Longest solution to look for.
+            timeout: Seconds after which the search gives up.
+            cancel_event: Object with is_set() (e.g. threading.Event) that
+                          stops the search when set.
+
+        Returns:
+            SolveResult describing the solution or why there is none.
+
+        Raises:
+            ValueError: If the cube is not solvable.
+        """
+        state = StateCodec.encode(cube)
+        Validator.validate_state(state)
+        return self.solve_state(
+            CompactCube.from_cube(cube), max_depth, timeout, cancel_event
+        )
+
+    def solve_state(
+        self,
+        state: tuple[int, ...],
+        max_depth: int = 20,
+        timeout: float | None = None,
+        cancel_event: CancelEvent | None = None,
+    ) -> SolveResult:
+        """
+        Find an optimal solution for a compact state.
+
+        Args:
+            state: CompactCube state, assumed solvable.
+            max_depth: Longest solution to look for.
+            timeout: Seconds after which the search gives up.
+            cancel_event: Object with is_set() that stops the search when set.
+
+        Returns:
+            SolveResult describing the solution or why there is none.
+        """
+        started = time.perf_counter()
+        self._nodes = 0
+        self._deadline = started + timeout if timeout is not None else None
+        self._cancel_event = cancel_event
+        threshold = self.heuristic(state)
+        path: list[str] = []
+        try:
+            while threshold <= max_depth:
+                self.table.generation += 1
+                found = self._search(state, 0, threshold, None, path)
+                if found is True:
+                    return self._result(path[:], "solved", started, len(path))
+                threshold = found
+        except _SearchStopped as stop:
+            return self._result(None, stop.status, started, threshold)
+        return self._result(None, "exhausted", started, threshold)
+
+    def _result(
+        self, moves: list[str] | None, status: str, started: float, lower_bound: int
+    ) -> SolveResult:
+        return SolveResult(
+            moves, status, self._nodes, time.perf_counter() - started, lower_bound
+        )
+
+    def _check_stop(self) -> None:
+        """
+        Raise _SearchStopped if the deadline passed or cancellation was requested.
+        """
+        if self._cancel_event is not None and self._cancel_event.is_set():
+            raise _SearchStopped("cancelled")
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise _SearchStopped("timeout")
+
+    def _search(
+        self,
+        state: tuple[int, ...],
+        depth: int,
+        threshold: int,
+        last_face: str | None,
+        path: list[str],
+    ) -> bool | int:
+        """
+        Depth-first search below one node, bounded by threshold.
+
+        Returns:
+            True if a solution was found (it is left in path), otherwise the
+            smallest f-value that exceeded the threshold.
+        """
+        # Every call is counted, pruned leaves included: their heuristic
+        # lookups are most of the work, so the clock is checked on them too.
+        self._nodes += 1
+        if self._nodes % self.check_interval == 0:
+            self._check_stop()
+        estimate = depth + self.heuristic(state)
+        if estimate > threshold:
+            return estimate
+        if state == CompactCube.solved:
+            return True
+
+        budget = threshold - depth
+        key = (state, last_face)
+        if self.table.probe(key, budget):
+            return threshold + 1
+
+        minimum = math.inf
+        for move, face in self._successors[last_face]:
+            child = tuple([table[state[source]] for source, table in _transitions[move]])
+            path.append(move)
+            found = self._search(child, depth + 1, threshold, face, path)
+            if found is True:
+                return True
+            path.pop()
+            if found < minimum:
+                minimum = found
+        self.table.store(key, budget)
+        return minimum
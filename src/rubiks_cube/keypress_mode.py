@@ -0,0 +1,231 @@
+from collections import deque
+from collections.abc import Callable
+from .cube import Cube
+from .notation import Notation
+import importlib.util
+import os
+import sys
+import time
+
+
+class RawTerminal:
+    """
+    Context manager that puts a terminal into cbreak mode.
+
+    Keystrokes are delivered one by one without waiting for Enter and
+    without echo, and are restored to the previous mode on exit. Only
+    available where termios exists (not on Windows).
+    """
+
+    def __init__(self, stream=None) -> None:
+        """
+        Args:
+            stream: Terminal input stream; defaults to sys.stdin.
+        """
+        self._fd = (stream if stream is not None else sys.stdin).fileno()
+        self._saved = None
+
+    @staticmethod
+    def supported() -> bool:
+        """
+        Whether this platform provides termios, without which the terminal
+        cannot be put into cbreak mode.
+        """
+        return importlib.util.find_spec("termios") is not None
+
+    def __enter__(self) -> "RawTerminal":
+        import termios
+        import tty
+
+        self._saved = termios.tcgetattr(self._fd)
+        tty.setcbreak(self._fd)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        import termios
+
+        termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved)
+
+    def read_keys(self, timeout: float | None) -> str:
+        """
+        Wait for input and return every key typed so far.
+
+        Args:
+            timeout: Seconds to wait; None waits for the next key.
+
+        Returns:
+            The pending keys, or an empty string if none arrived in time.
+        """
+        import select
+
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return ""
+        return os.read(self._fd, 1024).decode("utf-8", errors="ignore")
+
+
+class KeypressMode:
+    """
+    Interactive loop where a single key turns a face.
+
+    Keys are read in bursts and queued, every queued move is applied
+    before the next redraw, and redraws happen at most once per frame
+    interval, so typing ahead is never slowed down by drawing. A burst
+    stops at the move that solves the cube. The default key map is the
+    two-handed layout of common speedcubing timers.
+    """
+
+    # i/k: R R', j/f: U U', h/g: F F', d/e: L L', s/l: D D', w/o: B B'.
+    default_keymap = {
+        "i": "R",
+        "k": "R'",
+        "j": "U",
+        "f": "U'",
+        "h": "F",
+        "g": "F'",
+        "d": "L",
+        "e": "L'",
+        "s": "D",
+        "l": "D'",
+        "w": "B",
+        "o": "B'",
+    }
+    # ESC quits only when pressed alone; arrow and function keys send it
+    # as the first byte of a longer escape sequence.
+    quit_keys = frozenset(("q",))
+    escape = "\x1b"
+
+    def __init__(
+        self,
+        cube: Cube,
+        read_keys: Callable[[float | None], str],
+        render: Callable[[], None],
+        keymap: dict[str, str] | None = None,
+        frame_interval: float = 1 / 30,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the loop.
+
+        Args:
+            cube: Cube to turn.
+            read_keys: Waits at most the given seconds (None: forever) and
+                       returns the keys typed so far, like
+                       RawTerminal.read_keys.
+            render: Draws the cube.
+            keymap: Key to move token map; defaults to default_keymap.
+            frame_interval: Minimum seconds between two redraws.
+            clock: Monotonic time source.
+
+        Raises:
+            ValueError: If the key map contains an unknown move.
+        """
+        self.keymap = dict(keymap if keymap is not None else KeypressMode.default_keymap)
+        for move in self.keymap.values():
+            Notation.parse(move)
+        self.cube = cube
+        self._read_keys = read_keys
+        self._render = render
+        self.frame_interval = frame_interval
+        self._clock = clock
+        self._queue: deque[str] = deque()
+        self._quit = False
+        self.moves = 0
+        self.redraws = 0
+
+    def feed(self, keys: str) -> None:
+        """
+        Queue the moves of typed keys; unmapped keys are ignored.
+
+        A lone ESC at the end of a read quits like a quit key; an escape
+        sequence, such as the one sent by an arrow key, is skipped.
+        """
+        index = 0
+        while index < len(keys):
+            key = keys[index]
+            if key == KeypressMode.escape:
+                if index == len(keys) - 1:
+                    self._quit = True
+                    return
+                index = KeypressMode._escape_end(keys, index)
+                continue
+            if key in KeypressMode.quit_keys:
+                self._quit = True
+                return
+            move = self.keymap.get(key)
+            if move is not None:
+                self._queue.append(move)
+            index += 1
+
+    @staticmethod
+    def _escape_end(keys: str, start: int) -> int:
+        """
+        Return the index just past the escape sequence starting at start.
+
+        CSI sequences (ESC [ ...) end at their first final byte in @..~,
+        SS3 sequences (ESC O x) after one more character, and anything else
+        (e.g. Alt plus a key) after the character following ESC.
+        """
+        introducer = keys[start + 1]
+        if introducer == "[":
+            index = start + 2
+            while index < len(keys) and not "@" <= keys[index] <= "~":
+                index += 1
+            return index + 1
+        if introducer == "O":
+            return start + 3
+        return start + 2
+
+    def apply_queued(self) -> int:
+        """
+        Apply the queued moves in order.
+
+        The cube is checked after every move; if one solves it, the rest of
+        the burst is discarded, so typing ahead cannot turn a solve back
+        into a scramble.
+
+        Returns:
+            The number of moves applied.
+        """
+        count = 0
+        while self._queue:
+            Notation.apply(self.cube, [self._queue.popleft()])
+            count += 1
+            if self.cube.is_solved():
+                self._queue.clear()
+                break
+        self.moves += count
+        return count
+
+    def run(self) -> bool:
+        """
+        Read keys and turn the cube until it is solved or a quit key is
+        pressed.
+
+        Returns:
+            True if the cube was solved, False if the user quit.
+        """
+        self._draw()
+        dirty = False
+        while not self._quit:
+            # With changes on screen pending, wait only until the next frame.
+            timeout = None
+            if dirty:
+                timeout = max(0.0, self._last_draw + self.frame_interval - self._clock())
+            self.feed(self._read_keys(timeout))
+            if self.apply_queued():
+                dirty = True
+                if self.cube.is_solved():
+                    self._draw()
+                    return True
+            if dirty and self._clock() - self._last_draw >= self.frame_interval:
+                self._draw()
+                dirty = False
+        if dirty:
+            self._draw()
+        return False
+
+    def _draw(self) -> None:
+        self._render()
+        self._last_draw = self._clock()
+        self.redraws += 1
@@ -0,0 +1,66 @@
+"""
+Sticker cycles of every quarter turn.
+
+Stickers are numbered as in StateCodec: face by face in the order red,
+orange, green, blue, white, yellow, row by row inside each face, so sticker
+9 * f + 3 * row + col is matrix[row][col] of face f. The tables here are the
+single description of how a turn moves stickers; Cube, SlimCube and any
+other sticker engine apply them instead of working out the neighbors of a
+face at every turn.
+"""
+
+face_keys = ("r", "o", "g", "b", "w", "y")
+face_size = 9
+
+# For every face, the twelve stickers around it as four strips. A clockwise
+# turn of the face carries the j-th sticker of each strip to the j-th
+# sticker of the next strip, the last strip wrapping around to the first.
+neighbor_strips = {
+    "r": ((20, 23, 26), (38, 41, 44), (33, 30, 27), (51, 48, 45)),
+    "o": ((18, 21, 24), (53, 50, 47), (35, 32, 29), (36, 39, 42)),
+    "g": ((0, 3, 6), (51, 52, 53), (17, 14, 11), (42, 43, 44)),
+    "b": ((2, 5, 8), (36, 37, 38), (15, 12, 9), (45, 46, 47)),
+    "w": ((0, 1, 2), (18, 19, 20), (9, 10, 11), (27, 28, 29)),
+    "y": ((6, 7, 8), (33, 34, 35), (15, 16, 17), (24, 25, 26)),
+}
+
+# Stickers of the turned face itself, as the cycles a clockwise turn makes:
+# corners, then edges.
+_face_cycles = ((0, 2, 8, 6), (1, 5, 7, 3))
+
+
+def _build_sticker_cycles() -> dict[tuple[str, bool], tuple[tuple[int, ...], ...]]:
+    """
+    Build, for every (face_key, clockwise) quarter turn, the four-cycles of
+    stickers it performs. In a cycle (a, b, c, d) the sticker at a moves to
+    b, the one at b to c, and so on.
+    """
+    cycles = {}
+    for number, face_key in enumerate(face_keys):
+        base = number * face_size
+        clockwise = tuple(
+            tuple(base + index for index in cycle) for cycle in _face_cycles
+        ) + tuple(zip(*neighbor_strips[face_key]))
+        cycles[face_key, True] = clockwise
+        cycles[face_key, False] = tuple(cycle[::-1] for cycle in clockwise)
+    return cycles
+
+
+def _build_sticker_permutations() -> dict[tuple[str, bool], tuple[int, ...]]:
+    """
+    Express every quarter turn as a 54-sticker permutation in "replaced by"
+    form: after the turn, sticker i holds the sticker that was at
+    permutation[i].
+    """
+    permutations = {}
+    for move, cycles in sticker_cycles.items():
+        permutation = list(range(len(face_keys) * face_size))
+        for cycle in cycles:
+            for source, target in zip(cycle, cycle[1:] + cycle[:1]):
+                permutation[target] = source
+        permutations[move] = tuple(permutation)
+    return permutations
+
+
+sticker_cycles = _build_sticker_cycles()
+sticker_permutations = _build_sticker_permutations()
@@ -0,0 +1,196 @@
+from .cube import Cube
+
+
+class Notation:
+    """
+    Standard cube notation for move sequences such as "R U2 D' B".
+
+    Faces are named from the usual orientation with red in front and white on
+    top: U=white, D=yellow, F=red, B=orange, L=green, R=blue. A move is a
+    token made of a face letter optionally followed by "'" (counter-clockwise)
+    or "2" (half turn).
+    """
+
+    face_keys = {"U": "w", "R": "b", "F": "r", "D": "y", "L": "g", "B": "o"}
+    face_letters = {key: letter for letter, key in face_keys.items()}
+    opposite_faces = {"U": "D", "D": "U", "R": "L", "L": "R", "F": "B", "B": "F"}
+    moves = tuple(
+        letter + suffix for letter in face_keys for suffix in ("", "2", "'")
+    )
+    _move_set = frozenset(moves)
+    _quarter_turns = {"": 1, "2": 2, "'": 3}
+    _inverse_suffixes = {"": "'", "'": "", "2": "2"}
+    # Faces whose turning direction a slice or cube rotation follows.
+    _slice_faces = {"M": "L", "E": "D", "S": "F"}
+    _rotation_faces = {"x": "R", "y": "U", "z": "F"}
+    # Order in which a clockwise rotation about R, U or F carries the faces.
+    _rotation_cycles = {
+        "R": ("F", "U", "B", "D"),
+        "U": ("F", "L", "B", "R"),
+        "F": ("U", "R", "D", "L"),
+    }
+
+    @staticmethod
+    def parse(text: str) -> list[str]:
+        """
+        Split a move sequence into validated move tokens.
+
+        Args:
+            text: Whitespace-separated moves, e.g. "R U2 D' B D'".
+
+        Returns:
+            List of move tokens.
+
+        Raises:
+            ValueError: If a token is not a known move.
+        """
+        moves = text.split()
+        for move in moves:
+            if move not in Notation._move_set:
+                raise ValueError(f"Unknown move: {move}!")
+        return moves
+
+    @staticmethod
+    def expand(text: str) -> list[str]:
+        """
+        Translate extended notation into face turns.
+
+        Besides face turns, accepts wide turns (r, u, f, l, d, b), slice turns
+        (M, E, S) and cube rotations (x, y, z) with the usual suffixes, as
+        used in published algorithms. Since the cube model has fixed
+        centers, a rotation only changes which physical face later tokens
+        refer to.
+
+        Args:
+            text: Whitespace-separated moves, e.g. "r U R' U' M".
+
+        Returns:
+            Equivalent list of face-turn tokens.
+
+        Raises:
+            ValueError: If a token is not a known move.
+        """
+        orientation = {letter: letter for letter in Notation.face_keys}
+        moves = []
+        for token in text.split():
+            base, suffix = token[:1], token[1:]
+            if suffix not in Notation._quarter_turns:
+                raise ValueError(f"Unknown move: {token}!")
+            inverse = Notation._inverse_suffixes[suffix]
+            if base in Notation.face_keys:
+                moves.append(orientation[base] + suffix)
+                continue
+            if base.upper() in Notation.face_keys:
+                face = base.upper()
+                moves.append(orientation[Notation.opposite_faces[face]] + suffix)
+            elif base in Notation._slice_faces:
+                face = Notation._slice_faces[base]
+                moves.append(orientation[face] + inverse)
+                moves.append(orientation[Notation.opposite_faces[face]] + suffix)
+            elif base in Notation._rotation_faces:
+                face = Notation._rotation_faces[base]
+            else:
+                raise ValueError(f"Unknown move: {token}!")
+            Notation._rotate(orientation, face, Notation._quarter_turns[suffix])
+        return moves
+
+    @staticmethod
+    def _rotate(orientation: dict[str, str], face: str, turns: int) -> None:
+        """
+        Update which physical face sits at each position after a rotation of
+        the whole cube in the direction of face.
+        """
+        if face in Notation._rotation_cycles:
+            cycle = Notation._rotation_cycles[face]
+        else:
+            cycle = Notation._rotation_cycles[Notation.opposite_faces[face]][::-1]
+        for _ in range(turns):
+            previous = dict(orientation)
+            for i, letter in enumerate(cycle):
+                orientation[cycle[(i + 1) % 4]] = previous[letter]
+
+    @staticmethod
+    def format(moves: list[str]) -> str:
+        """
+        Join move tokens into a sequence string.
+        """
+        return " ".join(moves)
+
+    @staticmethod
+    def simplify(moves: list[str]) -> list[str]:
+        """
+        Merge consecutive turns of the same face, e.g. "U U2" into "U'".
+
+        Args:
+            moves: Move tokens.
+
+        Returns:
+            New list in which no face is turned twice in a row.
+        """
+        suffixes = ("", "2", "'")
+        simplified: list[str] = []
+        for move in moves:
+            if simplified and simplified[-1][0] == move[0]:
+                turns = Notation.quarter_turns(simplified.pop())
+                turns = (turns + Notation.quarter_turns(move)) % 4
+                if turns:
+                    simplified.append(move[0] + suffixes[turns - 1])
+            else:
+                simplified.append(move)
+        return simplified
+
+    @staticmethod
+    def quarter_turns(move: str) -> int:
+        """
+        Return how many clockwise quarter turns a move is equivalent to (1-3).
+        """
+        return Notation._quarter_turns[move[1:]]
+
+    @staticmethod
+    def to_rotations(move: str) -> list[tuple[str, bool]]:
+        """
+        Express a move as Cube.rotate_face arguments.
+
+        Args:
+            move: Move token.
+
+        Returns:
+            List of (face_key, clockwise) quarter turns.
+        """
+        face_key = Notation.face_keys[move[0]]
+        match move[1:]:
+            case "":
+                return [(face_key, True)]
+            case "'":
+                return [(face_key, False)]
+            case _:
+                return [(face_key, True), (face_key, True)]
+
+    @staticmethod
+    def from_rotation(face_key: str, clockwise: bool) -> str:
+        """
+        Name the quarter turn performed by Cube.rotate_face(face, clockwise).
+        """
+        return Notation.face_letters[face_key] + ("" if clockwise else "'")
+
+    @staticmethod
+    def invert(moves: list[str]) -> list[str]:
+        """
+        Return the sequence that undoes the given moves.
+        """
+        inverse_suffixes = Notation._inverse_suffixes
+        return [move[0] + inverse_suffixes[move[1:]] for move in reversed(moves)]
+
+    @staticmethod
+    def apply(cube: Cube, moves: list[str]) -> None:
+        """
+        Apply a move sequence to a sticker Cube in-place.
+
+        Args:
+            cube: Cube to turn.
+            moves: Move tokens.
+        """
+        for move in moves:
+            for face_key, clockwise in Notation.to_rotations(move):
+                cube.rotate_face(cube._get_face_by_key(face_key), clockwise)
+
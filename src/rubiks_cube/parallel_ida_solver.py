@@ -0,0 +1,301 @@
+from multiprocessing.shared_memory import SharedMemory
+from typing import NamedTuple
+from .compact_cube import CompactCube
+from .cube import Cube
+from .heuristics import MaxHeuristic, PatternDatabase
+from .ida_solver import IDASolver, SolveResult, _SearchStopped
+from .state_codec import StateCodec
+from .validator import Validator
+import math
+import multiprocessing
+import os
+import time
+
+
+class _Task(NamedTuple):
+    state: tuple[int, ...]
+    prefix: tuple[str, ...]
+    last_face: str | None
+    threshold: int
+    deadline: float | None
+
+
+class _TaskResult(NamedTuple):
+    moves: list[str] | None
+    minimum: float
+    nodes: int
+    status: str
+
+
+# Per-process worker state, set up once by _init_worker.
+_worker_solver: IDASolver | None = None
+_worker_cancel_event = None
+_worker_blocks: list[SharedMemory] = []
+
+
+def _init_worker(
+    shared_tables: list[tuple[str, str]],
+    cancel_event,
+    table_size: int,
+    check_interval: int,
+) -> None:
+    """
+    Attach to the shared pattern database tables and create the worker solver.
+
+    Args:
+        shared_tables: (database name, shared memory block name) pairs.
+        cancel_event: Event set by the parent to stop all workers.
+        table_size: Transposition table slots for the worker solver.
+        check_interval: Nodes between deadline and cancellation checks.
+    """
+    global _worker_solver, _worker_cancel_event, _worker_blocks
+    databases = []
+    for database_name, block_name in shared_tables:
+        block = SharedMemory(name=block_name)
+        _worker_blocks.append(block)
+        databases.append(PatternDatabase(database_name, table=block.buf))
+    _worker_solver = IDASolver(MaxHeuristic(*databases), table_size)
+    _worker_solver.check_interval = check_interval
+    _worker_cancel_event = cancel_event
+
+
+def _search_task(task: _Task) -> _TaskResult:
+    """
+    Search one subtree below a frontier prefix up to the task threshold.
+
+    The node counter of the worker solver runs on across tasks, so the
+    periodic stop checks also fire in subtrees smaller than check_interval.
+    """
+    if _worker_cancel_event.is_set():
+        return _TaskResult(None, math.inf, 0, "cancelled")
+    if task.deadline is not None and time.time() > task.deadline:
+        return _TaskResult(None, math.inf, 0, "timeout")
+    solver = _worker_solver
+    start_nodes = solver._nodes
+    solver._cancel_event = _worker_cancel_event
+    solver._deadline = (
+        time.perf_counter() + task.deadline - time.time()
+        if task.deadline is not None
+        else None
+    )
+    solver.table.generation = task.threshold
+    path = list(task.prefix)
+    try:
+        found = solver._search(
+            task.state, len(task.prefix), task.threshold, task.last_face, path
+        )
+    except _SearchStopped as stop:
+        return _TaskResult(None, math.inf, solver._nodes - start_nodes, stop.status)
+    nodes = solver._nodes - start_nodes
+    if found is True:
+        return _TaskResult(path, math.inf, nodes, "solved")
+    return _TaskResult(None, found, nodes, "exhausted")
+
+
+class ParallelIDASolver:
+    """
+    Optimal IDA* solver that spreads each iteration over a process pool.
+
+    For every threshold the search tree is expanded in the parent down to
+    split_depth; each remaining prefix becomes a task on the pool's shared
+    queue. Idle workers take the next subtree as soon as they finish one, so
+    uneven subtrees balance out the way work stealing would, and a deeper
+    split gives finer-grained work. The first solution found sets a shared
+    event that makes the other workers abandon their subtrees within a few
+    thousand nodes.
+
+    Pattern database tables are copied once into shared memory and mapped by
+    every worker instead of being pickled to each of them.
+
+    The solver owns a pool and shared memory blocks; use it as a context
+    manager or call close().
+    """
+
+    default_databases = ("corner_permutation", "corner_orientation", "edge_orientation")
+    # Nodes between deadline checks in the workers and the frontier; the
+    # default of IDASolver is larger than most split subtrees.
+    check_interval = 64
+
+    def __init__(
+        self,
+        processes: int | None = None,
+        split_depth: int = 2,
+        database_names: tuple[str, ...] = default_databases,
+        table_size: int = 1 << 18,
+    ) -> None:
+        """
+        Start the worker pool.
+
+        Args:
+            processes: Number of workers. Defaults to os.cpu_count().
+            split_depth: Depth at which the tree is cut into tasks.
+            database_names: Pattern databases combined into the heuristic.
+            table_size: Transposition table slots per worker.
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self.split_depth = split_depth
+        databases = [PatternDatabase.get(name) for name in database_names]
+        self.heuristic = MaxHeuristic(*databases)
+        self._successors = IDASolver._build_successors()
+        self._blocks = []
+        for database in databases:
+            block = SharedMemory(create=True, size=database.size)
+            block.buf[: database.size] = database.table
+            self._blocks.append(block)
+        shared_tables = [
+            (database.name, block.name)
+            for database, block in zip(databases, self._blocks)
+        ]
+        self._cancel_event = multiprocessing.Event()
+        self._pool = multiprocessing.Pool(
+            self.processes,
+            initializer=_init_worker,
+            initargs=(
+                shared_tables,
+                self._cancel_event,
+                table_size,
+                ParallelIDASolver.check_interval,
+            ),
+        )
+
+    def __enter__(self) -> "ParallelIDASolver":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stop the workers and release the shared memory.
+        """
+        if self._pool is None:
+            return
+        self._pool.terminate()
+        self._pool.join()
+        self._pool = None
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def solve(
+        self, cube: Cube, max_depth: int = 20, timeout: float | None = None
+    ) -> SolveResult:
+        """
+        Find an optimal solution for a sticker Cube.
+
+        Args:
+            cube: Cube to solve. It is not modified.
+            max_depth: Longest solution to look for.
+            timeout: Seconds after which the search gives up.
+
+        Returns:
+            SolveResult with node counts summed over all workers.
+
+        Raises:
+            ValueError: If the cube is not solvable.
+        """
+        Validator.validate_state(StateCodec.encode(cube))
+        return self.solve_state(CompactCube.from_cube(cube), max_depth, timeout)
+
+    def solve_state(
+        self,
+        state: tuple[int, ...],
+        max_depth: int = 20,
+        timeout: float | None = None,
+    ) -> SolveResult:
+        """
+        Find an optimal solution for a compact state.
+
+        Args:
+            state: CompactCube state, assumed solvable.
+            max_depth: Longest solution to look for.
+            timeout: Seconds after which the search gives up.
+
+        Returns:
+            SolveResult with node counts summed over all workers.
+        """
+        started = time.perf_counter()
+        deadline = time.time() + timeout if timeout is not None else None
+        self._cancel_event.clear()
+        nodes = 0
+        threshold = self.heuristic(state)
+        while threshold <= max_depth:
+            try:
+                tasks, minimum, solution, frontier_nodes = self._expand_frontier(
+                    state, threshold, deadline
+                )
+            except _SearchStopped as stop:
+                return SolveResult(
+                    None, stop.status, nodes, time.perf_counter() - started, threshold
+                )
+            nodes += frontier_nodes
+            if solution is not None:
+                return SolveResult(
+                    solution, "solved", nodes, time.perf_counter() - started, len(solution)
+                )
+
+            moves, status = None, None
+            results = self._pool.imap_unordered(_search_task, tasks)
+            for result in results:
+                nodes += result.nodes
+                if status is not None:
+                    continue
+                if result.status == "exhausted":
+                    minimum = min(minimum, result.minimum)
+                    continue
+                # First solution or timeout: stop the rest and drain the queue.
+                self._cancel_event.set()
+                moves, status = result.moves, result.status
+            if status is not None:
+                elapsed = time.perf_counter() - started
+                bound = len(moves) if moves is not None else threshold
+                return SolveResult(moves, status, nodes, elapsed, bound)
+            threshold = minimum
+        return SolveResult(
+            None, "exhausted", nodes, time.perf_counter() - started, threshold
+        )
+
+    def _expand_frontier(
+        self,
+        state: tuple[int, ...],
+        threshold: int,
+        deadline: float | None,
+    ) -> tuple[list[_Task], float, list[str] | None, int]:
+        """
+        Cut the tree at split_depth into tasks for one threshold.
+
+        Returns:
+            The tasks, the smallest f-value pruned before the split depth, a
+            solution if one is shorter than the split depth, and the number
+            of nodes expanded.
+
+        Raises:
+            _SearchStopped: If the deadline passes, checked at the start and
+                            every check_interval nodes.
+        """
+        tasks = []
+        minimum = math.inf
+        nodes = 0
+        stack = [(state, (), None)]
+        while stack:
+            if (
+                deadline is not None
+                and nodes % ParallelIDASolver.check_interval == 0
+                and time.time() > deadline
+            ):
+                raise _SearchStopped("timeout")
+            node, prefix, last_face = stack.pop()
+            estimate = len(prefix) + self.heuristic(node)
+            if estimate > threshold:
+                minimum = min(minimum, estimate)
+                continue
+            if node == CompactCube.solved:
+                return [], minimum, list(prefix), nodes
+            if len(prefix) == self.split_depth:
+                tasks.append(_Task(node, prefix, last_face, threshold, deadline))
+                continue
+            nodes += 1
+            for move, face in reversed(self._successors[last_face]):
+                stack.append((CompactCube.apply(node, move), prefix + (move,), face))
+        return tasks, minimum, None, nodes
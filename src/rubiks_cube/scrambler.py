@@ -0,0 +1,120 @@
+from .cube import Cube, _random_rotations
+from .notation import Notation
+from .slim_cube import SlimCube
+from .state_codec import StateCodec
+import multiprocessing
+import random
+
+
+def _scramble_batch(task: tuple[int, int, int, int, bool]) -> list:
+    """
+    Generate a range of scrambles.
+
+    Runs in worker processes, so it must stay a module-level function.
+
+    Args:
+        task: Seed, first and end scramble number, scramble length and
+              whether to return 54-byte states instead of move lists.
+
+    Returns:
+        The move lists or states of the scrambles, in order.
+    """
+    seed, start, stop, length, encode = task
+    results = []
+    for number in range(start, stop):
+        rotations = _random_rotations(length, Scrambler.stream(seed, number))
+        if encode:
+            stickers = bytearray(StateCodec.solved_state)
+            for rotation in rotations:
+                stickers[:] = SlimCube.rotation_getters[rotation](stickers)
+            results.append(bytes(stickers))
+        else:
+            results.append([Notation.from_rotation(*rotation) for rotation in rotations])
+    return results
+
+
+class Scrambler:
+    """
+    Reproducible scrambles, one at a time or in bulk.
+
+    Scrambles are drawn like Cube.shuffle: quarter turns that never undo the
+    previous turn, exactly as many as requested. In bulk, scramble number n
+    of a seed draws from its own random stream, Scrambler.stream(seed, n),
+    so the output depends only on the seed, never on the number of worker
+    processes or how the work is split between them, and
+    cube.shuffle(length, rng=Scrambler.stream(seed, n)) reproduces any
+    single scramble.
+    """
+
+    def __init__(self, seed: int = 0, processes: int = 1, batch_size: int = 1000) -> None:
+        """
+        Initialize the scrambler.
+
+        Args:
+            seed: Seed from which every scramble derives its stream.
+            processes: Number of worker processes; 1 generates in the
+                       calling process.
+            batch_size: Scrambles per worker task.
+        """
+        self.seed = seed
+        self.processes = processes
+        self.batch_size = batch_size
+
+    @staticmethod
+    def stream(seed: int, number: int) -> random.Random:
+        """
+        Return the independent random stream of one scramble of a seed.
+        """
+        return random.Random(f"{seed}:{number}")
+
+    @staticmethod
+    def scramble(length: int = 35, rng: random.Random | int | None = None) -> list[str]:
+        """
+        Draw a single scramble.
+
+        Args:
+            length: Exact number of quarter turns.
+            rng: Random instance or seed; the global random module is used
+                 if omitted.
+
+        Returns:
+            Move tokens, e.g. ["R", "U'", "F"].
+        """
+        if rng is None:
+            rng = random
+        elif not isinstance(rng, random.Random):
+            rng = random.Random(rng)
+        return [
+            Notation.from_rotation(*rotation) for rotation in _random_rotations(length, rng)
+        ]
+
+    def scrambles(self, count: int, length: int = 35) -> list[list[str]]:
+        """
+        Generate the first count scrambles of the seed as move lists.
+        """
+        return self._generate(count, length, False)
+
+    def states(self, count: int, length: int = 35) -> list[bytes]:
+        """
+        Generate the first count scrambles of the seed as 54-byte sticker
+        encodings.
+        """
+        return self._generate(count, length, True)
+
+    def cubes(self, count: int, length: int = 35) -> list[Cube]:
+        """
+        Generate the first count scrambles of the seed as sticker Cubes.
+        """
+        return [StateCodec.decode(state) for state in self.states(count, length)]
+
+    def _generate(self, count: int, length: int, encode: bool) -> list:
+        tasks = [
+            (self.seed, start, min(start + self.batch_size, count), length, encode)
+            for start in range(0, count, self.batch_size)
+        ]
+        if self.processes <= 1:
+            batches = list(map(_scramble_batch, tasks))
+        else:
+            with multiprocessing.Pool(self.processes) as pool:
+                batches = pool.map(_scramble_batch, tasks)
+        return [result for batch in batches for result in batch]
@@ -0,0 +1,513 @@
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import NamedTuple
+from .colors import FaceColors
+from .cube import Cube
+from .cube_factory import CubeFactory
+from .face import Face
+from .slim_cube import SlimCube
+from .state_codec import StateCodec
+import struct
+import sys
+import time
+
+
+class CubeRecord(NamedTuple):
+    """
+    Consistent snapshot of one slot of a SharedCubeStore.
+
+    Attributes:
+        session_id: Session owning the slot.
+        moves: Number of quarter or half turns applied through the store,
+               wrapping around at 2**32.
+        state: 54-byte sticker encoding.
+    """
+
+    session_id: str
+    moves: int
+    state: bytes
+
+
+def _attach_block(name: str) -> SharedMemory:
+    """
+    Open an existing shared memory block without tracking it.
+
+    Before Python 3.13, attaching registers the block with the resource
+    tracker of the attaching process just like creating it, and a process
+    that does not share the tracker of the owner then unlinks the block when
+    it exits. Only the creating store may remove it.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+class SharedCubeStore:
+    """
+    Fixed-size cube records in shared memory, one slot per session.
+
+    Every record holds a sequence counter, a move counter, the session id and
+    the 54 stickers in the StateCodec encoding. Writes to a slot make the
+    counter odd while they run and even again afterwards, and readers retry
+    until they copy a record with the same even counter before and after
+    (a sequence lock), so readers never block the writer and never see a
+    half-written cube. Each session must have a single writing process;
+    readers may be anywhere.
+
+    Slots are claimed and released by the process that created the store,
+    e.g. the dispatcher of a session server; other processes attach by name
+    and turn, read or take over cubes without copying them.
+    """
+
+    record_format = struct.Struct("<II32s54s2x")
+    record_size = record_format.size
+    session_len = 32
+    _sequence_offset = 0
+    _moves_offset = 4
+    _session_offset = 8
+    _stickers_offset = _session_offset + session_len
+    # Seconds a reader retries a slot whose writer makes no progress, e.g.
+    # because it died in the middle of a write.
+    read_timeout = 1.0
+    _retry_check_interval = 1024
+
+    def __init__(self, slots: int, name: str | None = None) -> None:
+        """
+        Create a store with empty slots.
+
+        Args:
+            slots: Number of cubes the store can hold.
+            name: Name of the shared memory block; chosen by the system if
+                  omitted.
+
+        Raises:
+            ValueError: If slots is not positive.
+        """
+        if slots <= 0:
+            raise ValueError("Store must have at least one slot!")
+        self._block = SharedMemory(
+            name=name, create=True, size=slots * SharedCubeStore.record_size
+        )
+        self._owner = True
+        self._setup(slots)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedCubeStore":
+        """
+        Open a store created by another process.
+
+        Args:
+            name: The name of the creating store.
+
+        Returns:
+            Store sharing the same records.
+        """
+        store = cls.__new__(cls)
+        store._block = _attach_block(name)
+        store._owner = False
+        store._setup(store._block.size // SharedCubeStore.record_size)
+        return store
+
+    def _setup(self, slots: int) -> None:
+        self.name = self._block.name
+        self.slots = slots
+        self._buffer = self._block.buf
+        self._sessions: dict[str, int] = {}
+
+    def __enter__(self) -> "SharedCubeStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory; the creating store also removes it.
+
+        Views of the store must not be used afterwards.
+        """
+        if self._buffer is None:
+            return
+        self._buffer.release()
+        self._buffer = None
+        self._block.close()
+        if self._owner:
+            self._block.unlink()
+
+    def allocate(
+        self, session_id: str, state: bytes = StateCodec.solved_state
+    ) -> int:
+        """
+        Claim a free slot for a session and store its cube.
+
+        Args:
+            session_id: Session id of at most 32 UTF-8 bytes.
+            state: Initial 54-byte sticker encoding; solved by default.
+
+        Returns:
+            The slot number.
+
+        Raises:
+            ValueError: If the id is invalid or taken, the state has the
+                        wrong length, or the store is full.
+        """
+        encoded = SharedCubeStore._encode_session(session_id)
+        if len(state) != StateCodec.state_len:
+            raise ValueError("Cube state must contain 54 stickers!")
+        if self._find(session_id) is not None:
+            raise ValueError(f"Session already has a slot: {session_id}!")
+        for slot in range(self.slots):
+            if self._session_field(slot) == bytes(SharedCubeStore.session_len):
+                self._write(slot, encoded, 0, state)
+                self._sessions[session_id] = slot
+                return slot
+        raise ValueError("Cube store is full!")
+
+    def release(self, session_id: str) -> None:
+        """
+        Free the slot of a session.
+
+        Raises:
+            ValueError: If the session has no slot.
+        """
+        slot = self.slot_of(session_id)
+        self._write(
+            slot,
+            bytes(SharedCubeStore.session_len),
+            0,
+            bytes(StateCodec.state_len),
+        )
+        self._sessions.pop(session_id, None)
+
+    def slot_of(self, session_id: str) -> int:
+        """
+        Return the slot of a session.
+
+        Raises:
+            ValueError: If the session has no slot.
+        """
+        slot = self._find(session_id)
+        if slot is None:
+            raise ValueError(f"Unknown session: {session_id}!")
+        return slot
+
+    def sessions(self) -> dict[str, int]:
+        """
+        Return the slot of every session in the store.
+        """
+        sessions = {}
+        for slot in range(self.slots):
+            field = self._session_field(slot)
+            if any(field):
+                sessions[field.rstrip(b"\0").decode("utf-8")] = slot
+        return sessions
+
+    def read(self, slot: int) -> CubeRecord:
+        """
+        Copy a consistent snapshot of a slot.
+
+        Retries while a writer is busy with the slot instead of waiting for
+        a lock.
+
+        Raises:
+            TimeoutError: If the slot stays mid-write for read_timeout
+                          seconds, e.g. because its writer died.
+        """
+        buffer = self._buffer
+        offset = slot * SharedCubeStore.record_size
+        unpack_from = SharedCubeStore.record_format.unpack_from
+        retries = 0
+        deadline = None
+        while True:
+            sequence, moves, session, state = unpack_from(buffer, offset)
+            if not sequence & 1:
+                (after,) = struct.unpack_from("<I", buffer, offset)
+                if after == sequence:
+                    return CubeRecord(
+                        session.rstrip(b"\0").decode("utf-8"), moves, state
+                    )
+            retries += 1
+            if retries % SharedCubeStore._retry_check_interval == 0:
+                now = time.perf_counter()
+                if deadline is None:
+                    deadline = now + SharedCubeStore.read_timeout
+                elif now > deadline:
+                    raise TimeoutError(f"Slot {slot} is stuck in a write!")
+
+    def write(self, slot: int, state: bytes, moves: int | None = None) -> None:
+        """
+        Replace the cube of a slot.
+
+        Args:
+            slot: Slot number.
+            state: 54-byte sticker encoding.
+            moves: New move counter; unchanged if omitted.
+
+        Raises:
+            ValueError: If the state has the wrong length.
+        """
+        if len(state) != StateCodec.state_len:
+            raise ValueError("Cube state must contain 54 stickers!")
+        if moves is None:
+            moves = self.read(slot).moves
+        self._write(slot, self._session_field(slot), moves, state)
+
+    def view(self, session_id: str) -> "SharedCubeView":
+        """
+        Return a view that reads and turns a session's cube in place.
+
+        Raises:
+            ValueError: If the session has no slot.
+        """
+        return SharedCubeView(self, self.slot_of(session_id))
+
+    @staticmethod
+    def _encode_session(session_id: str) -> bytes:
+        """
+        Raises:
+            ValueError: If the id is empty or longer than 32 UTF-8 bytes.
+        """
+        encoded = session_id.encode("utf-8")
+        if not encoded or len(encoded) > SharedCubeStore.session_len or b"\0" in encoded:
+            raise ValueError("Session id must be 1 to 32 bytes without NUL!")
+        return encoded.ljust(SharedCubeStore.session_len, b"\0")
+
+    def _session_field(self, slot: int) -> bytes:
+        start = slot * SharedCubeStore.record_size + SharedCubeStore._session_offset
+        return bytes(self._buffer[start : start + SharedCubeStore.session_len])
+
+    def _find(self, session_id: str) -> int | None:
+        """
+        Look a session up, first in the local cache, which may be stale
+        when another process allocated or released the slot.
+        """
+        encoded = SharedCubeStore._encode_session(session_id)
+        slot = self._sessions.get(session_id)
+        if slot is not None and self._session_field(slot) == encoded:
+            return slot
+        for slot in range(self.slots):
+            if self._session_field(slot) == encoded:
+                self._sessions[session_id] = slot
+                return slot
+        return None
+
+    def _write(self, slot: int, session: bytes, moves: int, state: bytes) -> None:
+        offset = slot * SharedCubeStore.record_size
+        buffer = self._buffer
+        (sequence,) = struct.unpack_from("<I", buffer, offset)
+        struct.pack_into("<I", buffer, offset, (sequence + 1) & 0xFFFFFFFF)
+        SharedCubeStore.record_format.pack_into(
+            buffer, offset, (sequence + 1) & 0xFFFFFFFF, moves, session, state
+        )
+        struct.pack_into("<I", buffer, offset, (sequence + 2) & 0xFFFFFFFF)
+
+
+class SharedCubeView:
+    """
+    Cube living in a slot of a SharedCubeStore.
+
+    Offers the methods of SlimCube, but the stickers are read from and
+    turned in the shared record itself, so every process holding a view of
+    the slot sees the same cube and nothing is copied when another process
+    takes the session over.
+
+    It can also stand in for a Cube where CubeView and CubeController use
+    one: the face attributes, _get_face_by_key() and rotate_face() work on
+    SharedFace proxies backed by the slot. Functions that read the faces'
+    internals, such as StateCodec.encode(), need to_cube() instead.
+    """
+
+    __slots__ = (
+        "_store",
+        "slot",
+        "_offset",
+        "_faces_dict",
+        "_red_face",
+        "_orange_face",
+        "_green_face",
+        "_blue_face",
+        "_white_face",
+        "_yellow_face",
+    )
+
+    def __init__(self, store: SharedCubeStore, slot: int) -> None:
+        """
+        Args:
+            store: Store holding the cube.
+            slot: Slot number of the cube.
+        """
+        self._store = store
+        self.slot = slot
+        self._offset = slot * SharedCubeStore.record_size
+        self._faces_dict = {key: SharedFace(self, key) for key in StateCodec.face_keys}
+        (
+            self._red_face,
+            self._orange_face,
+            self._green_face,
+            self._blue_face,
+            self._white_face,
+            self._yellow_face,
+        ) = self._faces_dict.values()
+
+    def _get_face_by_key(self, face_key: str) -> "SharedFace":
+        """
+        Return the face proxy for a color key, like Cube._get_face_by_key.
+        """
+        return self._faces_dict[face_key]
+
+    def rotate_face(self, rotated_face: "SharedFace", clockwise: bool) -> None:
+        """
+        Rotate a face proxy and its neighbors, like Cube.rotate_face.
+        """
+        self.rotate(rotated_face.key, clockwise)
+
+    def rotate(self, face_key: str, clockwise: bool) -> None:
+        """
+        Rotate a face and its neighbors, like Cube.rotate_face.
+
+        Args:
+            face_key: One of 'r', 'o', 'g', 'b', 'w', 'y'.
+            clockwise: True for clockwise, False for counter-clockwise.
+        """
+        self._turn(SlimCube.rotation_getters[face_key, clockwise])
+
+    def apply(self, moves: list[str]) -> None:
+        """
+        Apply a move sequence in place, one sequence-locked write per move.
+
+        Args:
+            moves: Move tokens, e.g. Notation.parse("R U2 D'").
+        """
+        for move in moves:
+            self._turn(SlimCube.move_getters[move])
+
+    def _turn(self, permutation) -> None:
+        buffer = self._store._buffer
+        offset = self._offset
+        start = offset + SharedCubeStore._stickers_offset
+        stop = start + StateCodec.state_len
+        sequence, moves = struct.unpack_from("<II", buffer, offset)
+        struct.pack_into("<I", buffer, offset, (sequence + 1) & 0xFFFFFFFF)
+        buffer[start:stop] = bytes(permutation(buffer[start:stop]))
+        struct.pack_into(
+            "<I",
+            buffer,
+            offset + SharedCubeStore._moves_offset,
+            (moves + 1) & 0xFFFFFFFF,
+        )
+        struct.pack_into("<I", buffer, offset, (sequence + 2) & 0xFFFFFFFF)
+
+    @property
+    def moves(self) -> int:
+        """
+        Number of moves applied to the cube through the store.
+        """
+        return self._store.read(self.slot).moves
+
+    def encode(self) -> bytes:
+        """
+        Return a consistent copy of the 54-byte sticker encoding.
+        """
+        return self._store.read(self.slot).state
+
+    def is_solved(self) -> bool:
+        """
+        Check if every sticker shows the color of its face.
+        """
+        return self.encode() == StateCodec.solved_state
+
+    def get_face_matrix(self, face_key: str) -> list[list[FaceColors]]:
+        """
+        Return the colors of one face as a new matrix.
+
+        Args:
+            face_key: One of 'r', 'o', 'g', 'b', 'w', 'y'.
+
+        Returns:
+            3x3 list of FaceColors, as Face.get_face_matrix returns it.
+        """
+        state = self.encode()
+        colors = StateCodec.colors
+        edge_len = Face.edge_len
+        base = StateCodec._key_codes[face_key] * StateCodec.face_size
+        return [
+            [colors[code] for code in state[i : i + edge_len]]
+            for i in range(base, base + StateCodec.face_size, edge_len)
+        ]
+
+    def to_cube(self) -> Cube:
+        """
+        Build a new Cube with the current sticker colors.
+        """
+        return StateCodec.decode(self.encode())
+
+
+class SharedFace:
+    """
+    Face of a SharedCubeView with the reading part of the Face API.
+
+    Colors are read from the shared record on every call, so a proxy never
+    goes stale when another process turns the cube.
+    """
+
+    __slots__ = ("_view", "key")
+
+    def __init__(self, view: SharedCubeView, key: str) -> None:
+        """
+        Args:
+            view: View of the cube the face belongs to.
+            key: One of 'r', 'o', 'g', 'b', 'w', 'y'.
+        """
+        self._view = view
+        self.key = key
+
+    def get_face_matrix(self) -> list[list[FaceColors]]:
+        """
+        Return the current colors of the face as a new 3x3 matrix.
+        """
+        return self._view.get_face_matrix(self.key)
+
+    def get_neighbor_by_key(self, key: str) -> "SharedFace":
+        """
+        Retrieve an adjacent face by direction key, like
+        Face.get_neighbor_by_key.
+
+        Args:
+            key: 'l' for left, 'r' for right, 'u' for up, 'd' for down.
+
+        Raises:
+            KeyError: If the direction key is invalid.
+        """
+        if key not in _neighbor_keys[self.key]:
+            raise KeyError(f"Invalid neighbor key: {key}")
+        return self._view._get_face_by_key(_neighbor_keys[self.key][key])
+
+    def is_uniform(self) -> bool:
+        """
+        Check if all cells on the face are the same color.
+        """
+        matrix = self.get_face_matrix()
+        return all(cell == matrix[1][1] for row in matrix for cell in row)
+
+
+def _build_neighbor_keys() -> dict[str, dict[str, str]]:
+    """
+    Read the neighbor layout of every face off a Cube, so that proxies
+    resolve directions exactly as Cube's faces do.
+    """
+    cube = CubeFactory().create_solved_cube()
+    return {
+        key: {
+            direction: cube._face_keys[face.get_neighbor_by_key(direction)]
+            for direction in "lrud"
+        }
+        for key, face in cube._faces_dict.items()
+    }
+
+
+_neighbor_keys = _build_neighbor_keys()
@@ -0,0 +1,150 @@
+from operator import itemgetter
+from .colors import FaceColors
+from .cube import Cube
+from .face import Face
+from .move_tables import sticker_permutations
+from .notation import Notation
+from .state_codec import StateCodec
+
+
+def _build_rotations() -> dict[tuple[str, bool], itemgetter]:
+    """
+    Turn the shared sticker permutation of every quarter turn into a getter.
+    """
+    return {
+        move: itemgetter(*permutation)
+        for move, permutation in sticker_permutations.items()
+    }
+
+
+def _build_moves(
+    rotations: dict[tuple[str, bool], itemgetter],
+) -> dict[str, itemgetter]:
+    """
+    Compose the quarter-turn getters into one lookup per move token.
+    """
+    moves = {}
+    for move in Notation.moves:
+        permutation = tuple(range(StateCodec.state_len))
+        for face_key, clockwise in Notation.to_rotations(move):
+            permutation = rotations[face_key, clockwise](permutation)
+        moves[move] = itemgetter(*permutation)
+    return moves
+
+
+class SlimCube:
+    """
+    Memory-compact sticker cube.
+
+    Stores the 54 stickers as small-int color codes in a single bytearray
+    (StateCodec order) instead of six Face objects holding nested lists of
+    FaceColors, and turns through the sticker permutations of move_tables
+    shared by all instances instead of per-instance neighbor wiring, so a
+    SlimCube is two small objects regardless of how many are alive.
+    """
+
+    __slots__ = ("_stickers",)
+
+    # Turns shared by every engine storing the StateCodec encoding: called
+    # with the 54 stickers, a getter returns them as they are after the
+    # turn. Keyed by (face_key, clockwise) and by Notation.moves tokens.
+    rotation_getters = _build_rotations()
+    move_getters = _build_moves(rotation_getters)
+
+    def __init__(self, state: bytes = StateCodec.solved_state) -> None:
+        """
+        Initialize the cube from a sticker encoding.
+
+        Args:
+            state: 54 bytes of color codes as produced by StateCodec.encode().
+                   Defaults to the solved cube.
+
+        Raises:
+            ValueError: If the state has the wrong length.
+        """
+        if len(state) != StateCodec.state_len:
+            raise ValueError("Cube state must contain 54 stickers!")
+        self._stickers = bytearray(state)
+
+    @staticmethod
+    def from_cube(cube: Cube) -> "SlimCube":
+        """
+        Build a SlimCube with the sticker colors of a Cube.
+        """
+        return SlimCube(StateCodec.encode(cube))
+
+    def to_cube(self) -> Cube:
+        """
+        Build a new Cube with the sticker colors of this cube.
+        """
+        return StateCodec.decode(bytes(self._stickers))
+
+    def encode(self) -> bytes:
+        """
+        Return the 54-byte sticker encoding of this cube.
+        """
+        return bytes(self._stickers)
+
+    def copy(self) -> "SlimCube":
+        """
+        Return an independent copy of this cube.
+        """
+        return SlimCube(self._stickers)
+
+    def rotate(self, face_key: str, clockwise: bool) -> None:
+        """
+        Rotate a face and its neighbors, like Cube.rotate_face.
+
+        Args:
+            face_key: One of 'r', 'o', 'g', 'b', 'w', 'y'.
+            clockwise: True for clockwise, False for counter-clockwise.
+        """
+        self._stickers[:] = SlimCube.rotation_getters[face_key, clockwise](
+            self._stickers
+        )
+
+    def apply(self, moves: list[str]) -> None:
+        """
+        Apply a move sequence in-place.
+
+        Args:
+            moves: Move tokens, e.g. Notation.parse("R U2 D'").
+        """
+        stickers = self._stickers
+        move_getters = SlimCube.move_getters
+        for move in moves:
+            stickers[:] = move_getters[move](stickers)
+
+    def is_solved(self) -> bool:
+        """
+        Check if the cube is in a solved state.
+
+        Centers never move, so the cube is solved exactly when every sticker
+        shows the color of its face.
+        """
+        return self._stickers == StateCodec.solved_state
+
+    def get_face_matrix(self, face_key: str) -> list[list[FaceColors]]:
+        """
+        Return the colors of one face as a new matrix.
+
+        Args:
+            face_key: One of 'r', 'o', 'g', 'b', 'w', 'y'.
+
+        Returns:
+            3x3 list of FaceColors, as Face.get_face_matrix returns it.
+        """
+        colors = StateCodec.colors
+        edge_len = Face.edge_len
+        base = StateCodec._key_codes[face_key] * StateCodec.face_size
+        return [
+            [colors[code] for code in self._stickers[i : i + edge_len]]
+            for i in range(base, base + StateCodec.face_size, edge_len)
+        ]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SlimCube):
+            return NotImplemented
+        return self._stickers == other._stickers
+
+    __hash__ = None
@@ -0,0 +1,213 @@
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple
+from .compact_cube import CompactCube
+from .cube import Cube
+from .ida_solver import IDASolver, SolveResult
+from .state_codec import StateCodec
+from .symmetry import CubeSymmetry
+from .validator import Validator
+import sqlite3
+import time
+
+
+class CacheStats(NamedTuple):
+    """
+    Counters of a SolutionCache.
+
+    Attributes:
+        lookups: Number of solve requests.
+        memory_hits: Requests answered from the in-memory tier.
+        disk_hits: Requests answered from the SQLite tier.
+        misses: Requests passed on to the solver.
+        solver_seconds: Time spent in the solver on misses.
+        saved_seconds: Solver time the hits would have cost, minus the time
+                       the lookups took.
+    """
+
+    lookups: int
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    solver_seconds: float
+    saved_seconds: float
+
+    @property
+    def hit_rate(self) -> float:
+        return (self.memory_hits + self.disk_hits) / self.lookups if self.lookups else 0.0
+
+
+class SolutionCache:
+    """
+    Cache of solver results in front of any solver.
+
+    States are keyed by their canonical form under the 48 cube symmetries,
+    so a scramble, its rotations, recolorings and mirror images share one
+    entry. Solutions are stored for the canonical state and relabeled back
+    to the caller's orientation on every hit. Recently used entries are
+    kept in an in-memory LRU tier; if a path is given, all entries are also
+    stored in an SQLite database that persists across processes and runs.
+
+    Only solved results are cached, together with the time the solver took
+    to find them, which the statistics report as saved time on later hits.
+    """
+
+    def __init__(
+        self,
+        solver: IDASolver | None = None,
+        path: str | Path | None = None,
+        max_size: int = 1024,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            solver: Solver with a solve_state(state, max_depth, timeout)
+                    method, such as IDASolver or ParallelIDASolver. Defaults
+                    to a new IDASolver.
+            path: SQLite database file for the persistent tier; None keeps
+                  the cache in memory only.
+            max_size: Maximum number of entries in the in-memory tier.
+
+        Raises:
+            ValueError: If max_size is not positive.
+        """
+        if max_size < 1:
+            raise ValueError("Cache size must be positive!")
+        self.solver = solver if solver is not None else IDASolver()
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[tuple[str, ...], int, float]] = (
+            OrderedDict()
+        )
+        self._connection = None
+        if path is not None:
+            self._connection = sqlite3.connect(path)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS solutions ("
+                "state BLOB PRIMARY KEY, moves TEXT NOT NULL, "
+                "lower_bound INTEGER NOT NULL, seconds REAL NOT NULL)"
+            )
+            self._connection.commit()
+        self._lookups = 0
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._solver_seconds = 0.0
+        self._saved_seconds = 0.0
+
+    def __enter__(self) -> "SolutionCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self) -> None:
+        """
+        Close the SQLite database.
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def solve(
+        self, cube: Cube, max_depth: int = 20, timeout: float | None = None
+    ) -> SolveResult:
+        """
+        Find a solution for a sticker Cube, from the cache if possible.
+
+        Raises:
+            ValueError: If the cube is not solvable.
+        """
+        Validator.validate_state(StateCodec.encode(cube))
+        return self.solve_state(CompactCube.from_cube(cube), max_depth, timeout)
+
+    def solve_state(
+        self,
+        state: tuple[int, ...],
+        max_depth: int = 20,
+        timeout: float | None = None,
+    ) -> SolveResult:
+        """
+        Find a solution for a compact state, from the cache if possible.
+
+        Args:
+            state: CompactCube state, assumed solvable.
+            max_depth: Longest solution to accept.
+            timeout: Seconds after which the solver gives up on a miss.
+
+        Returns:
+            SolveResult in the caller's orientation. Hits report no nodes
+            and the lookup time as elapsed.
+        """
+        started = time.perf_counter()
+        self._lookups += 1
+        canonical, symmetry = CubeSymmetry.canonical(state)
+        key = bytes(canonical)
+
+        entry = self._entries.get(key)
+        from_disk = False
+        if entry is not None:
+            self._entries.move_to_end(key)
+        elif self._connection is not None:
+            row = self._connection.execute(
+                "SELECT moves, lower_bound, seconds FROM solutions WHERE state = ?",
+                (key,),
+            ).fetchone()
+            if row is not None:
+                entry = (tuple(row[0].split()), row[1], row[2])
+                self._remember(key, entry)
+                from_disk = True
+        # A cached solution longer than the caller accepts counts as a miss.
+        if entry is not None and len(entry[0]) <= max_depth:
+            if from_disk:
+                self._disk_hits += 1
+            else:
+                self._memory_hits += 1
+            moves = CubeSymmetry.relabel(list(entry[0]), CubeSymmetry.inverse(symmetry))
+            elapsed = time.perf_counter() - started
+            self._saved_seconds += entry[2] - elapsed
+            return SolveResult(moves, "solved", 0, elapsed, entry[1])
+
+        self._misses += 1
+        result = self.solver.solve_state(state, max_depth, timeout)
+        self._solver_seconds += result.elapsed
+        if result.status == "solved":
+            entry = (
+                tuple(CubeSymmetry.relabel(result.moves, symmetry)),
+                result.lower_bound,
+                result.elapsed,
+            )
+            self._remember(key, entry)
+            if self._connection is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?)",
+                    (key, " ".join(entry[0]), entry[1], entry[2]),
+                )
+                self._connection.commit()
+        return result
+
+    def stats(self) -> CacheStats:
+        """
+        Return the counters collected since the cache was created.
+        """
+        return CacheStats(
+            self._lookups,
+            self._memory_hits,
+            self._disk_hits,
+            self._misses,
+            self._solver_seconds,
+            self._saved_seconds,
+        )
+
+    def _remember(self, key: bytes, entry: tuple[tuple[str, ...], int, float]) -> None:
+        """
+        Put an entry into the in-memory tier, evicting the least recently
+        used one if it is full.
+        """
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
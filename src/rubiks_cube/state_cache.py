@@ -0,0 +1,92 @@
+from collections import OrderedDict
+from pathlib import Path
+import os
+
+
+class StateCache:
+    """
+    Bounded LRU cache of validated cube states loaded from files.
+
+    Entries are keyed by absolute file path and remember the file's
+    modification time and size; a lookup only hits if the file on disk still
+    has the same mtime and size, so edited files are reloaded automatically.
+    Values are 54-byte sticker encodings (see StateCodec), which are
+    immutable and can be turned into any number of fresh Cube instances.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of files kept; the least recently used
+                      entry is evicted first.
+
+        Raises:
+            ValueError: If max_size is not positive.
+        """
+        if max_size < 1:
+            raise ValueError("Cache size must be positive!")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[int, int, bytes]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return os.path.abspath(path)
+
+    def get(self, path: Path) -> bytes | None:
+        """
+        Look up the state stored for a file.
+
+        Args:
+            path: Path of the cube file.
+
+        Returns:
+            The cached state, or None if the file is unknown, missing or has
+            changed since it was cached.
+        """
+        key = StateCache._key(path)
+        entry = self._entries.get(key)
+        if entry is not None:
+            try:
+                file_stat = os.stat(key)
+            except OSError:
+                file_stat = None
+            if file_stat is not None and entry[:2] == (
+                file_stat.st_mtime_ns,
+                file_stat.st_size,
+            ):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, path: Path, file_stat: os.stat_result, state: bytes) -> None:
+        """
+        Store the validated state of a file.
+
+        Args:
+            path: Path of the cube file.
+            file_stat: Result of os.stat() taken before the file was read.
+            state: Validated 54-byte sticker encoding.
+        """
+        key = StateCache._key(path)
+        self._entries[key] = (file_stat.st_mtime_ns, file_stat.st_size, bytes(state))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drop all entries and reset the statistics.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,125 @@
+from .colors import FaceColors
+from .cube import Cube
+from .face import Face
+
+
+class StateCodec:
+    """
+    Converts cubes to and from a compact 54-byte sticker encoding.
+
+    The encoding stores one byte per sticker, face by face in the order
+    red, orange, green, blue, white, yellow, and row by row inside each face.
+    Each byte is the index of the sticker's color in that same face order,
+    so the solved cube encodes as nine 0s, nine 1s, ..., nine 5s.
+    """
+
+    state_len = 54
+    face_size = Face.edge_len * Face.edge_len
+    face_keys = ("r", "o", "g", "b", "w", "y")
+    face_names = ("red", "orange", "green", "blue", "white", "yellow")
+    colors = (
+        FaceColors.RED,
+        FaceColors.ORANGE,
+        FaceColors.GREEN,
+        FaceColors.BLUE,
+        FaceColors.WHITE,
+        FaceColors.YELLOW,
+    )
+    _color_codes = {color: code for code, color in enumerate(colors)}
+    _key_codes = {key: code for code, key in enumerate(face_keys)}
+    solved_state = bytes(code for code in range(6) for _ in range(9))
+    center_indices = tuple(range(4, 54, 9))
+
+    @staticmethod
+    def encode(cube: Cube) -> bytes:
+        """
+        Encode the sticker colors of a cube.
+
+        Args:
+            cube: Cube instance to encode.
+
+        Returns:
+            54 bytes of color codes.
+        """
+        codes = StateCodec._color_codes
+        return bytes(
+            codes[cell]
+            for face in cube._faces_dict.values()
+            for row in face._matrix
+            for cell in row
+        )
+
+    @staticmethod
+    def decode(state: bytes) -> Cube:
+        """
+        Build a new Cube from a sticker encoding.
+
+        Args:
+            state: 54 bytes of color codes as produced by encode().
+
+        Returns:
+            A Cube instance with the encoded sticker colors.
+
+        Raises:
+            ValueError: If the state has the wrong length.
+        """
+        if len(state) != StateCodec.state_len:
+            raise ValueError("Cube state must contain 54 stickers!")
+        colors = StateCodec.colors
+        edge_len = Face.edge_len
+        faces = [
+            Face(
+                [
+                    [colors[code] for code in state[i : i + edge_len]]
+                    for i in range(base, base + StateCodec.face_size, edge_len)
+                ]
+            )
+            for base in range(0, StateCodec.state_len, StateCodec.face_size)
+        ]
+        return Cube(faces)
+
+    @staticmethod
+    def encode_key_matrixes(faces: dict[str, list[list[str]]]) -> bytes:
+        """
+        Encode face data in the JSON file layout.
+
+        Args:
+            faces: Dict mapping face names ('red', 'orange', ...) to 3x3
+                   matrices of color keys ('r', 'o', ...).
+
+        Returns:
+            54 bytes of color codes.
+
+        Raises:
+            KeyError: If a face name or color key is not recognized.
+        """
+        codes = StateCodec._key_codes
+        return bytes(
+            codes[cell]
+            for name in StateCodec.face_names
+            for row in faces[name]
+            for cell in row
+        )
+
+    @staticmethod
+    def decode_key_matrixes(state: bytes) -> dict[str, list[list[str]]]:
+        """
+        Convert a sticker encoding back into the JSON file layout.
+
+        Args:
+            state: 54 bytes of color codes.
+
+        Returns:
+            Dict mapping face names to 3x3 matrices of color keys.
+        """
+        keys = StateCodec.face_keys
+        edge_len = Face.edge_len
+        return {
+            name: [
+                [keys[code] for code in state[i : i + edge_len]]
+                for i in range(base, base + StateCodec.face_size, edge_len)
+            ]
+            for name, base in zip(
+                StateCodec.face_names, range(0, StateCodec.state_len, StateCodec.face_size)
+            )
+        }
@@ -0,0 +1,342 @@
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from .compact_cube import CompactCube
+from .cube import Cube
+from .state_codec import StateCodec
+from .validator import Validator
+import bisect
+import heapq
+import mmap
+import random
+import struct
+import tempfile
+
+
+# File header: magic and record count.
+_header = struct.Struct("<8sQ")
+_record_size = CompactCube.corner_count + CompactCube.edge_count
+# Index entries sort as (state, record number), so the record number is
+# stored big-endian.
+_number = struct.Struct(">Q")
+_entry_size = _record_size + _number.size
+
+
+class _SortedKeys:
+    """
+    Sequence view of the states in a mapped index, for bisect.
+    """
+
+    def __init__(self, index: mmap.mmap, count: int) -> None:
+        self._index = index
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, position: int) -> bytes:
+        start = _header.size + position * _entry_size
+        return self._index[start : start + _record_size]
+
+
+def _read_entries(path: Path, read_size: int) -> Iterator[bytes]:
+    """
+    Stream the fixed-size entries of a sorted run file.
+    """
+    chunk_size = read_size - read_size % _entry_size or _entry_size
+    with open(path, "rb") as run:
+        while chunk := run.read(chunk_size):
+            for start in range(0, len(chunk), _entry_size):
+                yield chunk[start : start + _entry_size]
+
+
+class CorpusWriter:
+    """
+    Builds a state corpus in a single streaming pass.
+
+    Records are appended to the corpus file as they arrive. Their index
+    entries are collected in memory up to run_size at a time, sorted and
+    spilled to temporary run files, which close() merges into the sidecar
+    index. Memory use is therefore bounded by run_size, however large the
+    corpus grows.
+    """
+
+    read_size = 1 << 16
+
+    def __init__(self, path: str | Path, run_size: int = 1 << 20) -> None:
+        """
+        Start a new corpus, replacing any file at the path.
+
+        Args:
+            path: Corpus file; the index is written next to it with an
+                  ".idx" suffix appended.
+            run_size: Index entries sorted in memory at a time.
+
+        Raises:
+            ValueError: If run_size is not positive.
+        """
+        if run_size < 1:
+            raise ValueError("Run size must be positive!")
+        self.path = Path(path)
+        self.run_size = run_size
+        self.count = 0
+        self._records = open(self.path, "wb")
+        self._records.write(_header.pack(StateCorpus.magic, 0))
+        self._temporary = tempfile.TemporaryDirectory(dir=self.path.parent)
+        self._runs: list[Path] = []
+        self._pending: list[tuple[bytes, int]] = []
+
+    def __enter__(self) -> "CorpusWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def add(self, state: tuple[int, ...]) -> int:
+        """
+        Append a compact state.
+
+        Args:
+            state: CompactCube state, assumed solvable.
+
+        Returns:
+            The record number of the state.
+
+        Raises:
+            ValueError: If the state does not have 20 values.
+        """
+        if len(state) != _record_size:
+            raise ValueError(f"Compact state must contain {_record_size} values!")
+        record = bytes(state)
+        self._records.write(record)
+        self._pending.append((record, self.count))
+        if len(self._pending) == self.run_size:
+            self._spill()
+        self.count += 1
+        return self.count - 1
+
+    def add_cube(self, cube: Cube) -> int:
+        """
+        Append a sticker Cube.
+
+        Returns:
+            The record number of the cube.
+
+        Raises:
+            ValueError: If the cube is not solvable.
+        """
+        Validator.validate_state(StateCodec.encode(cube))
+        return self.add(CompactCube.from_cube(cube))
+
+    def extend(self, states: Iterable[tuple[int, ...]]) -> None:
+        """
+        Append compact states from any iterable, e.g. a generator.
+        """
+        for state in states:
+            self.add(state)
+
+    def close(self) -> None:
+        """
+        Finish the corpus file and merge the sorted runs into the index.
+        """
+        if self._records is None:
+            return
+        self._records.seek(0)
+        self._records.write(_header.pack(StateCorpus.magic, self.count))
+        self._records.close()
+        self._records = None
+
+        self._spill()
+        index_path = StateCorpus.index_path(self.path)
+        with open(index_path, "wb") as index:
+            index.write(_header.pack(StateCorpus.index_magic, self.count))
+            runs = [_read_entries(run, self.read_size) for run in self._runs]
+            buffer = bytearray()
+            for entry in heapq.merge(*runs):
+                buffer += entry
+                if len(buffer) >= self.read_size:
+                    index.write(buffer)
+                    buffer.clear()
+            index.write(buffer)
+        self._temporary.cleanup()
+
+    def _spill(self) -> None:
+        """
+        Sort the pending index entries and write them as a new run.
+        """
+        if not self._pending:
+            return
+        self._pending.sort()
+        path = Path(self._temporary.name) / f"run-{len(self._runs):05d}"
+        with open(path, "wb") as run:
+            run.write(
+                b"".join(record + _number.pack(number) for record, number in self._pending)
+            )
+        self._runs.append(path)
+        self._pending = []
+
+
+class StateCorpus:
+    """
+    Memory-mapped corpus of cube positions with random access.
+
+    The corpus file holds a header and fixed-size 20-byte records, the
+    CompactCube state of every position in insertion order, so record n is
+    found by offset alone. A sidecar index lists (state, record number)
+    pairs sorted by state for membership lookups by binary search. Both
+    files are mapped rather than read, so opening a corpus of any size is
+    instant and only the pages touched are loaded. Build corpora with
+    CorpusWriter.
+    """
+
+    magic = b"RCCORPUS"
+    index_magic = b"RCCINDEX"
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Open a corpus.
+
+        Args:
+            path: Corpus file written by CorpusWriter.
+
+        Raises:
+            ValueError: If the files are not a state corpus or do not belong
+                        together.
+        """
+        self.path = Path(path)
+        self._records = StateCorpus._map(self.path, StateCorpus.magic)
+        try:
+            self._index = StateCorpus._map(
+                StateCorpus.index_path(self.path), StateCorpus.index_magic
+            )
+        except (OSError, ValueError):
+            self._records.close()
+            raise
+        _, self._count = _header.unpack_from(self._records)
+        _, index_count = _header.unpack_from(self._index)
+        if (
+            index_count != self._count
+            or len(self._records) != _header.size + self._count * _record_size
+            or len(self._index) != _header.size + self._count * _entry_size
+        ):
+            self.close()
+            raise ValueError("Corpus index does not match its records!")
+        self._keys = _SortedKeys(self._index, self._count)
+
+    @staticmethod
+    def index_path(path: str | Path) -> Path:
+        """
+        Return the path of the index belonging to a corpus file.
+        """
+        path = Path(path)
+        return path.with_name(path.name + ".idx")
+
+    @staticmethod
+    def _map(path: Path, magic: bytes) -> mmap.mmap:
+        """
+        Map a corpus or index file read-only.
+
+        Raises:
+            ValueError: If the file does not start with the magic.
+        """
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mapped) < _header.size or mapped[: len(magic)] != magic:
+            mapped.close()
+            raise ValueError(f"Not a state corpus file: {path}!")
+        return mapped
+
+    def __enter__(self) -> "StateCorpus":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unmap the files.
+        """
+        self._records.close()
+        self._index.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, number: int) -> tuple[int, ...]:
+        """
+        Return the compact state of a record.
+
+        Raises:
+            IndexError: If the record number is out of range.
+        """
+        if number < 0:
+            number += self._count
+        if not 0 <= number < self._count:
+            raise IndexError("Corpus record out of range!")
+        start = _header.size + number * _record_size
+        return tuple(self._records[start : start + _record_size])
+
+    def cube(self, number: int) -> Cube:
+        """
+        Build a new Cube from a record.
+        """
+        return CompactCube.to_cube(self[number])
+
+    def __iter__(self) -> Iterator[Cube]:
+        """
+        Yield the cubes of all records in order, one at a time.
+        """
+        for number in range(self._count):
+            yield self.cube(number)
+
+    def find(self, state: tuple[int, ...]) -> int | None:
+        """
+        Look a state up in the index.
+
+        Returns:
+            The lowest record number holding the state, or None.
+        """
+        key = bytes(state)
+        position = bisect.bisect_left(self._keys, key)
+        if position == self._count or self._keys[position] != key:
+            return None
+        start = _header.size + position * _entry_size + _record_size
+        (number,) = _number.unpack_from(self._index, start)
+        return number
+
+    def __contains__(self, state: object) -> bool:
+        """
+        Whether the corpus holds a compact state or a sticker Cube.
+
+        Anything else, including cubes that do not form valid pieces, is
+        never contained.
+        """
+        if isinstance(state, Cube):
+            try:
+                state = CompactCube.from_cube(state)
+            except ValueError:
+                return False
+        if not isinstance(state, tuple) or len(state) != _record_size:
+            return False
+        try:
+            return self.find(state) is not None
+        except (TypeError, ValueError):
+            return False
+
+    def sample(
+        self, count: int, rng: random.Random | int | None = None
+    ) -> Iterator[Cube]:
+        """
+        Yield cubes of distinct records chosen uniformly at random.
+
+        Args:
+            count: Number of records, at most len(self).
+            rng: Random instance or seed for a reproducible sample.
+
+        Raises:
+            ValueError: If count exceeds the corpus size.
+        """
+        if count > self._count:
+            raise ValueError("Sample is larger than the corpus!")
+        if not isinstance(rng, random.Random):
+            rng = random.Random(rng)
+        return (self.cube(number) for number in rng.sample(range(self._count), count))
@@ -0,0 +1,171 @@
+from collections.abc import Iterable
+from typing import NamedTuple
+from .compact_cube import CompactCube
+from .cubie_cube import CubieCube
+from .ida_solver import IDASolver, SolveResult
+from .notation import Notation
+
+
+class StateDiff(NamedTuple):
+    """
+    Differences between two cube states.
+
+    Attributes:
+        corners: Corner positions (CubieCube order) whose piece or twist
+                 differs.
+        edges: Edge positions (CubieCube order) whose piece or flip differs.
+        stickers: Sticker indices (StateCodec order) whose color differs.
+        relative: State that turns the first cube into the second when
+                  applied after it (A⁻¹·B), or None if not requested.
+    """
+
+    corners: tuple[int, ...]
+    edges: tuple[int, ...]
+    stickers: tuple[int, ...]
+    relative: tuple[int, ...] | None = None
+
+
+class StateDiffer:
+    """
+    Compares cube states in compact form.
+
+    Works on CompactCube states and 54-byte sticker encodings only, so large
+    batches can be compared without building Face objects.
+    """
+
+    @staticmethod
+    def diff(
+        first: tuple[int, ...], second: tuple[int, ...], relative: bool = False
+    ) -> StateDiff:
+        """
+        List the cubies and stickers that differ between two compact states.
+
+        Args:
+            first: Compact state A.
+            second: Compact state B.
+            relative: Also compute the relative state A⁻¹·B.
+
+        Returns:
+            StateDiff of the two states.
+        """
+        corners = []
+        edges = []
+        stickers = []
+        for position in range(CompactCube.corner_count + CompactCube.edge_count):
+            a, b = first[position], second[position]
+            if a == b:
+                continue
+            if position < CompactCube.corner_count:
+                corners.append(position)
+            else:
+                edges.append(position - CompactCube.corner_count)
+            a_stickers = _sticker_colors[position][a]
+            b_stickers = _sticker_colors[position][b]
+            stickers.extend(
+                index
+                for (index, a_color), (_, b_color) in zip(a_stickers, b_stickers)
+                if a_color != b_color
+            )
+        return StateDiff(
+            tuple(corners),
+            tuple(edges),
+            tuple(sorted(stickers)),
+            StateDiffer.relative(first, second) if relative else None,
+        )
+
+    @staticmethod
+    def diff_many(
+        pairs: Iterable[tuple[tuple[int, ...], tuple[int, ...]]],
+        relative: bool = False,
+    ) -> list[StateDiff]:
+        """
+        Diff many pairs of compact states, e.g. consecutive replay positions.
+        """
+        return [StateDiffer.diff(first, second, relative) for first, second in pairs]
+
+    @staticmethod
+    def diff_stickers(first: bytes, second: bytes) -> tuple[int, ...]:
+        """
+        List the sticker indices whose color differs between two encodings.
+
+        Args:
+            first: 54-byte sticker encoding.
+            second: 54-byte sticker encoding.
+        """
+        if first == second:
+            return ()
+        return tuple(
+            index for index, (a, b) in enumerate(zip(first, second)) if a != b
+        )
+
+    @staticmethod
+    def relative(first: tuple[int, ...], second: tuple[int, ...]) -> tuple[int, ...]:
+        """
+        Return A⁻¹·B: the state that, applied after first, gives second.
+
+        Any move sequence from first to second produces this state from
+        solved, so solving it measures the distance between the two cubes.
+        """
+        return CompactCube.multiply(CompactCube.inverse(first), second)
+
+    @staticmethod
+    def distance(
+        first: tuple[int, ...],
+        second: tuple[int, ...],
+        solver: IDASolver | None = None,
+        max_depth: int = 20,
+        timeout: float | None = None,
+    ) -> SolveResult:
+        """
+        Find a shortest move sequence from one compact state to another.
+
+        Args:
+            first: Compact state to start from.
+            second: Compact state to reach.
+            solver: Solver to use. Defaults to a new IDASolver.
+            max_depth: Longest sequence to look for.
+            timeout: Seconds after which the search gives up.
+
+        Returns:
+            SolveResult whose moves turn first into second.
+        """
+        if solver is None:
+            solver = IDASolver()
+        result = solver.solve_state(
+            StateDiffer.relative(first, second), max_depth, timeout
+        )
+        if result.moves is None:
+            return result
+        # The solver undoes the relative state, so its solution leads from
+        # second back to first.
+        return result._replace(moves=Notation.invert(result.moves))
+
+
+def _build_sticker_colors() -> tuple[tuple[tuple[tuple[int, int], ...], ...], ...]:
+    """
+    For every position and compact value, list the (sticker index, color)
+    pairs the piece shows there.
+    """
+    positions = []
+    for facelets in CubieCube.corner_facelets:
+        values = []
+        for value in range(24):
+            colors = CubieCube.corner_colors[value // 3]
+            twist = value % 3
+            values.append(
+                tuple((facelets[k], colors[(k - twist) % 3]) for k in range(3))
+            )
+        positions.append(tuple(values))
+    for facelets in CubieCube.edge_facelets:
+        values = []
+        for value in range(24):
+            colors = CubieCube.edge_colors[value // 2]
+            flip = value % 2
+            values.append(
+                ((facelets[0], colors[flip]), (facelets[1], colors[1 - flip]))
+            )
+        positions.append(tuple(values))
+    return tuple(positions)
+
+
+_sticker_colors = _build_sticker_colors()
@@ -0,0 +1,402 @@
+from collections import deque
+from pathlib import Path
+from typing import NamedTuple
+from .algorithm_library import AlgorithmLibrary
+from .compact_cube import CompactCube, _transitions
+from .cube import Cube
+from .notation import Notation
+from .state_codec import StateCodec
+from .validator import Validator
+import heapq
+import os
+
+
+class Stage(NamedTuple):
+    """
+    One labeled step of a human-style solve.
+
+    Attributes:
+        name: 'cross', 'F2L 1' to 'F2L 4', 'OLL' or 'PLL'.
+        moves: Face-turn tokens of the step; apply them with Notation.apply,
+               which turns the cube through Cube.rotate_face.
+        case: Slot or algorithm case solved by the step, if any.
+    """
+
+    name: str
+    moves: list[str]
+    case: str | None = None
+
+
+class StepSolver:
+    """
+    CFOP solver that builds the solution stage by stage from lookup tables.
+
+    The cross is solved on the D (yellow) face, then the four corner-edge
+    pairs are inserted, then the U (white) layer is oriented and permuted
+    with the standard OLL and PLL algorithms of AlgorithmLibrary.
+
+    No search happens while solving: every stage walks a precomputed table
+    that gives the next move (or trigger) for the current position of the
+    pieces involved. The cross table gives optimal cross solutions. An F2L
+    table per slot uses U turns and three-move triggers such as R U R' that
+    disturb only one slot and the U layer; triggers of other slots are only
+    used to take a piece out of an unsolved slot, so finished slots stay
+    solved. Tables are built once per process and, if a cache_dir is
+    given, stored there for later processes.
+    """
+
+    cross_table_name = "cross.bin"
+    f2l_table_name = "f2l.bin"
+    cross_edges = (4, 5, 6, 7)
+    # Slot name, corner piece, edge piece, and the faces that lift the slot
+    # into the U layer when turned clockwise and counter-clockwise.
+    slots = (
+        ("FR", 4, 8, "R", "F"),
+        ("FL", 5, 9, "F", "L"),
+        ("BL", 6, 10, "L", "B"),
+        ("BR", 7, 11, "B", "R"),
+    )
+    solved_code = 254
+    unreachable_code = 255
+    _tables: dict[str | None, tuple[bytes, bytes, list[int]]] = {}
+
+    def __init__(self, cache_dir: str | Path | None = None) -> None:
+        """
+        Load the stage tables, building and caching them if needed.
+
+        Args:
+            cache_dir: Directory of the table files, e.g.
+                       StepSolver.default_cache_dir(). If None, the tables
+                       are only kept in memory.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.library = AlgorithmLibrary.get()
+        self._cross_table, self._f2l_table, self._f2l_costs = StepSolver._load_tables(
+            self.cache_dir
+        )
+
+    def solve(self, cube: Cube) -> list[Stage]:
+        """
+        Solve a sticker Cube stage by stage.
+
+        Args:
+            cube: Cube to solve. It is not modified.
+
+        Returns:
+            The stages in order; applying all their moves solves the cube.
+
+        Raises:
+            ValueError: If the cube is not solvable.
+        """
+        Validator.validate_state(StateCodec.encode(cube))
+        return self.solve_state(CompactCube.from_cube(cube))
+
+    def solve_state(self, state: tuple[int, ...]) -> list[Stage]:
+        """
+        Solve a compact state stage by stage.
+
+        Args:
+            state: CompactCube state, assumed solvable.
+
+        Returns:
+            The stages in order; applying all their moves solves the cube.
+
+        Raises:
+            ValueError: If the last layer matches no algorithm case, which
+                        only happens for unsolvable states.
+        """
+        stages = []
+        state, moves = self._solve_cross(state)
+        stages.append(Stage("cross", moves))
+
+        remaining = list(range(len(StepSolver.slots)))
+        for number in range(1, len(StepSolver.slots) + 1):
+            slot = min(remaining, key=lambda slot: self._f2l_cost(state, slot))
+            remaining.remove(slot)
+            state, moves = self._solve_pair(state, slot)
+            stages.append(Stage(f"F2L {number}", moves, StepSolver.slots[slot][0]))
+
+        for step in ("OLL", "PLL"):
+            recognition = self.library.recognize_compact(state)
+            if recognition is None or recognition.step != step:
+                stages.append(Stage(step, []))
+                continue
+            moves = list(recognition.moves)
+            state = CompactCube.apply_sequence(state, moves)
+            stages.append(Stage(step, moves, recognition.case))
+        if state != CompactCube.solved:
+            raise ValueError("Cube state is not solvable!")
+        return stages
+
+    def _solve_cross(self, state: tuple[int, ...]) -> tuple[tuple[int, ...], list[str]]:
+        """
+        Follow the cross table until the D edges are solved.
+        """
+        moves = []
+        while True:
+            code = self._cross_table[_cross_rank(state)]
+            if code == StepSolver.solved_code:
+                return state, moves
+            move = Notation.moves[code]
+            state = CompactCube.apply(state, move)
+            moves.append(move)
+
+    def _f2l_cost(self, state: tuple[int, ...], slot: int) -> int:
+        """
+        Number of moves the F2L table needs for a slot.
+        """
+        return self._f2l_costs[slot * _pair_count + _pair_rank(state, slot)]
+
+    def _solve_pair(
+        self, state: tuple[int, ...], slot: int
+    ) -> tuple[tuple[int, ...], list[str]]:
+        """
+        Follow the F2L table of a slot until its pair is inserted.
+        """
+        moves = []
+        while True:
+            code = self._f2l_table[slot * _pair_count + _pair_rank(state, slot)]
+            if code == StepSolver.solved_code:
+                return state, Notation.simplify(moves)
+            action = _f2l_actions[code]
+            state = CompactCube.apply_sequence(state, action)
+            moves.extend(action)
+
+    @staticmethod
+    def default_cache_dir() -> Path:
+        """
+        Return the per-user table directory, honoring XDG_CACHE_HOME.
+        """
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        return Path(base) / "rubiks_cube"
+
+    @staticmethod
+    def _load_tables(cache_dir: Path | None) -> tuple[bytes, bytes, list[int]]:
+        """
+        Return the cross and F2L tables from memory, disk or a fresh build,
+        together with the move count of every F2L table entry.
+        """
+        key = str(cache_dir) if cache_dir is not None else None
+        if key in StepSolver._tables:
+            return StepSolver._tables[key]
+        cross_table = StepSolver._load_table(
+            cache_dir and cache_dir / StepSolver.cross_table_name,
+            24 ** len(StepSolver.cross_edges),
+            _build_cross_table,
+        )
+        f2l_table = StepSolver._load_table(
+            cache_dir and cache_dir / StepSolver.f2l_table_name,
+            _pair_count * len(StepSolver.slots),
+            _build_f2l_table,
+        )
+        StepSolver._tables[key] = (cross_table, f2l_table, _f2l_costs(f2l_table))
+        return StepSolver._tables[key]
+
+    @staticmethod
+    def _load_table(path: Path | None, size: int, build) -> bytes:
+        """
+        Read a table file, rebuilding it if it is missing or has the wrong
+        size. Without a path the table is built and not stored.
+        """
+        if path is None:
+            return bytes(build())
+        if path.exists() and path.stat().st_size == size:
+            return path.read_bytes()
+        table = bytes(build())
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(".tmp")
+        temporary.write_bytes(table)
+        os.replace(temporary, path)
+        return table
+
+
+def _build_piece_maps() -> tuple[dict[str, tuple[int, ...]], ...]:
+    """
+    For every move, map a piece location (position * 3 + twist for corners,
+    position * 2 + flip for edges) to its location after the move.
+    """
+    corner_maps = {}
+    edge_maps = {}
+    for move, transitions in _transitions.items():
+        corners = [0] * 24
+        edges = [0] * 24
+        for target, (source, table) in enumerate(transitions):
+            if target < CompactCube.corner_count:
+                for twist in range(3):
+                    corners[source * 3 + twist] = target * 3 + table[twist]
+            else:
+                for flip in range(2):
+                    edges[(source - 8) * 2 + flip] = (target - 8) * 2 + table[flip]
+        corner_maps[move] = tuple(corners)
+        edge_maps[move] = tuple(edges)
+    return corner_maps, edge_maps
+
+
+_corner_maps, _edge_maps = _build_piece_maps()
+_pair_count = 24 * 24
+_f2l_actions = tuple([turn] for turn in ("U", "U2", "U'")) + tuple(
+    action
+    for _, _, _, clockwise, counter_clockwise in StepSolver.slots
+    for suffix in ("", "2", "'")
+    for action in (
+        [clockwise, "U" + suffix, clockwise + "'"],
+        [counter_clockwise + "'", "U" + suffix, counter_clockwise],
+    )
+)
+_triggers_per_slot = 6
+
+
+def _build_action_maps() -> tuple[tuple[tuple[int, ...], tuple[int, ...]], ...]:
+    """
+    Map corner and edge locations through every F2L action.
+    """
+    action_maps = []
+    for action in _f2l_actions:
+        corners = tuple(range(24))
+        edges = tuple(range(24))
+        for move in action:
+            corners = tuple([_corner_maps[move][location] for location in corners])
+            edges = tuple([_edge_maps[move][location] for location in edges])
+        action_maps.append((corners, edges))
+    return tuple(action_maps)
+
+
+_f2l_action_maps = _build_action_maps()
+
+
+def _cross_rank(state: tuple[int, ...]) -> int:
+    """
+    Index of the locations of the four D edges.
+    """
+    locations = [0, 0, 0, 0]
+    for position in range(8, 20):
+        value = state[position]
+        piece = value >> 1
+        if 4 <= piece < 8:
+            locations[piece - 4] = (position - 8) * 2 + (value & 1)
+    return _rank_locations(locations)
+
+
+def _pair_rank(state: tuple[int, ...], slot: int) -> int:
+    """
+    Index of the locations of the corner and edge of an F2L slot.
+    """
+    _, corner_piece, edge_piece, _, _ = StepSolver.slots[slot]
+    corner = edge = 0
+    for position in range(8):
+        if state[position] // 3 == corner_piece:
+            corner = position * 3 + state[position] % 3
+            break
+    for position in range(8, 20):
+        if state[position] >> 1 == edge_piece:
+            edge = (position - 8) * 2 + (state[position] & 1)
+            break
+    return corner * 24 + edge
+
+
+def _build_cross_table() -> bytearray:
+    """
+    Breadth-first search over the D edge locations, recording for each the
+    move that leads one step closer to a solved cross.
+    """
+    inverse = {
+        move: Notation.moves.index(Notation.invert([move])[0])
+        for move in Notation.moves
+    }
+    table = bytearray([StepSolver.unreachable_code]) * 24**4
+    solved = tuple(piece * 2 for piece in StepSolver.cross_edges)
+    table[_rank_locations(solved)] = StepSolver.solved_code
+    queue = deque([solved])
+    while queue:
+        locations = queue.popleft()
+        for move in Notation.moves:
+            edge_map = _edge_maps[move]
+            child = tuple([edge_map[location] for location in locations])
+            rank = _rank_locations(child)
+            if table[rank] == StepSolver.unreachable_code:
+                table[rank] = inverse[move]
+                queue.append(child)
+    return table
+
+
+def _rank_locations(locations: list[int] | tuple[int, ...]) -> int:
+    rank = 0
+    for location in locations:
+        rank = rank * 24 + location
+    return rank
+
+
+def _build_f2l_table() -> bytearray:
+    """
+    Shortest trigger sequences inserting each slot's pair, by Dijkstra over
+    the 24 x 24 corner and edge locations.
+    """
+    table = bytearray([StepSolver.unreachable_code]) * (
+        _pair_count * len(StepSolver.slots)
+    )
+    for slot, (_, corner_piece, edge_piece, _, _) in enumerate(StepSolver.slots):
+        # Reverse edges of the graph, with the trigger slot of every action.
+        predecessors = [[] for _ in range(_pair_count)]
+        for corner in range(24):
+            for edge in range(24):
+                for code, (corners, edges) in enumerate(_f2l_action_maps):
+                    # Other slots' triggers may only take a piece out.
+                    trigger_slot = (code - 3) // _triggers_per_slot
+                    if (
+                        code >= 3
+                        and trigger_slot != slot
+                        and not _in_slot(corner, edge, trigger_slot)
+                    ):
+                        continue
+                    child = corners[corner] * 24 + edges[edge]
+                    predecessors[child].append((corner * 24 + edge, code))
+
+        goal = corner_piece * 3 * 24 + edge_piece * 2
+        costs = {goal: 0}
+        table[slot * _pair_count + goal] = StepSolver.solved_code
+        heap = [(0, goal)]
+        while heap:
+            cost, rank = heapq.heappop(heap)
+            if cost > costs[rank]:
+                continue
+            for parent, code in predecessors[rank]:
+                parent_cost = cost + len(_f2l_actions[code])
+                if parent_cost < costs.get(parent, parent_cost + 1):
+                    costs[parent] = parent_cost
+                    table[slot * _pair_count + parent] = code
+                    heapq.heappush(heap, (parent_cost, parent))
+    return table
+
+
+def _in_slot(corner: int, edge: int, slot: int) -> bool:
+    """
+    Whether the corner or edge location lies in the given slot.
+    """
+    _, corner_piece, edge_piece, _, _ = StepSolver.slots[slot]
+    return corner // 3 == corner_piece or edge // 2 == edge_piece
+
+
+def _f2l_costs(table: bytes) -> list[int]:
+    """
+    Count the moves of the trigger sequence every F2L table entry leads to.
+    """
+    costs: list[int | None] = [None] * len(table)
+    for slot in range(len(StepSolver.slots)):
+        base = slot * _pair_count
+        for start in range(_pair_count):
+            path = []
+            rank = start
+            while costs[base + rank] is None:
+                code = table[base + rank]
+                if code == StepSolver.solved_code:
+                    costs[base + rank] = 0
+                elif code == StepSolver.unreachable_code:
+                    costs[base + rank] = StepSolver.unreachable_code
+                else:
+                    path.append((rank, code))
+                    corners, edges = _f2l_action_maps[code]
+                    rank = corners[rank // 24] * 24 + edges[rank % 24]
+            for previous, code in reversed(path):
+                costs[base + previous] = costs[base + rank] + len(_f2l_actions[code])
+                rank = previous
+    return costs
@@ -0,0 +1,371 @@
+from array import array
+from pathlib import Path
+from .compact_cube import CompactCube, _transitions
+from .heuristics import _permutation_rank
+from .notation import Notation
+import json
+import math
+import mmap
+import multiprocessing
+import os
+import re
+
+
+class SubgroupIndex:
+    """
+    Dense numbering of the states reachable with a set of moves.
+
+    Only the positions moved by at least one generator are encoded: the
+    permutation of the pieces found there (Lehmer code) and, if any
+    generator twists corners or flips edges, their orientations with the
+    last one left out because it is determined by the others. The index
+    space is an upper bound on the subgroup, so some indices are never
+    reached.
+    """
+
+    def __init__(self, generators: str) -> None:
+        """
+        Build the numbering for a generator set.
+
+        Args:
+            generators: Whitespace-separated generators. A bare face letter
+                        such as "U" stands for all of its turns (U, U2, U');
+                        a move token such as "R2" adds only that move.
+
+        Raises:
+            ValueError: If a generator is not a face letter or a move.
+        """
+        self.generators = generators
+        self.moves = SubgroupIndex.parse_generators(generators)
+        self._parts = []
+        self.size = 1
+        for start, stop, radix in ((0, 8, 3), (8, 20, 2)):
+            positions = tuple(
+                position
+                for position in range(start, stop)
+                if any(
+                    _transitions[move][position][0] != position
+                    or _transitions[move][position][1][0] != 0
+                    for move in self.moves
+                )
+            )
+            oriented = any(
+                _transitions[move][position][1][0] != 0
+                for move in self.moves
+                for position in positions
+            )
+            pieces = {
+                position - start: local for local, position in enumerate(positions)
+            }
+            self._parts.append((start, positions, pieces, radix, oriented))
+            self.size *= math.factorial(len(positions))
+            if oriented:
+                self.size *= radix ** (len(positions) - 1)
+
+    @staticmethod
+    def parse_generators(generators: str) -> tuple[str, ...]:
+        """
+        Expand a generator string into the move tokens it allows.
+
+        Raises:
+            ValueError: If a generator is not a face letter or a move.
+        """
+        moves = []
+        for token in generators.replace(",", " ").split():
+            if token in Notation.face_keys:
+                moves.extend(token + suffix for suffix in ("", "2", "'"))
+            else:
+                moves.extend(Notation.parse(token))
+        if not moves:
+            raise ValueError("At least one generator is required!")
+        return tuple(dict.fromkeys(moves))
+
+    def rank(self, state: tuple[int, ...]) -> int:
+        """
+        Return the index of a compact state of the subgroup.
+        """
+        rank = 0
+        for _, positions, pieces, radix, oriented in self._parts:
+            values = [state[position] for position in positions]
+            rank = rank * math.factorial(len(values)) + _permutation_rank(
+                [pieces[value // radix] for value in values]
+            )
+            if oriented:
+                for value in values[:-1]:
+                    rank = rank * radix + value % radix
+        return rank
+
+    def unrank(self, rank: int) -> tuple[int, ...]:
+        """
+        Return the compact state with the given index.
+        """
+        state = list(CompactCube.solved)
+        for start, positions, _, radix, oriented in reversed(self._parts):
+            count = len(positions)
+            orientations = [0] * count
+            if oriented:
+                for i in range(count - 2, -1, -1):
+                    rank, orientations[i] = divmod(rank, radix)
+                orientations[-1] = -sum(orientations) % radix
+            digits = [0] * count
+            for i in range(count - 1, -1, -1):
+                rank, digits[i] = divmod(rank, count - i)
+            available = list(positions)
+            for i, position in enumerate(positions):
+                piece = available.pop(digits[i]) - start
+                state[position] = piece * radix + orientations[i]
+        return tuple(state)
+
+
+# Two-bit codes of the visited table. The frontier code alternates between
+# depths so that marking the next level never touches the current one.
+_unseen = 0
+_expanded = 1
+
+
+def _frontier_code(depth: int) -> int:
+    return 2 + depth % 2
+
+
+def _field_tables(code: int) -> tuple[bytes, bytes]:
+    """
+    Return byte translation tables that count the fields holding code and
+    that replace code with _expanded.
+    """
+    counts = bytearray(256)
+    promoted = bytearray(256)
+    for byte in range(256):
+        fields = [(byte >> (2 * j)) & 3 for j in range(4)]
+        counts[byte] = fields.count(code)
+        promoted[byte] = sum(
+            (_expanded if field == code else field) << (2 * j)
+            for j, field in enumerate(fields)
+        )
+    return bytes(counts), bytes(promoted)
+
+
+_index_cache: dict[str, SubgroupIndex] = {}
+_nonzero = re.compile(rb"[^\x00]")
+
+
+def _expand_slice(task: tuple[str, int, int, str, int, str]) -> str:
+    """
+    Expand the frontier states stored in one slice of the visited table.
+
+    Runs in worker processes, so it must stay a module-level function. The
+    table is only read; the indices of all children are spilled to a file
+    that the parent merges into the table.
+
+    Args:
+        task: Table path, first and last byte of the slice, generators,
+              frontier code and spill file path.
+
+    Returns:
+        The spill file path.
+    """
+    table_path, start, stop, generators, code, spill_path = task
+    index = _index_cache.get(generators)
+    if index is None:
+        index = _index_cache[generators] = SubgroupIndex(generators)
+    counts, _ = _field_tables(code)
+    children = array("Q")
+    with open(table_path, "rb") as table_file, open(spill_path, "wb") as spill:
+        with mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ) as table:
+            chunk = table[start:stop]
+        for match in _nonzero.finditer(chunk.translate(counts)):
+            position = match.start()
+            byte = chunk[position]
+            for j in range(4):
+                if (byte >> (2 * j)) & 3 != code:
+                    continue
+                state = index.unrank((start + position) * 4 + j)
+                for move in index.moves:
+                    children.append(index.rank(CompactCube.apply(state, move)))
+            if len(children) >= DistanceDistribution.spill_size:
+                children.tofile(spill)
+                children = array("Q")
+        children.tofile(spill)
+    return spill_path
+
+
+class DistanceDistribution:
+    """
+    Exhaustive breadth-first enumeration of a move subgroup.
+
+    Counts how many states of the subgroup lie at each face-turn distance
+    from the solved cube (the state CubeFactory.create_solved_cube builds).
+    Every state of the index space gets two bits in a table file in the work
+    directory: unseen, expanded, or one of two alternating frontier codes.
+    The table is memory-mapped, so large subgroups are paged to disk by the
+    operating system instead of being held in memory.
+
+    A level is expanded by scanning slices of the table, optionally in a
+    process pool; children are spilled to files and merged into the table by
+    the parent. Progress is written to progress.json after every phase, and
+    every phase can be repeated safely, so an interrupted run resumes where
+    it stopped.
+    """
+
+    table_name = "visited.bin"
+    progress_name = "progress.json"
+    slice_size = 1 << 18
+    spill_size = 1 << 16
+
+    def __init__(
+        self, generators: str, work_dir: str | Path, processes: int = 1
+    ) -> None:
+        """
+        Initialize the enumeration.
+
+        Args:
+            generators: Generator set, e.g. "U R" or "U2 R2 F2".
+            work_dir: Directory holding the table and progress files.
+            processes: Number of worker processes expanding the frontier;
+                       1 expands in the calling process.
+
+        Raises:
+            ValueError: If a generator is not a face letter or a move.
+        """
+        self.index = SubgroupIndex(generators)
+        self.work_dir = Path(work_dir)
+        self.processes = processes
+        self.table_path = self.work_dir / DistanceDistribution.table_name
+        self.progress_path = self.work_dir / DistanceDistribution.progress_name
+
+    def run(self, max_depth: int | None = None) -> list[int]:
+        """
+        Enumerate the subgroup, resuming from the work directory if possible.
+
+        Args:
+            max_depth: Stop after this many levels; None runs to completion.
+
+        Returns:
+            Number of states at each distance found so far.
+
+        Raises:
+            ValueError: If the work directory belongs to another generator set.
+        """
+        progress = self._load_progress()
+        with open(self.table_path, "r+b") as table_file:
+            with mmap.mmap(table_file.fileno(), 0) as table:
+                while not progress["complete"] and (
+                    max_depth is None or progress["depth"] < max_depth
+                ):
+                    depth = progress["depth"]
+                    if not progress["cleaned"]:
+                        self._expire_frontier(table, _frontier_code(depth - 1))
+                        progress["cleaned"] = True
+                        self._save_progress(progress, table)
+                    count = self._expand_level(table, depth)
+                    if count:
+                        progress["histogram"].append(count)
+                        progress["depth"] = depth + 1
+                        progress["cleaned"] = False
+                    else:
+                        progress["complete"] = True
+                    self._save_progress(progress, table)
+        return list(progress["histogram"])
+
+    def _load_progress(self) -> dict:
+        """
+        Read the progress file, or create the table and start at depth 0.
+
+        Raises:
+            ValueError: If the work directory belongs to another generator set.
+        """
+        if self.progress_path.exists():
+            progress = json.loads(self.progress_path.read_text())
+            if progress["generators"] != list(self.index.moves):
+                raise ValueError("Work directory belongs to another generator set!")
+            return progress
+
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.table_path, "wb") as table_file:
+            table_file.truncate((self.index.size + 3) // 4)
+        rank = self.index.rank(CompactCube.solved)
+        progress = {
+            "generators": list(self.index.moves),
+            "depth": 0,
+            "cleaned": True,
+            "complete": False,
+            "histogram": [1],
+        }
+        with open(self.table_path, "r+b") as table_file:
+            with mmap.mmap(table_file.fileno(), 0) as table:
+                table[rank >> 2] = _frontier_code(0) << (2 * (rank & 3))
+                self._save_progress(progress, table)
+        return progress
+
+    def _save_progress(self, progress: dict, table: mmap.mmap) -> None:
+        """
+        Flush the table, then atomically replace the progress file.
+        """
+        table.flush()
+        temporary = self.progress_path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(progress))
+        os.replace(temporary, self.progress_path)
+
+    def _expire_frontier(self, table: mmap.mmap, code: int) -> None:
+        """
+        Mark the states of an already expanded level as expanded.
+        """
+        _, promoted = _field_tables(code)
+        for start in range(0, len(table), DistanceDistribution.slice_size):
+            stop = min(len(table), start + DistanceDistribution.slice_size)
+            table[start:stop] = table[start:stop].translate(promoted)
+
+    def _expand_level(self, table: mmap.mmap, depth: int) -> int:
+        """
+        Expand every state at depth and mark its unseen children.
+
+        Returns:
+            Number of states found at depth + 1.
+        """
+        code = _frontier_code(depth)
+        next_code = _frontier_code(depth + 1)
+        table.flush()
+        tasks = [
+            (
+                str(self.table_path),
+                start,
+                min(len(table), start + DistanceDistribution.slice_size),
+                self.index.generators,
+                code,
+                str(self.work_dir / f"spill-{number}.bin"),
+            )
+            for number, start in enumerate(
+                range(0, len(table), DistanceDistribution.slice_size)
+            )
+        ]
+        if self.processes <= 1:
+            spill_paths = map(_expand_slice, tasks)
+            self._merge_spills(table, spill_paths, next_code)
+        else:
+            with multiprocessing.Pool(self.processes) as pool:
+                spill_paths = pool.imap_unordered(_expand_slice, tasks)
+                self._merge_spills(table, spill_paths, next_code)
+
+        counts, _ = _field_tables(next_code)
+        return sum(
+            sum(table[start : start + DistanceDistribution.slice_size].translate(counts))
+            for start in range(0, len(table), DistanceDistribution.slice_size)
+        )
+
+    def _merge_spills(self, table: mmap.mmap, spill_paths, code: int) -> None:
+        """
+        Mark the unseen children listed in spill files and delete the files.
+        """
+        for spill_path in spill_paths:
+            with open(spill_path, "rb") as spill:
+                while True:
+                    children = array("Q")
+                    children.frombytes(spill.read(8 * DistanceDistribution.spill_size))
+                    if not children:
+                        break
+                    for rank in children:
+                        offset = rank >> 2
+                        shift = 2 * (rank & 3)
+                        byte = table[offset]
+                        if (byte >> shift) & 3 == _unseen:
+                            table[offset] = byte | (code << shift)
+            os.remove(spill_path)
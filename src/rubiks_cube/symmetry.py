@@ -0,0 +1,154 @@
+from .compact_cube import CompactCube
+from .cubie_cube import CubieCube
+from .notation import Notation
+from .state_codec import StateCodec
+
+
+class CubeSymmetry:
+    """
+    The 48 symmetries of the cube acting on compact states.
+
+    A symmetry is a whole-cube rotation, optionally followed by a mirror
+    through the plane between L and R, described by where it sends each
+    face letter. Applying it to a state moves every sticker to its image
+    position and recolors it so that the centers keep their colors; the
+    result is the conjugate state. Its solutions are the solutions of the
+    original state with every face letter relabeled, and, for mirrored
+    symmetries, every turn reversed.
+
+    Symmetries are numbered 0-47; symmetry 0 is the identity.
+    """
+
+    count = 48
+
+    @staticmethod
+    def conjugate(state: tuple[int, ...], symmetry: int) -> tuple[int, ...]:
+        """
+        Return the image of a compact state under a symmetry.
+        """
+        return tuple([table[state[source]] for source, table in _conjugations[symmetry]])
+
+    @staticmethod
+    def relabel(moves: list[str], symmetry: int) -> list[str]:
+        """
+        Map moves of a state to the equivalent moves of its conjugate.
+
+        A sequence that produces (or solves) a state produces (or solves)
+        CubeSymmetry.conjugate(state, symmetry) once relabeled.
+        """
+        letters = _letter_maps[symmetry]
+        if _mirrored[symmetry]:
+            suffixes = Notation._inverse_suffixes
+            return [letters[move[0]] + suffixes[move[1:]] for move in moves]
+        return [letters[move[0]] + move[1:] for move in moves]
+
+    @staticmethod
+    def inverse(symmetry: int) -> int:
+        """
+        Return the number of the symmetry that undoes a symmetry.
+        """
+        return _inverses[symmetry]
+
+    @staticmethod
+    def canonical(state: tuple[int, ...]) -> tuple[tuple[int, ...], int]:
+        """
+        Return the smallest conjugate of a state and the symmetry giving it.
+
+        All symmetric variants of a state share the same canonical state.
+        """
+        return min(
+            (CubeSymmetry.conjugate(state, symmetry), symmetry)
+            for symmetry in range(CubeSymmetry.count)
+        )
+
+
+def _build_letter_maps() -> tuple[list[dict[str, str]], list[bool]]:
+    """
+    Generate the 48 symmetries as face letter maps from the x, y, z
+    rotations and the L-R mirror.
+    """
+    identity = {letter: letter for letter in Notation.face_keys}
+    generators = []
+    for face in Notation._rotation_faces.values():
+        image = dict(identity)
+        Notation._rotate(image, face, 1)
+        generators.append((image, False))
+    generators.append(({**identity, "L": "R", "R": "L"}, True))
+
+    maps = [identity]
+    mirrored = [False]
+    seen = {tuple(sorted(identity.items())): 0}
+    queue = [(identity, False)]
+    while queue:
+        letters, mirror = queue.pop(0)
+        for generator, generator_mirror in generators:
+            image = {letter: generator[target] for letter, target in letters.items()}
+            key = tuple(sorted(image.items()))
+            if key not in seen:
+                seen[key] = len(maps)
+                maps.append(image)
+                mirrored.append(mirror != generator_mirror)
+                queue.append((image, mirror != generator_mirror))
+    return maps, mirrored
+
+
+def _build_conjugations(
+    letter_maps: list[dict[str, str]],
+) -> list[tuple[tuple[int, tuple[int, ...]], ...]]:
+    """
+    Build, for every symmetry, the (source position, value table) pair of
+    each target position, in the format CompactCube uses for moves.
+    """
+    codes = {
+        letter: StateCodec._key_codes[key] for letter, key in Notation.face_keys.items()
+    }
+    conjugations = []
+    for letter_map in letter_maps:
+        recolor = {codes[letter]: codes[image] for letter, image in letter_map.items()}
+        targets = []
+        for names, colors_of, radix in (
+            (CubieCube.corner_names, CubieCube.corner_colors, 3),
+            (CubieCube.edge_names, CubieCube.edge_colors, 2),
+        ):
+            positions = {frozenset(name): index for index, name in enumerate(names)}
+            pieces = {}
+            for piece, colors in enumerate(colors_of):
+                for turn in range(radix):
+                    pieces[colors[-turn:] + colors[:-turn]] = piece * radix + turn
+            images = []
+            for source, name in enumerate(names):
+                target = positions[frozenset(letter_map[letter] for letter in name)]
+                # Facelet k of the source moves to the facelet of the target
+                # named after the image of its letter.
+                order = [names[target].index(letter_map[letter]) for letter in name]
+                table = []
+                for value in range(24):
+                    piece, turn = divmod(value, radix)
+                    colors = colors_of[piece]
+                    shown = [colors[(k - turn) % radix] for k in range(radix)]
+                    placed = [0] * radix
+                    for k, color in enumerate(shown):
+                        placed[order[k]] = recolor[color]
+                    table.append(pieces[tuple(placed)])
+                images.append((target, source, tuple(table)))
+            targets.extend(sorted(images))
+        offset = CompactCube.corner_count
+        conjugations.append(
+            tuple(
+                (source + (offset if index >= offset else 0), table)
+                for index, (_, source, table) in enumerate(targets)
+            )
+        )
+    return conjugations
+
+
+_letter_maps, _mirrored = _build_letter_maps()
+_conjugations = _build_conjugations(_letter_maps)
+_inverses = [
+    next(
+        other
+        for other, candidate in enumerate(_letter_maps)
+        if all(candidate[image] == letter for letter, image in letter_map.items())
+    )
+    for letter_map in _letter_maps
+]
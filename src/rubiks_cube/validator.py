@@ -1,4 +1,6 @@
+from .cubie_cube import CubieCube
 from .face import Face
+from .state_codec import StateCodec
 from pathlib import Path
 
 
@@ -48,10 +50,53 @@ class Validator:
             _validate_data_structure: Ensures six faces, correct matrix dimensions.
             _validate_center_colors: Checks each face's center matches its key.
             _validate_allowed_colors: Ensures all keys are valid color keys.
+            validate_state: Ensures the stickers describe a solvable cube.
         """
         Validator._validate_data_structure(faces)
         Validator._validate_center_colors(faces)
         Validator._validate_allowed_colors(faces)
+        Validator.validate_state(StateCodec.encode_key_matrixes(faces))
+
+    @staticmethod
+    def validate_state(state: bytes) -> None:
+        """
+        Validate that a sticker encoding describes a cube reachable by face turns.
+
+        Args:
+            state: 54-byte sticker encoding as produced by StateCodec.
+
+        Calls:
+            _validate_state_length: Ensures the state has 54 stickers.
+            _validate_state_codes: Ensures every sticker is a known color code.
+            _validate_state_centers: Checks each center matches its face.
+            _validate_solvability: Ensures the pieces can be solved.
+        """
+        Validator._validate_state_length(state)
+        Validator._validate_state_codes(state)
+        Validator._validate_state_centers(state)
+        Validator._validate_solvability(state)
+
+    @staticmethod
+    def _validate_solvability(state: bytes) -> None:
+        """
+        Validate the piece-level rules of a structurally valid sticker encoding.
+
+        Args:
+            state: 54-byte sticker encoding with correct codes and centers.
+
+        Calls:
+            _validate_color_counts: Ensures every color appears nine times.
+            _validate_piece_identities: Ensures every piece is real and present once.
+            _validate_corner_twist: Ensures the corner twists sum to 0 mod 3.
+            _validate_edge_flip: Ensures the edge flips sum to 0 mod 2.
+            _validate_permutation_parity: Ensures corner and edge parities match.
+        """
+        Validator._validate_color_counts(state)
+        cubie_cube = CubieCube.from_facelets(state)
+        Validator._validate_piece_identities(cubie_cube)
+        Validator._validate_corner_twist(cubie_cube)
+        Validator._validate_edge_flip(cubie_cube)
+        Validator._validate_permutation_parity(cubie_cube)
 
     @staticmethod
     def validate_file_path(file_path: Path) -> None:
@@ -68,6 +113,22 @@ class Validator:
         Validator._validate_file_exists(file_path)
         Validator._validate_file_extension(file_path)
 
+    @staticmethod
+    def validate_library_path(file_path: Path) -> None:
+        """
+        Validate a file path for loading a multi-cube library.
+
+        Args:
+            file_path: Path object to the .json or .jsonl library file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the extension is neither .json nor .jsonl.
+        """
+        Validator._validate_file_exists(file_path)
+        if file_path.suffix not in (".json", ".jsonl"):
+            raise ValueError("Only .json and .jsonl formats are permitted!")
+
     @staticmethod
     def _validate_file_extension(file_path: Path) -> None:
         """
@@ -105,15 +166,18 @@ class Validator:
             faces: Dict mapping face names to 3x3 color key matrices.
 
         Raises:
-            ValueError: If there are not exactly 6 faces, or any matrix is not 3x3.
+            ValueError: If faces is not a dict, there are not exactly 6 faces,
+                        or any matrix is not a 3x3 list of lists.
         """
+        if not isinstance(faces, dict):
+            raise ValueError("Faces must map face names to matrices!")
         if len(faces) != 6:
             raise ValueError("Cube must contain 6 faces!")
         for matrix in faces.values():
-            if len(matrix) != Face.edge_len:
+            if not isinstance(matrix, list) or len(matrix) != Face.edge_len:
                 raise ValueError("Incorrect row amount!")
             for row in matrix:
-                if len(row) != Face.edge_len:
+                if not isinstance(row, list) or len(row) != Face.edge_len:
                     raise ValueError("Incorrect column amount!")
 
     @staticmethod
@@ -157,3 +221,126 @@ class Validator:
             for cell in row
         ):
             raise ValueError("Incorrect key value!")
+
+    @staticmethod
+    def _validate_state_length(state: bytes) -> None:
+        """
+        Ensure a sticker encoding holds exactly 54 stickers.
+
+        Args:
+            state: Sticker encoding.
+
+        Raises:
+            ValueError: If the length is not 54.
+        """
+        if len(state) != StateCodec.state_len:
+            raise ValueError("Cube state must contain 54 stickers!")
+
+    @staticmethod
+    def _validate_state_codes(state: bytes) -> None:
+        """
+        Ensure every sticker of an encoding is a known color code.
+
+        Args:
+            state: Sticker encoding.
+
+        Raises:
+            ValueError: If any code is outside 0-5.
+        """
+        if max(state) >= len(StateCodec.face_keys):
+            raise ValueError("Incorrect key value!")
+
+    @staticmethod
+    def _validate_state_centers(state: bytes) -> None:
+        """
+        Ensure each face center of an encoding has the color of its face.
+
+        Args:
+            state: Sticker encoding.
+
+        Raises:
+            ValueError: If any center does not match its face.
+        """
+        for code, index in enumerate(StateCodec.center_indices):
+            if state[index] != code:
+                raise ValueError("Center color must match the face color!")
+
+    @staticmethod
+    def _validate_color_counts(state: bytes) -> None:
+        """
+        Ensure every color appears on exactly nine stickers.
+
+        Args:
+            state: 54-byte sticker encoding.
+
+        Raises:
+            ValueError: If any color count differs from nine.
+        """
+        for code, key in enumerate(StateCodec.face_keys):
+            count = state.count(code)
+            if count != StateCodec.face_size:
+                raise ValueError(
+                    f"Color '{key}' appears {count} times instead of 9!"
+                )
+
+    @staticmethod
+    def _validate_piece_identities(cubie_cube: CubieCube) -> None:
+        """
+        Ensure every corner and edge piece appears exactly once.
+
+        Args:
+            cubie_cube: Pieces reconstructed from the stickers.
+
+        Raises:
+            ValueError: If a piece is duplicated (and therefore another is missing).
+        """
+        for piece, name in enumerate(CubieCube.corner_names):
+            count = cubie_cube.cp.count(piece)
+            if count != 1:
+                raise ValueError(f"Corner {name} appears {count} times instead of once!")
+        for piece, name in enumerate(CubieCube.edge_names):
+            count = cubie_cube.ep.count(piece)
+            if count != 1:
+                raise ValueError(f"Edge {name} appears {count} times instead of once!")
+
+    @staticmethod
+    def _validate_corner_twist(cubie_cube: CubieCube) -> None:
+        """
+        Ensure the total corner twist is a multiple of three.
+
+        Args:
+            cubie_cube: Pieces reconstructed from the stickers.
+
+        Raises:
+            ValueError: If a corner is twisted in place.
+        """
+        if sum(cubie_cube.co) % 3 != 0:
+            raise ValueError("Corner twist is invalid: a corner is twisted!")
+
+    @staticmethod
+    def _validate_edge_flip(cubie_cube: CubieCube) -> None:
+        """
+        Ensure the total edge flip is even.
+
+        Args:
+            cubie_cube: Pieces reconstructed from the stickers.
+
+        Raises:
+            ValueError: If an edge is flipped in place.
+        """
+        if sum(cubie_cube.eo) % 2 != 0:
+            raise ValueError("Edge flip is invalid: an edge is flipped!")
+
+    @staticmethod
+    def _validate_permutation_parity(cubie_cube: CubieCube) -> None:
+        """
+        Ensure corner and edge permutations have the same parity.
+
+        Args:
+            cubie_cube: Pieces reconstructed from the stickers.
+
+        Raises:
+            ValueError: If a single pair of pieces is swapped.
+        """
+        if cubie_cube.corner_parity() != cubie_cube.edge_parity():
+            raise ValueError("Permutation parity is invalid: two pieces are swapped!")
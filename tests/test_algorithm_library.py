@@ -0,0 +1,101 @@
+from rubiks_cube import AlgorithmLibrary, CompactCube, CubeFactory, Notation, StateCodec
+import random
+import timeit
+import pytest
+
+
+@pytest.fixture(scope="module")
+def setup_library():
+    return AlgorithmLibrary.get()
+
+
+def setup_state(moves):
+    state = CompactCube.apply_sequence(CompactCube.solved, moves)
+    return StateCodec.encode(CompactCube.to_cube(state))
+
+
+class TestAlgorithmLibrary:
+    def test_case_counts(self):
+        assert len(AlgorithmLibrary.oll_algorithms) == 57
+        assert len(AlgorithmLibrary.pll_algorithms) == 21
+
+    @pytest.mark.parametrize("case", list(AlgorithmLibrary.oll_algorithms))
+    def test_recognize_oll(self, setup_library, case):
+        moves = Notation.expand(AlgorithmLibrary.oll_algorithms[case])
+        for before in ([], ["U"], ["U2"], ["U'"]):
+            for after in ([], ["U"], ["U2"], ["U'"]):
+                scramble = after + Notation.invert(moves) + before
+                recognition = setup_library.recognize_state(setup_state(scramble))
+
+                assert recognition.step == "OLL"
+                solved = CompactCube.apply_sequence(
+                    CompactCube.solved, scramble + list(recognition.moves)
+                )
+                assert all(value % 3 == 0 for value in solved[:8])
+                assert all(value % 2 == 0 for value in solved[8:])
+                assert solved[4:8] == CompactCube.solved[4:8]
+                assert solved[12:] == CompactCube.solved[12:]
+
+    @pytest.mark.parametrize("case", list(AlgorithmLibrary.pll_algorithms))
+    def test_recognize_pll(self, setup_library, case):
+        moves = Notation.expand(AlgorithmLibrary.pll_algorithms[case])
+        for before in ([], ["U"], ["U2"], ["U'"]):
+            for after in ([], ["U"], ["U2"], ["U'"]):
+                scramble = after + Notation.invert(moves) + before
+                recognition = setup_library.recognize_state(setup_state(scramble))
+
+                assert (recognition.step, recognition.case) == ("PLL", case)
+                solved = CompactCube.apply_sequence(
+                    CompactCube.solved, scramble + list(recognition.moves)
+                )
+                assert solved == CompactCube.solved
+
+    def test_recognize_cube(self, setup_library):
+        cube = CubeFactory().create_solved_cube()
+        t_perm = Notation.expand(AlgorithmLibrary.pll_algorithms["T"])
+        Notation.apply(cube, Notation.invert(t_perm))
+        Notation.apply(cube, Notation.invert(Notation.expand("R U R' U' R' F R F'")))
+        recognition = setup_library.recognize(cube)
+        assert (recognition.step, recognition.case) == ("OLL", "33")
+
+        Notation.apply(cube, recognition.moves)
+        recognition = setup_library.recognize(cube)
+        assert (recognition.step, recognition.case) == ("PLL", "T")
+
+        Notation.apply(cube, recognition.moves)
+        assert cube.is_solved() is True
+        assert setup_library.recognize(cube) is None
+
+    def test_auf_only(self, setup_library):
+        recognition = setup_library.recognize_state(setup_state(["U2"]))
+        assert recognition.case == "skip"
+        assert recognition.moves == ("U2",)
+
+    def test_unrecognized(self, setup_library):
+        assert setup_library.recognize_state(StateCodec.solved_state) is None
+        assert setup_library.recognize_state(setup_state(["R"])) is None
+
+    def test_recognize_states(self, setup_library):
+        states = [setup_state(["U"]), setup_state(["F"])]
+        recognitions = setup_library.recognize_states(states)
+        assert recognitions[0].step == "PLL"
+        assert recognitions[1] is None
+
+    def test_recognition_is_fast(self, setup_library):
+        rng = random.Random(2)
+        algorithms = list(AlgorithmLibrary.pll_algorithms.values())
+        moves = Notation.expand(rng.choice(algorithms))
+        state = setup_state(Notation.invert(moves))
+        recognize = lambda: setup_library.recognize_state(state)  # noqa: E731
+        seconds = timeit.timeit(recognize, number=1000)
+        assert seconds / 1000 < 50e-6
+
+    def test_recognize_compact(self, setup_library):
+        moves = Notation.expand(AlgorithmLibrary.oll_algorithms["45"])
+        state = CompactCube.apply_sequence(CompactCube.solved, Notation.invert(moves))
+        assert setup_library.recognize_compact(state).case == "45"
+
+        moves = Notation.expand(AlgorithmLibrary.pll_algorithms["Ua"])
+        state = CompactCube.apply_sequence(CompactCube.solved, Notation.invert(moves))
+        assert setup_library.recognize_compact(state).case == "Ua"
+        assert setup_library.recognize_compact(CompactCube.apply(state, "R")) is None
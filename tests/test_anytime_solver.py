@@ -0,0 +1,97 @@
+from rubiks_cube import (
+    AnytimeSolver,
+    CompactCube,
+    CubeSymmetry,
+    IDASolver,
+    Notation,
+)
+import itertools
+import pytest
+import types
+
+
+def scrambled(text: str) -> tuple[int, ...]:
+    return CompactCube.apply_sequence(CompactCube.solved, Notation.parse(text))
+
+
+@pytest.fixture(scope="module")
+def setup_solver():
+    return AnytimeSolver()
+
+
+class TestAnytimeSolver:
+    def test_solved_state(self, setup_solver):
+        result = setup_solver.solve_state(CompactCube.solved, 1.0)
+        assert result.moves == []
+        assert result.optimal
+
+    def test_reaches_optimal(self, setup_solver):
+        state = scrambled("R U F' L2 D")
+        result = setup_solver.solve_state(state, 30.0)
+        assert result.optimal
+        assert result.gap == 0
+        assert result.length == len(IDASolver().solve_state(state).moves)
+        assert CompactCube.apply_sequence(state, result.moves) == CompactCube.solved
+
+    def test_results_improve(self, setup_solver):
+        state = scrambled("R U2 D' B D' F L2 U R' B2 D F' L U' B R2 D L' F U")
+        results = list(setup_solver.improve(state, 0.5))
+        assert results
+        assert results[-1].elapsed < 1.0
+        for result in results:
+            assert CompactCube.apply_sequence(state, result.moves) == CompactCube.solved
+            assert result.lower_bound <= result.length
+        for previous, result in zip(results, results[1:]):
+            assert (
+                result.length < previous.length
+                or result.lower_bound > previous.lower_bound
+            )
+
+    def test_deadline_still_returns_solution(self, setup_solver):
+        state = scrambled("R U2 D' B D' F L2 U R' B2 D F' L U' B R2 D L' F U")
+        result = setup_solver.solve_state(state, 0.0)
+        assert result.source == "steps:original"
+        assert CompactCube.apply_sequence(state, result.moves) == CompactCube.solved
+        assert result.gap == result.length - result.lower_bound
+
+    def test_meets_short_deadline(self, setup_solver, monkeypatch):
+        # One clock advancing 0.1 ms per reading drives both the step phase
+        # and the search, so the overrun past the budget is deterministic.
+        ticks = itertools.count()
+        fake_time = types.SimpleNamespace(perf_counter=lambda: next(ticks) / 10000)
+        monkeypatch.setattr("rubiks_cube.anytime_solver.time", fake_time)
+        monkeypatch.setattr("rubiks_cube.ida_solver.time", fake_time)
+        state = scrambled("R U2 D' B D' F L2 U R' B2 D F' L U' B R2 D L' F U")
+        result = setup_solver.solve_state(state, 0.05)
+        assert result.elapsed <= 0.05 + 0.001
+        assert CompactCube.apply_sequence(state, result.moves) == CompactCube.solved
+
+    def test_solve_cube(self, setup_solver):
+        cube = CompactCube.to_cube(scrambled("R U F"))
+        result = setup_solver.solve(cube, 10.0)
+        assert result.optimal
+        assert result.length == 3
+
+    def test_race(self):
+        with AnytimeSolver(processes=3) as solver:
+            for text in ("R U F' L2 D", "F2 L' U B D2 R'"):
+                state = scrambled(text)
+                result = solver.solve_state(state, 30.0)
+                assert result.optimal
+                assert result.source.startswith(("search:", "steps:"))
+                assert (
+                    CompactCube.apply_sequence(state, result.moves)
+                    == CompactCube.solved
+                )
+
+    def test_race_restores_variants(self):
+        state = scrambled("B' D L2 F U' R")
+        variants = {
+            "original": state,
+            "inverse": CompactCube.inverse(state),
+            "conjugate": CubeSymmetry.conjugate(state, AnytimeSolver.race_symmetry),
+        }
+        for name, variant in variants.items():
+            moves = IDASolver().solve_state(variant).moves
+            restored = AnytimeSolver._restore(name, moves)
+            assert CompactCube.apply_sequence(state, restored) == CompactCube.solved
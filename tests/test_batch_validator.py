@@ -0,0 +1,73 @@
+from rubiks_cube import BatchValidator, CubieCube, Scrambler, StateCodec, Validator
+import pytest
+import random
+
+
+class TestBatchValidator:
+    @pytest.fixture
+    def setup_states(self):
+        scrambled = CubieCube()
+        for face_key in "rbwgoy":
+            scrambled.move(face_key)
+        bad_code = bytearray(StateCodec.solved_state)
+        bad_code[0] = 9
+        bad_center = bytearray(StateCodec.solved_state)
+        bad_center[4], bad_center[13] = 1, 0
+        return [
+            StateCodec.solved_state,
+            scrambled.to_facelets(),
+            bytes(bad_code),
+            bytes(bad_center),
+            CubieCube(co=[1, 0, 0, 0, 0, 0, 0, 0]).to_facelets(),
+            CubieCube(eo=[1] + [0] * 11).to_facelets(),
+            CubieCube(ep=[1, 0] + list(range(2, 12))).to_facelets(),
+            StateCodec.solved_state[:53],
+        ]
+
+    @staticmethod
+    def _single_reason(state):
+        try:
+            Validator.validate_state(state)
+        except ValueError as error:
+            return str(error)
+        return None
+
+    def test_matches_validator(self, setup_states):
+        reasons = BatchValidator.validate_states(setup_states)
+
+        assert reasons[:2] == [None, None]
+        assert all(reason is not None for reason in reasons[2:])
+        assert reasons == [self._single_reason(state) for state in setup_states]
+
+    def test_packed_buffer(self, setup_states):
+        records = setup_states[:-1]
+        reasons = BatchValidator.validate_states(b"".join(records))
+        assert reasons == BatchValidator.validate_states(records)
+
+    def test_packed_buffer_invalid_length(self):
+        with pytest.raises(ValueError, match="multiple of 54"):
+            BatchValidator.validate_states(bytes(100))
+
+    def test_empty_batch(self):
+        assert BatchValidator.validate_states([]) == []
+
+    def test_matches_validator_on_random_corruptions(self):
+        rng = random.Random(5)
+        states = []
+        for state in Scrambler(seed=5).states(300, 20):
+            record = bytearray(state)
+            kind = rng.randrange(4)
+            if kind == 1:
+                first, second = rng.sample(range(StateCodec.state_len), 2)
+                record[first], record[second] = record[second], record[first]
+            elif kind == 2:
+                record[rng.randrange(StateCodec.state_len)] = rng.randrange(6)
+            elif kind == 3:
+                # Swap two whole edges, which only breaks the parity.
+                for first, second in zip(*rng.sample(CubieCube.edge_facelets, 2)):
+                    record[first], record[second] = record[second], record[first]
+            states.append(bytes(record))
+
+        reasons = BatchValidator.validate_states(b"".join(states))
+        assert reasons == [self._single_reason(state) for state in states]
+        assert 0 < reasons.count(None) < len(states)
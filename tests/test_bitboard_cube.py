@@ -0,0 +1,63 @@
+from rubiks_cube import BitboardCube, CubeFactory, Notation, StateCodec
+import pytest
+import random
+
+
+class TestBitboardCube:
+    def test_solved(self):
+        cube = BitboardCube()
+        assert cube.is_solved() is True
+        assert cube.encode() == StateCodec.solved_state
+
+    @pytest.mark.parametrize("face_key", ["r", "o", "g", "b", "w", "y"])
+    @pytest.mark.parametrize("clockwise", [True, False])
+    def test_rotation_matches_cube(self, face_key, clockwise):
+        cube = CubeFactory().create_solved_cube()
+        cube.shuffle(20, 100)
+        bitboard = BitboardCube.from_cube(cube)
+        cube.rotate_face(cube._get_face_by_key(face_key), clockwise)
+        bitboard.rotate(face_key, clockwise)
+        assert bitboard.encode() == StateCodec.encode(cube)
+
+    def test_face_turn_is_ring_rotation(self):
+        cube = BitboardCube.from_state(StateCodec.encode(CubeFactory().create_solved_cube()))
+        cube.apply(Notation.parse("R U F"))
+        ring = cube._faces[StateCodec._key_codes["w"]]
+        cube.rotate("w", True)
+        rotated = ((ring << 6) | (ring >> 18)) & BitboardCube.ring_mask
+        assert cube._faces[StateCodec._key_codes["w"]] == rotated
+
+    def test_moves_match_cube(self):
+        rng = random.Random(9)
+        cube = CubeFactory().create_solved_cube()
+        bitboard = BitboardCube()
+        for _ in range(200):
+            move = rng.choice(Notation.moves)
+            Notation.apply(cube, [move])
+            bitboard.apply([move])
+            assert bitboard.encode() == StateCodec.encode(cube)
+
+    def test_face_conversion(self):
+        cube = CubeFactory().create_solved_cube()
+        cube.shuffle(35, 100)
+        bitboard = BitboardCube.from_cube(cube)
+        for key, face in zip(StateCodec.face_keys, bitboard.to_faces()):
+            assert face.get_face_matrix() == cube._get_face_by_key(key).get_face_matrix()
+        assert StateCodec.encode(bitboard.to_cube()) == StateCodec.encode(cube)
+        assert BitboardCube.from_state(bitboard.encode()) == bitboard
+
+    def test_key(self):
+        first = BitboardCube()
+        second = BitboardCube()
+        first.apply(Notation.parse("R U R' U'"))
+        second.apply(Notation.parse("R U R' U'"))
+        assert first.key() == second.key()
+        assert first.key() != BitboardCube().key()
+        assert first.key().bit_length() <= 6 * BitboardCube.ring_bits
+        copy = first.copy()
+        copy.apply(["U"])
+        assert copy.key() != first.key()
+
+    def test_wrong_length(self):
+        with pytest.raises(ValueError):
+            BitboardCube.from_state(bytes(53))
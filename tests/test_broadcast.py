@@ -0,0 +1,165 @@
+from rubiks_cube import (
+    BroadcastPublisher,
+    BroadcastSubscriber,
+    Notation,
+    SlimCube,
+    StateCodec,
+)
+import pytest
+
+
+def scrambled(text: str) -> bytes:
+    cube = SlimCube()
+    cube.apply(Notation.parse(text))
+    return cube.encode()
+
+
+class TestBroadcast:
+    def test_move_frames(self):
+        frames = []
+        publisher = BroadcastPublisher(frames.append)
+        subscriber = BroadcastSubscriber()
+        for move in Notation.parse("R U2 D' B D'"):
+            publisher.publish_move(move)
+        for frame in frames:
+            subscriber.receive(frame)
+        assert len(frames[0]) == 5 + StateCodec.state_len
+        assert all(len(frame) == 6 for frame in frames[1:])
+        assert subscriber.encode() == scrambled("R U2 D' B D'")
+        assert publisher.bytes_sent == sum(len(frame) for frame in frames)
+
+    def test_delta_frames(self):
+        frames = []
+        publisher = BroadcastPublisher(frames.append)
+        subscriber = BroadcastSubscriber()
+        subscriber.receive(frames[0])
+        frame = publisher.publish_state(scrambled("R"))
+        # From solved, a quarter turn recolors only the 12 neighbor stickers.
+        assert len(frame) == 5 + 7 + 12
+        subscriber.receive(frame)
+        subscriber.receive(publisher.publish_cube(StateCodec.decode(scrambled("F2 L"))))
+        assert subscriber.encode() == scrambled("F2 L")
+        assert StateCodec.encode(subscriber.to_cube()) == scrambled("F2 L")
+
+    def test_stream(self):
+        stream = bytearray()
+        publisher = BroadcastPublisher(stream.extend, keyframe_interval=4)
+        for move in Notation.parse("R U F' L2 D B R2"):
+            publisher.publish_move(move)
+        publisher.publish_state(scrambled("U"))
+        subscriber = BroadcastSubscriber()
+        # Split the stream at arbitrary points.
+        received = 0
+        for start in range(0, len(stream), 7):
+            received += subscriber.feed(bytes(stream[start : start + 7]))
+        assert received == 9
+        assert subscriber.frames == 9
+        assert subscriber.encode() == scrambled("U")
+
+    def test_periodic_keyframes(self):
+        frames = []
+        publisher = BroadcastPublisher(frames.append, keyframe_interval=3)
+        for move in Notation.parse("R U F' L2 D B"):
+            publisher.publish_move(move)
+        keyframes = [
+            number
+            for number, frame in enumerate(frames)
+            if frame[0] == BroadcastPublisher.keyframe_type
+        ]
+        assert keyframes == [0, 3, 6]
+        assert frames[3][5:] == scrambled("R U F'")
+
+    def test_late_join_and_lost_frames(self):
+        frames = []
+        publisher = BroadcastPublisher(frames.append, keyframe_interval=4)
+        for move in Notation.parse("R U F' L2 D B R2"):
+            publisher.publish_move(move)
+        late = BroadcastSubscriber()
+        for frame in frames[1:]:
+            late.receive(frame)
+        assert late.encode() == publisher.encode()
+        assert late.skipped == 3
+
+        lossy = BroadcastSubscriber()
+        for number, frame in enumerate(frames):
+            if number != 5:
+                lossy.receive(frame)
+        assert lossy.skipped == 2
+        assert not lossy.synced
+        assert lossy.to_cube() is None
+        publisher.keyframe()
+        lossy.receive(frames[-1])
+        assert lossy.encode() == publisher.encode()
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            BroadcastPublisher(print, keyframe_interval=0)
+        with pytest.raises(ValueError):
+            BroadcastPublisher(print, state=b"")
+        publisher = BroadcastPublisher(lambda frame: None)
+        with pytest.raises(ValueError):
+            publisher.publish_move("x")
+        with pytest.raises(ValueError):
+            BroadcastSubscriber().feed(b"\x09\x00\x00\x00\x00")
+
+    def test_truncated_frames(self):
+        frames = []
+        publisher = BroadcastPublisher(frames.append)
+        publisher.publish_move("R")
+        publisher.publish_state(scrambled("R U"))
+        keyframe, move, delta = frames
+        header = bytes((BroadcastPublisher.delta_type, 3, 0, 0, 0))
+        beyond_cube = header + (1 << 54).to_bytes(7, "little") + b"\x00"
+        truncated = [keyframe[:15], move[:5], delta[:-1], keyframe[:3], beyond_cube]
+        for index, frame in enumerate(truncated):
+            subscriber = BroadcastSubscriber()
+            subscriber.receive(keyframe)
+            for complete in frames[1 : min(index, 2)]:
+                subscriber.receive(complete)
+            with pytest.raises(ValueError):
+                subscriber.receive(frame)
+            assert not subscriber.synced
+
+        with pytest.raises(ValueError):
+            BroadcastSubscriber().feed(beyond_cube)
+
+    def test_resyncs_after_framing_error(self):
+        frames = []
+        publisher = BroadcastPublisher(frames.append)
+        subscriber = BroadcastSubscriber()
+        subscriber.feed(frames[0])
+        with pytest.raises(ValueError):
+            subscriber.feed(b"\x09\x00\x00\x00\x00" + bytes(64))
+        assert not subscriber.synced
+
+        publisher.publish_move("R")
+        publisher.keyframe()
+        assert subscriber.feed(frames[1] + frames[2]) == 2
+        assert subscriber.encode() == scrambled("R")
+
+    def test_bad_frame_mid_chunk(self):
+        stream = bytearray()
+        publisher = BroadcastPublisher(stream.extend)
+        publisher.publish_move("R")
+        # A move frame with sequence number 2 and an out-of-range move code.
+        stream += bytes((BroadcastPublisher.move_type, 2, 0, 0, 0, 200))
+        subscriber = BroadcastSubscriber()
+        with pytest.raises(ValueError):
+            subscriber.feed(bytes(stream))
+        assert subscriber.frames == 3
+        assert not subscriber.synced
+
+        # The frames before the error are not replayed by the next chunk.
+        stream.clear()
+        publisher.keyframe()
+        publisher.publish_move("U")
+        assert subscriber.feed(bytes(stream)) == 2
+        assert subscriber.frames == 5
+        assert subscriber.encode() == scrambled("R U")
+
+    def test_starts_solved(self):
+        frames = []
+        BroadcastPublisher(frames.append)
+        subscriber = BroadcastSubscriber()
+        subscriber.feed(frames[0])
+        assert subscriber.to_cube().is_solved()
@@ -0,0 +1,37 @@
+from rubiks_cube import CompactCube, CubeFactory, CubieCube, Notation
+import random
+
+
+class TestCompactCube:
+    def test_solved(self):
+        cube = CubeFactory().create_solved_cube()
+        assert CompactCube.from_cube(cube) == CompactCube.solved
+        assert CompactCube.to_cubie(CompactCube.solved) == CubieCube()
+
+    def test_moves_match_sticker_cube(self):
+        rng = random.Random(11)
+        cube = CubeFactory().create_solved_cube()
+        state = CompactCube.solved
+        for _ in range(200):
+            move = rng.choice(Notation.moves)
+            Notation.apply(cube, [move])
+            state = CompactCube.apply(state, move)
+            assert CompactCube.from_cube(cube) == state
+
+    def test_apply_sequence_and_inverse(self):
+        moves = Notation.parse("R U R' U' F2 L")
+        state = CompactCube.apply_sequence(CompactCube.solved, moves)
+        assert state != CompactCube.solved
+        assert CompactCube.apply_sequence(state, Notation.invert(moves)) == CompactCube.solved
+
+    def test_round_trip(self):
+        cube = CubeFactory().create_solved_cube()
+        cube.shuffle(35, 100)
+        state = CompactCube.from_cube(cube)
+        assert CompactCube.from_cube(CompactCube.to_cube(state)) == state
+
+    def test_multiply_matches_moves(self):
+        state = CompactCube.apply_sequence(CompactCube.solved, ["R", "U2", "F'"])
+        move = CompactCube.apply(CompactCube.solved, "L")
+        assert CompactCube.multiply(state, move) == CompactCube.apply(state, "L")
+        assert CompactCube.multiply(state, CompactCube.inverse(state)) == CompactCube.solved
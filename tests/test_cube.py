@@ -1,5 +1,75 @@
-from rubiks_cube import CubeFactory
+from rubiks_cube import Cube, CubeFactory, CubieCube, Face, StateCodec
+from rubiks_cube.move_tables import sticker_cycles, sticker_permutations
 import pytest
+import random
+
+
+# Labeled-sticker permutation of every quarter turn as produced by the
+# neighbor-strip rotate_face that the move tables replaced, recorded from
+# that implementation: position i of a turned cube holds the sticker that
+# was at legacy_permutations[turn][i].
+legacy_permutations = {
+    ("r", True): (
+        6, 3, 0, 7, 4, 1, 8, 5, 2, 9, 10, 11, 12, 13, 14, 15, 16, 17,
+        18, 19, 51, 21, 22, 48, 24, 25, 45, 44, 28, 29, 41, 31, 32, 38, 34, 35,
+        36, 37, 20, 39, 40, 23, 42, 43, 26, 27, 46, 47, 30, 49, 50, 33, 52, 53,
+    ),
+    ("r", False): (
+        2, 5, 8, 1, 4, 7, 0, 3, 6, 9, 10, 11, 12, 13, 14, 15, 16, 17,
+        18, 19, 38, 21, 22, 41, 24, 25, 44, 45, 28, 29, 48, 31, 32, 51, 34, 35,
+        36, 37, 33, 39, 40, 30, 42, 43, 27, 26, 46, 47, 23, 49, 50, 20, 52, 53,
+    ),
+    ("o", True): (
+        0, 1, 2, 3, 4, 5, 6, 7, 8, 15, 12, 9, 16, 13, 10, 17, 14, 11,
+        36, 19, 20, 39, 22, 23, 42, 25, 26, 27, 28, 47, 30, 31, 50, 33, 34, 53,
+        35, 37, 38, 32, 40, 41, 29, 43, 44, 45, 46, 24, 48, 49, 21, 51, 52, 18,
+    ),
+    ("o", False): (
+        0, 1, 2, 3, 4, 5, 6, 7, 8, 11, 14, 17, 10, 13, 16, 9, 12, 15,
+        53, 19, 20, 50, 22, 23, 47, 25, 26, 27, 28, 42, 30, 31, 39, 33, 34, 36,
+        18, 37, 38, 21, 40, 41, 24, 43, 44, 45, 46, 29, 48, 49, 32, 51, 52, 35,
+    ),
+    ("g", True): (
+        42, 1, 2, 43, 4, 5, 44, 7, 8, 9, 10, 53, 12, 13, 52, 15, 16, 51,
+        24, 21, 18, 25, 22, 19, 26, 23, 20, 27, 28, 29, 30, 31, 32, 33, 34, 35,
+        36, 37, 38, 39, 40, 41, 17, 14, 11, 45, 46, 47, 48, 49, 50, 0, 3, 6,
+    ),
+    ("g", False): (
+        51, 1, 2, 52, 4, 5, 53, 7, 8, 9, 10, 44, 12, 13, 43, 15, 16, 42,
+        20, 23, 26, 19, 22, 25, 18, 21, 24, 27, 28, 29, 30, 31, 32, 33, 34, 35,
+        36, 37, 38, 39, 40, 41, 0, 3, 6, 45, 46, 47, 48, 49, 50, 17, 14, 11,
+    ),
+    ("b", True): (
+        0, 1, 45, 3, 4, 46, 6, 7, 47, 38, 10, 11, 37, 13, 14, 36, 16, 17,
+        18, 19, 20, 21, 22, 23, 24, 25, 26, 33, 30, 27, 34, 31, 28, 35, 32, 29,
+        2, 5, 8, 39, 40, 41, 42, 43, 44, 15, 12, 9, 48, 49, 50, 51, 52, 53,
+    ),
+    ("b", False): (
+        0, 1, 36, 3, 4, 37, 6, 7, 38, 47, 10, 11, 46, 13, 14, 45, 16, 17,
+        18, 19, 20, 21, 22, 23, 24, 25, 26, 29, 32, 35, 28, 31, 34, 27, 30, 33,
+        15, 12, 9, 39, 40, 41, 42, 43, 44, 2, 5, 8, 48, 49, 50, 51, 52, 53,
+    ),
+    ("w", True): (
+        27, 28, 29, 3, 4, 5, 6, 7, 8, 18, 19, 20, 12, 13, 14, 15, 16, 17,
+        0, 1, 2, 21, 22, 23, 24, 25, 26, 9, 10, 11, 30, 31, 32, 33, 34, 35,
+        42, 39, 36, 43, 40, 37, 44, 41, 38, 45, 46, 47, 48, 49, 50, 51, 52, 53,
+    ),
+    ("w", False): (
+        18, 19, 20, 3, 4, 5, 6, 7, 8, 27, 28, 29, 12, 13, 14, 15, 16, 17,
+        9, 10, 11, 21, 22, 23, 24, 25, 26, 0, 1, 2, 30, 31, 32, 33, 34, 35,
+        38, 41, 44, 37, 40, 43, 36, 39, 42, 45, 46, 47, 48, 49, 50, 51, 52, 53,
+    ),
+    ("y", True): (
+        0, 1, 2, 3, 4, 5, 24, 25, 26, 9, 10, 11, 12, 13, 14, 33, 34, 35,
+        18, 19, 20, 21, 22, 23, 15, 16, 17, 27, 28, 29, 30, 31, 32, 6, 7, 8,
+        36, 37, 38, 39, 40, 41, 42, 43, 44, 51, 48, 45, 52, 49, 46, 53, 50, 47,
+    ),
+    ("y", False): (
+        0, 1, 2, 3, 4, 5, 33, 34, 35, 9, 10, 11, 12, 13, 14, 24, 25, 26,
+        18, 19, 20, 21, 22, 23, 6, 7, 8, 27, 28, 29, 30, 31, 32, 15, 16, 17,
+        36, 37, 38, 39, 40, 41, 42, 43, 44, 47, 50, 53, 46, 49, 52, 45, 48, 51,
+    ),
+}
 
 
 class TestCube:
@@ -104,12 +174,10 @@ class TestCube:
 
         rotated_face = cube._get_face_by_key(face_key)
         cube.rotate_face(rotated_face, clockwise)
-        converted_matrixes = setup_factory._convert_key_matrix(
-            list(expected_faces.values())
-        )
+        expected_cube = StateCodec.decode(StateCodec.encode_key_matrixes(expected_faces))
 
-        for actual_matrix, expected_face in zip(converted_matrixes, faces):
-            assert actual_matrix == expected_face.get_face_matrix()
+        for expected_face, face in zip(expected_cube._faces_dict.values(), faces):
+            assert expected_face.get_face_matrix() == face.get_face_matrix()
 
     def test_cube_shuffle(self, setup_factory):
         factory = setup_factory
@@ -126,3 +194,79 @@ class TestCube:
             )
             is False
         )
+
+    def test_shuffle_is_reproducible(self, setup_factory):
+        first = setup_factory.create_solved_cube()
+        second = setup_factory.create_solved_cube()
+        first.shuffle(35, 100, rng=7)
+        second.shuffle(35, 100, rng=random.Random(7))
+        assert StateCodec.encode(first) == StateCodec.encode(second)
+        second.shuffle(35, 100, rng=8)
+        assert StateCodec.encode(first) != StateCodec.encode(second)
+
+    def test_shuffle_makes_exact_move_count(self, setup_factory):
+        cube = setup_factory.create_solved_cube()
+        rotations = []
+        rotate_face = cube.rotate_face
+        cube.rotate_face = lambda face, clockwise: (
+            rotations.append((cube._face_keys[face], clockwise)),
+            rotate_face(face, clockwise),
+        )
+        cube.shuffle(100, 100, rng=3)
+        assert len(rotations) == 100
+        assert all(
+            key != last_key or clockwise == last_clockwise
+            for (last_key, last_clockwise), (key, clockwise) in zip(
+                rotations, rotations[1:]
+            )
+        )
+        with pytest.raises(ValueError):
+            cube.shuffle(101, 100)
+
+    @pytest.mark.parametrize("face_key", ["r", "o", "g", "b", "w", "y"])
+    @pytest.mark.parametrize("clockwise", [True, False])
+    def test_sticker_cycles(self, face_key, clockwise):
+        cycles = sticker_cycles[face_key, clockwise]
+        moved = [index for cycle in cycles for index in cycle]
+        assert all(len(cycle) == 4 for cycle in cycles)
+        assert len(moved) == len(set(moved)) == 20
+        assert not set(moved) & set(StateCodec.center_indices)
+        inverse = sticker_cycles[face_key, not clockwise]
+        assert sorted(cycle[::-1] for cycle in inverse) == sorted(cycles)
+
+    @pytest.mark.parametrize("face_key", ["r", "o", "g", "b", "w", "y"])
+    @pytest.mark.parametrize("clockwise", [True, False])
+    def test_rotation_matches_legacy_rotation(self, face_key, clockwise):
+        # Label every sticker with its own index so that the turn reveals the
+        # full permutation, not just the colors.
+        labels = iter(range(StateCodec.state_len))
+        cube = Cube(
+            [
+                Face([[next(labels) for _ in range(3)] for _ in range(3)])
+                for _ in range(6)
+            ]
+        )
+        cube.rotate_face(cube._get_face_by_key(face_key), clockwise)
+        cells = [
+            cell
+            for face in cube._faces_dict.values()
+            for row in face.get_face_matrix()
+            for cell in row
+        ]
+        assert tuple(cells) == legacy_permutations[face_key, clockwise]
+        assert sticker_permutations[face_key, clockwise] == legacy_permutations[
+            face_key, clockwise
+        ]
+
+    def test_every_two_move_sequence_matches_cubie_cube(self, setup_factory):
+        # The piece model has hard-coded moves, so it checks the sticker
+        # table independently. Its facelets identify every non-center sticker.
+        turns = [(key, clockwise) for key in "rogbwy" for clockwise in (True, False)]
+        for first in turns:
+            for second in turns:
+                cube = setup_factory.create_solved_cube()
+                cubie_cube = CubieCube()
+                for face_key, clockwise in (first, second):
+                    cube.rotate_face(cube._get_face_by_key(face_key), clockwise)
+                    cubie_cube.move(face_key, clockwise)
+                assert StateCodec.encode(cube) == cubie_cube.to_facelets()
@@ -0,0 +1,112 @@
+from rubiks_cube import CubeLibrary, StateCodec
+import json
+import pytest
+
+
+SOLVED_FACES = {
+    "red": [["r", "r", "r"], ["r", "r", "r"], ["r", "r", "r"]],
+    "orange": [["o", "o", "o"], ["o", "o", "o"], ["o", "o", "o"]],
+    "green": [["g", "g", "g"], ["g", "g", "g"], ["g", "g", "g"]],
+    "blue": [["b", "b", "b"], ["b", "b", "b"], ["b", "b", "b"]],
+    "white": [["w", "w", "w"], ["w", "w", "w"], ["w", "w", "w"]],
+    "yellow": [["y", "y", "y"], ["y", "y", "y"], ["y", "y", "y"]],
+}
+TURNED_FACES = {
+    "red": [["b", "b", "b"], ["r", "r", "r"], ["r", "r", "r"]],
+    "orange": [["g", "g", "g"], ["o", "o", "o"], ["o", "o", "o"]],
+    "green": [["r", "r", "r"], ["g", "g", "g"], ["g", "g", "g"]],
+    "blue": [["o", "o", "o"], ["b", "b", "b"], ["b", "b", "b"]],
+    "white": [["w", "w", "w"], ["w", "w", "w"], ["w", "w", "w"]],
+    "yellow": [["y", "y", "y"], ["y", "y", "y"], ["y", "y", "y"]],
+}
+NINE_REDS = {**SOLVED_FACES, "orange": [["r", "o", "o"], ["o", "o", "o"], ["o", "o", "o"]]}
+
+
+class TestCubeLibrary:
+    @pytest.fixture
+    def setup_records(self):
+        return [
+            {"faces": SOLVED_FACES},
+            {"faces": TURNED_FACES},
+            {"faces": NINE_REDS},
+            {"no_faces": 1},
+        ]
+
+    @staticmethod
+    def _check(records):
+        assert [record.index for record in records] == [0, 1, 2, 3]
+        assert records[0].state == StateCodec.solved_state
+        assert records[1].error is None
+        assert records[1].to_cube().is_solved() is False
+        assert records[2].error == "Color 'r' appears 10 times instead of 9!"
+        assert records[3].error == "Missing key: 'faces'"
+
+    def test_json_lines(self, tmp_path, setup_records):
+        lines = [json.dumps(record) for record in setup_records]
+        lines.insert(2, "")
+        (tmp_path / "lib.jsonl").write_text("\n".join(lines))
+
+        self._check(list(CubeLibrary().iter_records("lib.jsonl", tmp_path)))
+
+    def test_json_lines_bad_line(self, tmp_path):
+        (tmp_path / "lib.jsonl").write_text('{"faces": \n' + json.dumps({"faces": SOLVED_FACES}))
+        records = list(CubeLibrary().iter_records("lib.jsonl", tmp_path))
+
+        assert records[0].error is not None
+        assert records[1].error is None
+
+    def test_malformed_faces_do_not_abort(self, tmp_path):
+        malformed = [
+            {"faces": ["red", "orange", "green", "blue", "white", "yellow"]},
+            {"faces": "rogbwy"},
+            {"faces": {**SOLVED_FACES, "red": "rrrrrrrrr"}},
+            {"faces": {**SOLVED_FACES, "red": ["rrr", "rrr", "rrr"]}},
+        ]
+        records = [{"faces": SOLVED_FACES}, *malformed, {"faces": TURNED_FACES}]
+        lines = [json.dumps(record) for record in records]
+        (tmp_path / "lib.jsonl").write_text("\n".join(lines))
+        decoded = list(CubeLibrary().iter_records("lib.jsonl", tmp_path))
+
+        assert len(decoded) == 6
+        assert decoded[0].state == StateCodec.solved_state
+        assert all(record.error is not None for record in decoded[1:5])
+        assert decoded[5].error is None
+
+    def test_non_object_records(self, tmp_path):
+        lines = ['["faces"]', "42", '"faces"', json.dumps({"faces": SOLVED_FACES})]
+        (tmp_path / "lib.jsonl").write_text("\n".join(lines))
+        records = list(CubeLibrary().iter_records("lib.jsonl", tmp_path))
+
+        assert [record.error for record in records[:3]] == [
+            "Cube record must be a JSON object!"
+        ] * 3
+        assert records[3].error is None
+
+    def test_json_array_small_reads(self, tmp_path, setup_records, monkeypatch):
+        monkeypatch.setattr(CubeLibrary, "read_size", 7)
+        data = {"version": 1.25, "cubes": setup_records, "tags": ["a", "b"]}
+        (tmp_path / "lib.json").write_text(json.dumps(data, indent=2))
+
+        self._check(list(CubeLibrary().iter_records("lib.json", tmp_path)))
+
+    def test_single_cube_file(self):
+        cubes = list(CubeLibrary().iter_cubes("input.json"))
+        assert len(cubes) == 1
+        assert cubes[0].is_solved() is False
+
+    def test_malformed_array(self, tmp_path):
+        (tmp_path / "lib.json").write_text('{"cubes": [{"faces": {}} {"faces": {}}]}')
+        with pytest.raises(ValueError, match="Malformed library file"):
+            list(CubeLibrary().iter_records("lib.json", tmp_path))
+
+    def test_parallel_decode(self, tmp_path, setup_records):
+        lines = [json.dumps(record) for record in setup_records]
+        (tmp_path / "lib.jsonl").write_text("\n".join(lines))
+
+        library = CubeLibrary(processes=2, batch_size=3)
+        self._check(list(library.iter_records("lib.jsonl", tmp_path)))
+
+    def test_invalid_extension(self, tmp_path):
+        (tmp_path / "lib.txt").write_text("")
+        with pytest.raises(ValueError, match="Only .json and .jsonl formats are permitted!"):
+            list(CubeLibrary().iter_records("lib.txt", tmp_path))
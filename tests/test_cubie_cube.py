@@ -0,0 +1,74 @@
+from rubiks_cube import CubeFactory, CubieCube, StateCodec
+import random
+import pytest
+
+
+class TestCubieCube:
+    @pytest.fixture
+    def setup_factory(self):
+        return CubeFactory()
+
+    def test_solved_cube(self, setup_factory):
+        cube = setup_factory.create_solved_cube()
+        cubie_cube = CubieCube.from_cube(cube)
+
+        assert cubie_cube == CubieCube()
+        assert cubie_cube.is_solved() is True
+        assert cubie_cube.to_facelets() == StateCodec.solved_state
+
+    @pytest.mark.parametrize("face_key", ["r", "o", "g", "b", "w", "y"])
+    @pytest.mark.parametrize("clockwise", [True, False])
+    def test_move_matches_face_rotation(self, face_key, clockwise, setup_factory):
+        cube = setup_factory.create_solved_cube()
+        cube.rotate_face(cube._get_face_by_key(face_key), clockwise)
+        cubie_cube = CubieCube()
+        cubie_cube.move(face_key, clockwise)
+
+        assert CubieCube.from_cube(cube) == cubie_cube
+        assert cubie_cube.to_facelets() == StateCodec.encode(cube)
+
+    def test_move_sequence_matches_face_rotation(self, setup_factory):
+        rng = random.Random(7)
+        cube = setup_factory.create_solved_cube()
+        cubie_cube = CubieCube()
+        for _ in range(500):
+            face_key = rng.choice("rogbwy")
+            clockwise = rng.choice((True, False))
+            cube.rotate_face(cube._get_face_by_key(face_key), clockwise)
+            cubie_cube.move(face_key, clockwise)
+
+            assert CubieCube.from_cube(cube) == cubie_cube
+
+        assert StateCodec.encode(cubie_cube.to_cube()) == StateCodec.encode(cube)
+
+    def test_move_and_inverse(self):
+        cubie_cube = CubieCube()
+        cubie_cube.move("b", True)
+        cubie_cube.move("b", False)
+        assert cubie_cube.is_solved() is True
+
+    def test_multiply_matches_moves(self):
+        moved = CubieCube()
+        moved.move("r")
+        moved.move("w")
+        f_move = CubieCube()
+        f_move.move("r")
+        u_move = CubieCube()
+        u_move.move("w")
+
+        assert f_move.multiply(u_move) == moved
+
+    def test_find_pieces(self):
+        cubie_cube = CubieCube()
+        cubie_cube.move("b")
+
+        assert cubie_cube.find_corner("URF") == ("UBR", 1)
+        assert cubie_cube.find_edge("UR") == ("BR", 0)
+        assert cubie_cube.find_edge("UF") == ("UF", 0)
+
+    def test_unrecognized_corner(self):
+        state = bytearray(StateCodec.solved_state)
+        state[38], state[27] = state[27], state[38]
+        state[37], state[28] = state[28], state[37]
+        with pytest.raises(ValueError, match="Unrecognized corner at URF!"):
+            CubieCube.from_facelets(bytes(state))
@@ -0,0 +1,59 @@
+from rubiks_cube import CompactCube, Cycle, CycleAnalyzer, Notation
+import pytest
+
+
+def repeat_until_solved(moves: list[str]) -> int:
+    state = CompactCube.apply_sequence(CompactCube.solved, moves)
+    count = 1
+    while state != CompactCube.solved:
+        state = CompactCube.apply_sequence(state, moves)
+        count += 1
+    return count
+
+
+class TestCycleAnalyzer:
+    @pytest.mark.parametrize(
+        "sequence, order",
+        [("", 1), ("R", 4), ("R2", 2), ("R U", 105), ("R U R' U'", 6), ("R U2 D' B D'", 1260)],
+    )
+    def test_order(self, sequence, order):
+        assert CycleAnalyzer.order(Notation.parse(sequence)) == order
+
+    @pytest.mark.parametrize("sequence", ["R U", "R U R' U'", "F R' B2 L", "U R2 F' D"])
+    def test_order_matches_repetition(self, sequence):
+        moves = Notation.parse(sequence)
+        assert CycleAnalyzer.order(moves) == repeat_until_solved(moves)
+
+    def test_cycle_structure(self):
+        analysis = CycleAnalyzer.analyze(Notation.parse("U"))
+        assert analysis.cycles == [
+            Cycle("corner", (0, 1, 2, 3), 0, 4),
+            Cycle("edge", (0, 1, 2, 3), 0, 4),
+        ]
+        assert CycleAnalyzer.describe(analysis) == "(URF UFL ULB UBR) (UR UF UL UB)"
+
+    def test_cycles_follow_pieces(self):
+        state = CompactCube.apply_sequence(CompactCube.solved, Notation.parse("R U2 D' B D'"))
+        for cycle in CycleAnalyzer.analyze_state(state).cycles:
+            start, count, radix = (
+                (0, CompactCube.corner_count, 3)
+                if cycle.kind == "corner"
+                else (CompactCube.corner_count, CompactCube.edge_count, 2)
+            )
+            positions = cycle.positions
+            for i, position in enumerate(positions):
+                target = positions[(i + 1) % len(positions)]
+                assert state[start + target] // radix == position
+            assert cycle.order % len(positions) == 0
+
+    def test_power(self):
+        moves = Notation.parse("R U2 D' B D'")
+        state = CompactCube.apply_sequence(CompactCube.solved, moves)
+        repeated = CompactCube.solved
+        for k in range(12):
+            assert CycleAnalyzer.power(state, k) == repeated
+            repeated = CompactCube.apply_sequence(repeated, moves)
+        assert CycleAnalyzer.power(state, 1260) == CompactCube.solved
+        assert CycleAnalyzer.power(state, 1261) == state
+        assert CycleAnalyzer.power(state, -1) == CompactCube.inverse(state)
+        assert CycleAnalyzer.power(state, 630) != CompactCube.solved
@@ -0,0 +1,70 @@
+from rubiks_cube import CompactCube, CubieCube, DatasetExporter, IDASolver, StateCodec
+import pytest
+import zipfile
+
+
+class TestDatasetExporter:
+    def test_export(self, tmp_path):
+        paths = DatasetExporter(tmp_path, shard_size=400, walk_length=8).export(1000)
+        assert [path.name for path in paths] == [
+            "shard-00000.npz",
+            "shard-00001.npz",
+            "shard-00002.npz",
+        ]
+        sizes = []
+        for path in paths:
+            states, labels = DatasetExporter.read_shard(path)
+            assert len(states) == len(labels)
+            assert len(set(states)) == len(states)
+            assert all(len(state) == StateCodec.state_len for state in states)
+            assert all(1 <= label <= 8 for label in labels)
+            sizes.append(len(states))
+        assert sizes == [400, 400, 200]
+
+    def test_labels_bound_distance(self, tmp_path):
+        paths = DatasetExporter(tmp_path, shard_size=30, walk_length=4).export(30)
+        states, labels = DatasetExporter.read_shard(paths[0])
+        solver = IDASolver()
+        for state, label in zip(states, labels):
+            compact = CompactCube.from_cubie(CubieCube.from_facelets(state))
+            assert len(solver.solve_state(compact).moves) <= label
+
+    def test_deterministic_across_processes(self, tmp_path):
+        single = DatasetExporter(tmp_path / "a", shard_size=300, seed=4).export(900)
+        parallel = DatasetExporter(
+            tmp_path / "b", shard_size=300, seed=4, processes=2
+        ).export(900)
+        for first, second in zip(single, parallel):
+            assert first.read_bytes() == second.read_bytes()
+
+    def test_resume_keeps_written_shards(self, tmp_path):
+        exporter = DatasetExporter(tmp_path, shard_size=100, seed=2)
+        paths = exporter.export(300)
+        expected = paths[2].read_bytes()
+        paths[2].unlink()
+        before = paths[0].stat().st_mtime_ns
+        assert exporter.export(300) == paths
+        assert paths[2].read_bytes() == expected
+        assert paths[0].stat().st_mtime_ns == before
+
+    def test_other_export_rejected(self, tmp_path):
+        DatasetExporter(tmp_path, shard_size=100).export(100)
+        with pytest.raises(ValueError):
+            DatasetExporter(tmp_path, shard_size=100, seed=1).export(100)
+
+    def test_npy_header(self, tmp_path):
+        paths = DatasetExporter(tmp_path, shard_size=10).export(10)
+        with zipfile.ZipFile(paths[0]) as archive:
+            payload = archive.read("states.npy")
+        assert payload.startswith(b"\x93NUMPY\x01\x00")
+        header_len = int.from_bytes(payload[8:10], "little")
+        assert (10 + header_len) % 64 == 0
+        assert b"'shape': (10, 54)" in payload[10 : 10 + header_len]
+
+    def test_walk_length_limit(self, tmp_path):
+        with pytest.raises(ValueError):
+            DatasetExporter(tmp_path, walk_length=256)
+
+    def test_shard_larger_than_reachable_states(self, tmp_path):
+        with pytest.raises(ValueError):
+            DatasetExporter(tmp_path, shard_size=19, walk_length=1).export(19)
@@ -0,0 +1,54 @@
+from rubiks_cube import EngineFuzzer, Notation, SlimCube
+from rubiks_cube.engine_fuzzer import run_cube
+import pytest
+
+
+def run_broken_cube(moves: list[str]) -> bytes:
+    # Turns L the wrong way whenever it directly follows an R turn.
+    cube = SlimCube()
+    previous = ""
+    for move in moves:
+        if move == "L" and previous.startswith("R"):
+            move = "L'"
+        cube.apply([move])
+        previous = move
+    return cube.encode()
+
+
+class TestEngineFuzzer:
+    def test_default_engines_agree(self):
+        report = EngineFuzzer().run(200, length=20, seed=3, batch_size=50)
+        assert report.sequences == 200
+        assert report.moves == 4000
+        assert report.mismatches == []
+        assert set(report.rates) == {"reference", "slim", "bitboard", "cubie", "compact"}
+        assert all(rate > 0 for rate in report.rates.values())
+
+    def test_processes_give_same_report(self):
+        engines = {"broken": run_broken_cube}
+        single = EngineFuzzer(engines).run(300, seed=5, batch_size=100)
+        parallel = EngineFuzzer(engines, processes=2).run(300, seed=5, batch_size=100)
+        assert single.mismatches == parallel.mismatches
+
+    def test_mismatch_is_shrunk(self):
+        fuzzer = EngineFuzzer({"broken": run_broken_cube})
+        report = fuzzer.run(200, length=30, seed=1)
+        assert len(report.mismatches) == 1
+        mismatch = report.mismatches[0]
+        assert mismatch.engine == "broken"
+        assert mismatch.original_length == 30
+        assert len(mismatch.moves) == 2
+        assert mismatch.moves[0].startswith("R") and mismatch.moves[1] == "L"
+        assert mismatch.expected == run_cube(mismatch.moves)
+        assert mismatch.expected != mismatch.actual
+
+    def test_shrink_keeps_failure(self):
+        fuzzer = EngineFuzzer({"broken": run_broken_cube})
+        moves = Notation.parse("U F2 R L D B' R2 L U")
+        mismatch = fuzzer.shrink("broken", moves)
+        assert not fuzzer.check("broken", mismatch.moves)
+        assert len(mismatch.moves) == 2
+
+    def test_reserved_name(self):
+        with pytest.raises(ValueError):
+            EngineFuzzer({"reference": run_cube})
@@ -0,0 +1,130 @@
+from rubiks_cube import (
+    CompactCube,
+    CubeFactory,
+    CubieCube,
+    IDASolver,
+    Notation,
+    PatternDatabase,
+)
+from rubiks_cube.heuristics import misplaced_pieces
+from rubiks_cube.ida_solver import TranspositionTable
+import itertools
+import random
+import threading
+import types
+import pytest
+
+
+DEEP_SCRAMBLE = "R U2 D' B D' F L2 U R' B2 D F' L U' B R2 D L' F U"
+
+
+@pytest.fixture(scope="module")
+def setup_solver():
+    return IDASolver()
+
+
+@pytest.fixture(scope="module")
+def setup_distances():
+    distances = {CompactCube.solved: 0}
+    frontier = [CompactCube.solved]
+    for depth in range(1, 4):
+        next_frontier = []
+        for state in frontier:
+            for move in Notation.moves:
+                child = CompactCube.apply(state, move)
+                if child not in distances:
+                    distances[child] = depth
+                    next_frontier.append(child)
+        frontier = next_frontier
+    return distances
+
+
+class TestIDASolver:
+    def test_solved_cube(self, setup_solver):
+        result = setup_solver.solve(CubeFactory().create_solved_cube())
+        assert result.moves == []
+        assert result.status == "solved"
+
+    def test_solutions_are_optimal(self, setup_solver, setup_distances):
+        rng = random.Random(5)
+        states = rng.sample(sorted(setup_distances), 30)
+        for state in states:
+            result = setup_solver.solve_state(state)
+            assert result.status == "solved"
+            assert len(result.moves) == setup_distances[state]
+            assert CompactCube.apply_sequence(state, result.moves) == CompactCube.solved
+
+    def test_solve_sticker_cube(self, setup_solver):
+        cube = CubeFactory().create_solved_cube()
+        Notation.apply(cube, Notation.parse("R U F' L2 D"))
+        result = setup_solver.solve(cube)
+
+        assert len(result.moves) == 5
+        assert result.nodes > 0
+        assert result.nodes_per_second > 0
+        Notation.apply(cube, result.moves)
+        assert cube.is_solved() is True
+
+    def test_move_pruning(self, setup_solver):
+        after_up = [move for move, _ in setup_solver._successors["U"]]
+        after_down = [move for move, _ in setup_solver._successors["D"]]
+
+        assert len(setup_solver._successors[None]) == 18
+        assert not any(move[0] == "U" for move in after_up)
+        assert any(move[0] == "D" for move in after_up)
+        assert not any(move[0] in "UD" for move in after_down)
+
+    def test_timeout(self, setup_solver):
+        cube = CubeFactory().create_solved_cube()
+        Notation.apply(cube, Notation.parse(DEEP_SCRAMBLE))
+        result = setup_solver.solve(cube, timeout=0.2)
+
+        assert result.status == "timeout"
+        assert result.moves is None
+        assert result.elapsed < 5
+
+    def test_deadline_checked_every_interval(self, setup_solver, monkeypatch):
+        # A fake clock that advances 1 ms per reading: the search must stop
+        # at the first check after the deadline, counting pruned leaves too.
+        ticks = itertools.count()
+        fake_time = types.SimpleNamespace(perf_counter=lambda: next(ticks) / 1000)
+        monkeypatch.setattr("rubiks_cube.ida_solver.time", fake_time)
+        state = CompactCube.apply_sequence(
+            CompactCube.solved, Notation.parse(DEEP_SCRAMBLE)
+        )
+        result = setup_solver.solve_state(state, 40, timeout=0.02)
+
+        assert result.status == "timeout"
+        assert result.nodes == 21 * setup_solver.check_interval
+
+    def test_cancel(self):
+        solver = IDASolver(heuristic=misplaced_pieces)
+        event = threading.Event()
+        event.set()
+        state = CompactCube.apply_sequence(
+            CompactCube.solved, Notation.parse(DEEP_SCRAMBLE)
+        )
+        assert solver.solve_state(state, cancel_event=event).status == "cancelled"
+
+    def test_unsolvable_cube(self, setup_solver):
+        cube = CubieCube(co=[1, 0, 0, 0, 0, 0, 0, 0]).to_cube()
+        with pytest.raises(ValueError):
+            setup_solver.solve(cube)
+
+    def test_pattern_database_is_admissible(self, setup_distances):
+        database = PatternDatabase.get("corner_orientation")
+        for state, distance in setup_distances.items():
+            assert database(state) <= distance
+            assert misplaced_pieces(state) <= distance
+
+    def test_transposition_table_replacement(self):
+        table = TranspositionTable(size=1)
+        table.generation = 1
+        table.store("a", 3)
+        table.store("b", 2)
+        assert table.probe("a", 3) is True
+        assert table.probe("b", 2) is False
+
+        table.generation = 2
+        table.store("b", 2)
+        assert table.probe("b", 1) is True
@@ -0,0 +1,128 @@
+from rubiks_cube import CubeFactory, KeypressMode, Notation, RawTerminal, StateCodec
+import pytest
+import sys
+
+
+class FakeTerminal:
+    """
+    Hands out scripted key bursts, advancing a fake clock by the timeout.
+    """
+
+    def __init__(self, bursts: list[tuple[float, str]]) -> None:
+        self.bursts = list(bursts)
+        self.now = 0.0
+        self.timeouts = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def read_keys(self, timeout: float | None) -> str:
+        self.timeouts.append(timeout)
+        if not self.bursts:
+            return "q"
+        delay, keys = self.bursts.pop(0)
+        self.now += delay if timeout is None else min(delay, timeout)
+        return keys
+
+
+def setup_mode(bursts, **options):
+    cube = CubeFactory().create_solved_cube()
+    terminal = FakeTerminal(bursts)
+    frames = []
+    mode = KeypressMode(
+        cube,
+        terminal.read_keys,
+        lambda: frames.append(StateCodec.encode(cube)),
+        clock=terminal.clock,
+        **options,
+    )
+    return mode, cube, terminal, frames
+
+
+def scrambled(text: str) -> bytes:
+    cube = CubeFactory().create_solved_cube()
+    Notation.apply(cube, Notation.parse(text))
+    return StateCodec.encode(cube)
+
+
+class TestKeypressMode:
+    def test_type_ahead_burst(self):
+        mode, cube, _, frames = setup_mode([(0.1, "ijhxq")])
+        assert mode.run() is False
+        assert mode.moves == 3
+        assert StateCodec.encode(cube) == scrambled("R U F")
+        # The initial frame and the last state before quitting.
+        assert frames == [StateCodec.solved_state, scrambled("R U F")]
+
+    def test_redraws_are_coalesced(self):
+        bursts = [(0.1, "i")] + [(0.005, "j")] * 5 + [(0.1, "")]
+        mode, _, terminal, frames = setup_mode(bursts, frame_interval=0.02)
+        mode.run()
+        assert mode.moves == 6
+        assert mode.redraws < mode.moves
+        assert frames[-1] == scrambled("R U U U U U")
+        # Idle, the loop waits for keys; with a redraw pending, only until
+        # the next frame is due.
+        assert terminal.timeouts[:2] == [None, None]
+        assert terminal.timeouts[2] == pytest.approx(0.015)
+
+    def test_stops_when_solved(self):
+        mode, cube, _, frames = setup_mode([(0.1, "i"), (0.1, "k"), (0.1, "i")])
+        assert mode.run() is True
+        assert mode.moves == 2
+        assert cube.is_solved()
+        assert frames[-1] == StateCodec.solved_state
+
+    def test_stops_mid_burst_when_solved(self):
+        mode, cube, _, frames = setup_mode([(0.1, "ikij")])
+        assert mode.run() is True
+        assert mode.moves == 2
+        assert cube.is_solved()
+        assert frames[-1] == StateCodec.solved_state
+
+    def test_escape_sequences_do_not_quit(self):
+        # Up arrow, F1 and F5 between two moves, then a lone ESC.
+        mode, cube, _, _ = setup_mode([(0.0, "i\x1b[A\x1bOP\x1b[15~j"), (0.0, "\x1b")])
+        assert mode.run() is False
+        assert mode.moves == 2
+        assert StateCodec.encode(cube) == scrambled("R U")
+
+        mode, _, _, _ = setup_mode([])
+        mode.feed("\x1b[A")
+        assert not mode._quit
+        mode.feed("\x1b")
+        assert mode._quit
+
+    def test_custom_keymap(self):
+        mode, cube, _, _ = setup_mode([(0.1, "12")], keymap={"1": "R2", "2": "D"})
+        mode.run()
+        assert StateCodec.encode(cube) == scrambled("R2 D")
+
+    def test_invalid_keymap(self):
+        with pytest.raises(ValueError):
+            setup_mode([], keymap={"1": "X"})
+
+
+class TestRawTerminal:
+    def test_supported(self, monkeypatch):
+        assert RawTerminal.supported() is (sys.platform != "win32")
+        monkeypatch.setitem(sys.modules, "termios", None)
+        assert RawTerminal.supported() is False
+
+    def test_reads_type_ahead(self):
+        pty = pytest.importorskip("pty")
+        termios = pytest.importorskip("termios")
+        import os
+
+        master, slave = pty.openpty()
+        try:
+            with open(slave, "rb", buffering=0, closefd=False) as stream:
+                saved = termios.tcgetattr(slave)
+                with RawTerminal(stream) as terminal:
+                    assert terminal.read_keys(0) == ""
+                    os.write(master, b"ijh")
+                    assert terminal.read_keys(1.0) == "ijh"
+                assert termios.tcgetattr(slave) == saved
+        finally:
+            os.close(master)
+            os.close(slave)
@@ -0,0 +1,72 @@
+from rubiks_cube import CompactCube, CubeFactory, Notation
+import pytest
+
+
+class TestNotation:
+    def test_parse(self):
+        assert Notation.parse(" R U2  D' ") == ["R", "U2", "D'"]
+
+    @pytest.mark.parametrize("text", ["R X", "r", "U3", "R''"])
+    def test_parse_invalid(self, text):
+        with pytest.raises(ValueError, match="Unknown move"):
+            Notation.parse(text)
+
+    @pytest.mark.parametrize(
+        "move, rotations",
+        [
+            ("F", [("r", True)]),
+            ("U'", [("w", False)]),
+            ("R2", [("b", True), ("b", True)]),
+        ],
+    )
+    def test_to_rotations(self, move, rotations):
+        assert Notation.to_rotations(move) == rotations
+        assert Notation.from_rotation(*rotations[0])[0] == move[0]
+
+    def test_apply_and_invert(self):
+        cube = CubeFactory().create_solved_cube()
+        moves = Notation.parse("R U2 D' B D'")
+        Notation.apply(cube, moves)
+        assert cube.is_solved() is False
+
+        Notation.apply(cube, Notation.invert(moves))
+        assert cube.is_solved() is True
+
+    @pytest.mark.parametrize(
+        "text, moves",
+        [
+            ("R U2 D'", ["R", "U2", "D'"]),
+            ("x U", ["F"]),
+            ("y' F2", ["L2"]),
+            ("z U", ["L"]),
+            ("r U", ["L", "F"]),
+            ("M2", ["L2", "R2"]),
+            ("S' U", ["F", "B'", "R"]),
+        ],
+    )
+    def test_expand(self, text, moves):
+        assert Notation.expand(text) == moves
+
+    def test_expand_matches_wide_turn(self):
+        # A wide turn equals the face turn plus the slice turn.
+        wide = CompactCube.apply_sequence(CompactCube.solved, Notation.expand("r U"))
+        slices = CompactCube.apply_sequence(
+            CompactCube.solved, Notation.expand("R M' U")
+        )
+        assert wide == slices
+
+    @pytest.mark.parametrize("text", ["Q", "x3", "Mw"])
+    def test_expand_invalid(self, text):
+        with pytest.raises(ValueError, match="Unknown move"):
+            Notation.expand(text)
+
+    @pytest.mark.parametrize(
+        "moves, simplified",
+        [
+            (["U", "U2"], ["U'"]),
+            (["R", "U", "U'", "R'"], []),
+            (["R", "L", "L"], ["R", "L2"]),
+        ],
+    )
+    def test_simplify(self, moves, simplified):
+        assert Notation.simplify(moves) == simplified
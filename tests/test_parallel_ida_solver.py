@@ -0,0 +1,93 @@
+from rubiks_cube import CompactCube, CubeFactory, CubieCube, IDASolver, Notation
+from rubiks_cube.parallel_ida_solver import ParallelIDASolver
+from multiprocessing.shared_memory import SharedMemory
+import pytest
+import time
+
+
+@pytest.fixture(scope="module")
+def setup_solver():
+    with ParallelIDASolver(processes=2) as solver:
+        yield solver
+
+
+class TestParallelIDASolver:
+    def test_solved_cube(self, setup_solver):
+        result = setup_solver.solve(CubeFactory().create_solved_cube())
+        assert result.moves == []
+        assert result.status == "solved"
+
+    def test_solution_shorter_than_split_depth(self, setup_solver):
+        state = CompactCube.apply(CompactCube.solved, "R")
+        result = setup_solver.solve_state(state)
+        assert result.moves == ["R'"]
+
+    def test_matches_sequential_solver(self, setup_solver):
+        sequential = IDASolver()
+        for scramble in ("R U F' L2 D", "F2 L' U B D2 R'", "B' D L2 F U' R"):
+            state = CompactCube.apply_sequence(
+                CompactCube.solved, Notation.parse(scramble)
+            )
+            result = setup_solver.solve_state(state)
+            expected = sequential.solve_state(state)
+
+            assert result.status == "solved"
+            assert len(result.moves) == len(expected.moves)
+            assert CompactCube.apply_sequence(state, result.moves) == CompactCube.solved
+
+    def test_timeout(self, setup_solver):
+        state = CompactCube.apply_sequence(
+            CompactCube.solved,
+            Notation.parse("R U2 D' B D' F L2 U R' B2 D F' L U' B R2 D L' F U"),
+        )
+        result = setup_solver.solve_state(state, timeout=0.3)
+        assert result.status == "timeout"
+        assert result.moves is None
+
+        # The pool is reusable after a stopped search.
+        state = CompactCube.apply_sequence(CompactCube.solved, Notation.parse("R U F'"))
+        assert len(setup_solver.solve_state(state).moves) == 3
+
+    def test_timeout_is_honored(self, setup_solver):
+        state = CompactCube.apply_sequence(
+            CompactCube.solved,
+            Notation.parse("R U2 D' B D' F L2 U R' B2 D F' L U' B R2 D L' F U"),
+        )
+        started = time.perf_counter()
+        result = setup_solver.solve_state(state, timeout=0.5)
+        elapsed = time.perf_counter() - started
+        assert result.status == "timeout"
+        assert result.moves is None
+        # Loose bound: pool scheduling is slow on loaded machines.
+        assert elapsed < 10
+
+    def test_expired_deadline(self, setup_solver):
+        state = CompactCube.apply_sequence(
+            CompactCube.solved, Notation.parse("R U F' L2 D")
+        )
+        result = setup_solver.solve_state(state, timeout=0)
+        assert result.status == "timeout"
+        assert result.nodes == 0
+
+    def test_exhausted(self, setup_solver):
+        state = CompactCube.apply_sequence(
+            CompactCube.solved, Notation.parse("R U F' L2 D")
+        )
+        result = setup_solver.solve_state(state, max_depth=4)
+        assert result.status == "exhausted"
+        assert result.lower_bound == 5
+
+    def test_unsolvable_cube(self, setup_solver):
+        cube = CubieCube(co=[1, 0, 0, 0, 0, 0, 0, 0]).to_cube()
+        with pytest.raises(ValueError):
+            setup_solver.solve(cube)
+
+    def test_close_releases_shared_memory(self):
+        solver = ParallelIDASolver(processes=1)
+        names = [block.name for block in solver._blocks]
+        solver.close()
+        solver.close()
+
+        for name in names:
+            with pytest.raises(FileNotFoundError):
+                SharedMemory(name=name)
@@ -0,0 +1,43 @@
+from rubiks_cube import CubeFactory, Notation, Scrambler, SlimCube, StateCodec
+import random
+import pytest
+
+
+class TestScrambler:
+    def test_scramble(self):
+        moves = Scrambler.scramble(40, 5)
+        assert moves == Scrambler.scramble(40, random.Random(5))
+        assert len(moves) == 40
+        assert all(move in Notation.moves for move in moves)
+        assert all(
+            Notation.invert([first]) != [second] for first, second in zip(moves, moves[1:])
+        )
+
+    def test_independent_of_process_count(self):
+        expected = Scrambler(seed=3).scrambles(50, 20)
+        assert Scrambler(seed=3, batch_size=7).scrambles(50, 20) == expected
+        assert Scrambler(seed=3, processes=2, batch_size=9).scrambles(50, 20) == expected
+        assert Scrambler(seed=4).scrambles(50, 20) != expected
+        assert len(set(map(tuple, expected))) == 50
+
+    def test_states_match_moves(self):
+        scrambler = Scrambler(seed=1, batch_size=4)
+        states = scrambler.states(10, 25)
+        for moves, state in zip(scrambler.scrambles(10, 25), states):
+            cube = SlimCube()
+            cube.apply(moves)
+            assert cube.encode() == state
+        cubes = scrambler.cubes(10, 25)
+        assert [StateCodec.encode(cube) for cube in cubes] == states
+
+    def test_matches_cube_shuffle(self):
+        moves = Scrambler(seed=2).scrambles(5, 30)[3]
+        cube = CubeFactory().create_solved_cube()
+        cube.shuffle(30, rng=Scrambler.stream(2, 3))
+        expected = CubeFactory().create_solved_cube()
+        Notation.apply(expected, moves)
+        assert StateCodec.encode(cube) == StateCodec.encode(expected)
+
+    @pytest.mark.parametrize("count", [0, 1])
+    def test_small_counts(self, count):
+        assert len(Scrambler().scrambles(count)) == count
@@ -0,0 +1,205 @@
+from rubiks_cube import (
+    CubeController,
+    CubeFactory,
+    CubeView,
+    CubieCube,
+    Notation,
+    SharedCubeStore,
+    SlimCube,
+    StateCodec,
+)
+from pathlib import Path
+import contextlib
+import io
+import multiprocessing
+import os
+import pytest
+import rubiks_cube
+import struct
+import subprocess
+import sys
+import time
+
+
+def turn_in_child(name: str, session_id: str, moves: str, count: int) -> None:
+    store = SharedCubeStore.attach(name)
+    view = store.view(session_id)
+    for _ in range(count):
+        view.apply(Notation.parse(moves))
+    store.close()
+
+
+def turn_until_done(name: str, session_id: str, moves: str, turning, done) -> None:
+    store = SharedCubeStore.attach(name)
+    view = store.view(session_id)
+    view.apply(Notation.parse(moves))
+    turning.set()
+    while not done.is_set():
+        view.apply(Notation.parse(moves))
+    store.close()
+
+
+@pytest.fixture
+def setup_store():
+    with SharedCubeStore(4) as store:
+        yield store
+
+
+class TestSharedCubeStore:
+    def test_allocate_and_read(self, setup_store):
+        store = setup_store
+        slot = store.allocate("alice")
+        record = store.read(slot)
+        assert record.session_id == "alice"
+        assert record.moves == 0
+        assert record.state == StateCodec.solved_state
+        assert store.slot_of("alice") == slot
+        assert store.sessions() == {"alice": slot}
+
+    def test_view_matches_cube(self, setup_store):
+        store = setup_store
+        store.allocate("bob")
+        view = store.view("bob")
+        cube = CubeFactory().create_solved_cube()
+        moves = Notation.parse("R U2 D' B D' F L2")
+        view.apply(moves)
+        view.rotate("w", False)
+        Notation.apply(cube, moves + ["U'"])
+        assert view.encode() == StateCodec.encode(cube)
+        assert view.moves == len(moves) + 1
+        assert view.is_solved() is False
+        for key in StateCodec.face_keys:
+            assert view.get_face_matrix(key) == cube._get_face_by_key(key).get_face_matrix()
+        assert StateCodec.encode(view.to_cube()) == StateCodec.encode(cube)
+
+    def test_release_and_full(self, setup_store):
+        store = setup_store
+        for number in range(4):
+            store.allocate(f"s{number}")
+        with pytest.raises(ValueError):
+            store.allocate("late")
+        store.release("s2")
+        assert store.allocate("late") == 2
+        with pytest.raises(ValueError):
+            store.slot_of("s2")
+
+    def test_invalid_input(self, setup_store):
+        store = setup_store
+        store.allocate("carol")
+        with pytest.raises(ValueError):
+            store.allocate("carol")
+        with pytest.raises(ValueError):
+            store.allocate("x" * 33)
+        with pytest.raises(ValueError):
+            store.allocate("dave", bytes(10))
+        with pytest.raises(ValueError):
+            SharedCubeStore(0)
+
+    def test_write(self, setup_store):
+        store = setup_store
+        slot = store.allocate("erin")
+        cube = SlimCube()
+        cube.apply(["F"])
+        store.write(slot, cube.encode(), 1)
+        assert store.read(slot) == ("erin", 1, cube.encode())
+
+    def test_other_process_turns_in_place(self, setup_store):
+        store = setup_store
+        store.allocate("frank")
+        process = multiprocessing.Process(
+            target=turn_in_child, args=(store.name, "frank", "R U", 3)
+        )
+        process.start()
+        process.join()
+        expected = SlimCube()
+        expected.apply(Notation.parse("R U") * 3)
+        view = store.view("frank")
+        assert view.encode() == expected.encode()
+        assert view.moves == 6
+
+    def test_independent_process_leaves_store_alive(self, setup_store):
+        store = setup_store
+        store.allocate("heidi")
+        script = (
+            "import sys\n"
+            "from rubiks_cube import SharedCubeStore\n"
+            "store = SharedCubeStore.attach(sys.argv[1])\n"
+            "store.view('heidi').apply(['R'])\n"
+            "store.close()\n"
+        )
+        env = dict(os.environ, PYTHONPATH=str(Path(rubiks_cube.__file__).parents[1]))
+        for _ in range(2):
+            finished = subprocess.run(
+                [sys.executable, "-c", script, store.name],
+                env=env,
+                capture_output=True,
+                text=True,
+            )
+            assert finished.returncode == 0, finished.stderr
+            assert "leaked" not in finished.stderr
+        # The block survived both processes and can still be attached.
+        attached = SharedCubeStore.attach(store.name)
+        assert attached.read(store.slot_of("heidi")).moves == 2
+        attached.close()
+
+    def test_readers_never_see_torn_writes(self, setup_store):
+        store = setup_store
+        slot = store.allocate("grace")
+        turning = multiprocessing.Event()
+        done = multiprocessing.Event()
+        process = multiprocessing.Process(
+            target=turn_until_done,
+            args=(store.name, "grace", "R U F' L D2 B", turning, done),
+        )
+        process.start()
+        try:
+            assert turning.wait(30)
+            snapshots = set()
+            deadline = time.monotonic() + 30
+            while len(snapshots) < 20 and time.monotonic() < deadline:
+                snapshots.add(store.read(slot).state)
+        finally:
+            done.set()
+            process.join()
+        assert len(snapshots) > 1
+        for state in snapshots:
+            CubieCube.from_facelets(state)
+
+    def test_view_drives_cube_view_and_controller(self, setup_store):
+        store = setup_store
+        store.allocate("erin")
+        view = store.view("erin")
+        cube = CubeFactory().create_solved_cube()
+        keys = [("r", "u", "y"), ("w", "l", "n"), ("g", "d", "y")]
+        for command in keys:
+            CubeController(view).rotate_cube_face(command)
+            CubeController(cube).rotate_cube_face(command)
+        assert view.encode() == StateCodec.encode(cube)
+        assert not view.is_solved()
+        assert view._get_face_by_key("r").is_uniform() is cube._red_face.is_uniform()
+
+        shown = []
+        for target in (view, cube):
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                CubeView.display_cube_state(target)
+            shown.append(output.getvalue())
+        assert shown[0] == shown[1]
+        with pytest.raises(KeyError):
+            view._red_face.get_neighbor_by_key("x")
+
+    def test_move_counter_wraps(self, setup_store):
+        store = setup_store
+        slot = store.allocate("ivan")
+        store.write(slot, StateCodec.solved_state, 0xFFFFFFFF)
+        store.view("ivan").apply(["R", "U"])
+        assert store.read(slot).moves == 1
+
+    def test_read_gives_up_on_stuck_writer(self, setup_store, monkeypatch):
+        store = setup_store
+        slot = store.allocate("frank")
+        # A writer that died mid-write leaves the sequence counter odd.
+        struct.pack_into("<I", store._buffer, slot * SharedCubeStore.record_size, 7)
+        monkeypatch.setattr(SharedCubeStore, "read_timeout", 0.05)
+        with pytest.raises(TimeoutError):
+            store.read(slot)
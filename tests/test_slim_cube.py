@@ -0,0 +1,58 @@
+from rubiks_cube import CubeFactory, Notation, SlimCube, StateCodec
+import pytest
+import random
+
+
+class TestSlimCube:
+    def test_solved(self):
+        cube = SlimCube()
+        assert cube.is_solved() is True
+        assert cube.encode() == StateCodec.solved_state
+
+    def test_slots(self):
+        cube = SlimCube()
+        assert not hasattr(cube, "__dict__")
+        with pytest.raises(AttributeError):
+            cube.extra = 1
+
+    @pytest.mark.parametrize("face_key", ["r", "o", "g", "b", "w", "y"])
+    @pytest.mark.parametrize("clockwise", [True, False])
+    def test_rotation_matches_cube(self, face_key, clockwise):
+        cube = CubeFactory().create_solved_cube()
+        cube.shuffle(20, 100)
+        slim = SlimCube.from_cube(cube)
+        cube.rotate_face(cube._get_face_by_key(face_key), clockwise)
+        slim.rotate(face_key, clockwise)
+        assert slim.encode() == StateCodec.encode(cube)
+
+    def test_moves_match_cube(self):
+        rng = random.Random(5)
+        cube = CubeFactory().create_solved_cube()
+        slim = SlimCube()
+        for _ in range(200):
+            move = rng.choice(Notation.moves)
+            Notation.apply(cube, [move])
+            slim.apply([move])
+            assert slim.encode() == StateCodec.encode(cube)
+        assert slim.is_solved() is cube.is_solved()
+
+    def test_face_matrix_and_round_trip(self):
+        cube = CubeFactory().create_solved_cube()
+        cube.shuffle(35, 100)
+        slim = SlimCube.from_cube(cube)
+        for key in StateCodec.face_keys:
+            assert slim.get_face_matrix(key) == cube._get_face_by_key(key).get_face_matrix()
+        assert StateCodec.encode(slim.to_cube()) == StateCodec.encode(cube)
+
+    def test_copy_is_independent(self):
+        cube = SlimCube()
+        copy = cube.copy()
+        copy.apply(["R"])
+        assert cube.is_solved() is True
+        assert copy != cube
+        copy.apply(["R'"])
+        assert copy == cube
+
+    def test_wrong_length(self):
+        with pytest.raises(ValueError):
+            SlimCube(bytes(10))
@@ -0,0 +1,88 @@
+from rubiks_cube import (
+    CompactCube,
+    CubeSymmetry,
+    IDASolver,
+    Notation,
+    SolutionCache,
+)
+import pytest
+
+
+def scrambled(text: str) -> tuple[int, ...]:
+    return CompactCube.apply_sequence(CompactCube.solved, Notation.parse(text))
+
+
+@pytest.fixture(scope="module")
+def setup_solver():
+    return IDASolver()
+
+
+class TestSolutionCache:
+    def test_symmetric_variants_hit(self, setup_solver):
+        cache = SolutionCache(setup_solver)
+        state = scrambled("R U F' L2 D")
+        first = cache.solve_state(state)
+        assert first.status == "solved"
+        for symmetry in (5, 17, 30, 47):
+            variant = CubeSymmetry.conjugate(state, symmetry)
+            result = cache.solve_state(variant)
+            assert result.status == "solved"
+            assert result.nodes == 0
+            assert len(result.moves) == len(first.moves)
+            assert CompactCube.apply_sequence(variant, result.moves) == CompactCube.solved
+        stats = cache.stats()
+        assert stats.lookups == 5
+        assert stats.misses == 1
+        assert stats.memory_hits == 4
+        assert stats.hit_rate == 0.8
+        assert len(cache) == 1
+
+    def test_persistent_tier(self, setup_solver, tmp_path):
+        path = tmp_path / "solutions.sqlite"
+        state = scrambled("F2 L' U B D2 R'")
+        with SolutionCache(setup_solver, path) as cache:
+            expected = cache.solve_state(state)
+        with SolutionCache(setup_solver, path) as cache:
+            result = cache.solve_state(CubeSymmetry.conjugate(state, 9))
+            assert result.nodes == 0
+            assert len(result.moves) == len(expected.moves)
+            stats = cache.stats()
+            assert stats.disk_hits == 1
+            assert stats.misses == 0
+            assert stats.saved_seconds > 0 or expected.elapsed < 1e-3
+            cache.solve_state(state)
+            assert cache.stats().memory_hits == 1
+
+    def test_lru_eviction(self, setup_solver):
+        cache = SolutionCache(setup_solver, max_size=2)
+        # R, R2 and R U have distinct canonical states, so the third entry
+        # evicts R. F' is a symmetric variant of R and would have hit, but
+        # after the eviction it misses.
+        assert (
+            CubeSymmetry.canonical(scrambled("F'"))[0]
+            == CubeSymmetry.canonical(scrambled("R"))[0]
+        )
+        for text in ("R", "R2", "R U"):
+            cache.solve_state(scrambled(text))
+        cache.solve_state(scrambled("F'"))
+        assert len(cache) == 2
+        assert cache.stats().misses == 4
+
+    def test_max_depth(self, setup_solver):
+        cache = SolutionCache(setup_solver)
+        state = scrambled("R U F")
+        cache.solve_state(state)
+        result = cache.solve_state(state, max_depth=2)
+        assert result.status == "exhausted"
+        assert cache.stats().misses == 2
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            SolutionCache(max_size=0)
+
+    def test_solve_cube(self, setup_solver):
+        cache = SolutionCache(setup_solver)
+        cube = CompactCube.to_cube(scrambled("R U F"))
+        result = cache.solve(cube)
+        Notation.apply(cube, result.moves)
+        assert cube.is_solved() is True
@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+IMPORT_BUDGET_MS = 20
+
+
+class TestStartup:
+    @staticmethod
+    def _run(code: str, *options: str) -> subprocess.CompletedProcess:
+        env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+        return subprocess.run(
+            [sys.executable, *options, "-c", code],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    def test_import_loads_no_submodules(self):
+        result = self._run(
+            "import sys, rubiks_cube\n"
+            "print(sorted(m for m in sys.modules if m.startswith('rubiks_cube.')))"
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_lazy_attribute_access(self):
+        import rubiks_cube
+
+        assert rubiks_cube.Cube.__name__ == "Cube"
+        assert "CubeFactory" in dir(rubiks_cube)
+        with pytest.raises(AttributeError):
+            rubiks_cube.NotAClass
+
+    def test_star_import_exports_lazy_attributes(self):
+        import rubiks_cube
+
+        namespace = {}
+        exec("from rubiks_cube import *", namespace)
+        assert set(rubiks_cube.__all__) == set(rubiks_cube._lazy_attributes) - {"Face"}
+        assert all(name in namespace for name in rubiks_cube.__all__)
+
+    def test_import_time_budget(self):
+        times = []
+        for _ in range(3):
+            result = self._run("import rubiks_cube", "-X", "importtime")
+            for line in result.stderr.splitlines():
+                columns = line.split("|")
+                if columns[-1].strip() == "rubiks_cube":
+                    times.append(int(columns[1]) / 1000)
+        assert min(times) < IMPORT_BUDGET_MS
@@ -0,0 +1,81 @@
+from rubiks_cube import CubeFactory, StateCache, StateCodec
+import json
+import os
+import pytest
+
+
+SOLVED_FACES = {
+    "red": [["r", "r", "r"], ["r", "r", "r"], ["r", "r", "r"]],
+    "orange": [["o", "o", "o"], ["o", "o", "o"], ["o", "o", "o"]],
+    "green": [["g", "g", "g"], ["g", "g", "g"], ["g", "g", "g"]],
+    "blue": [["b", "b", "b"], ["b", "b", "b"], ["b", "b", "b"]],
+    "white": [["w", "w", "w"], ["w", "w", "w"], ["w", "w", "w"]],
+    "yellow": [["y", "y", "y"], ["y", "y", "y"], ["y", "y", "y"]],
+}
+TURNED_FACES = {
+    "red": [["b", "b", "b"], ["r", "r", "r"], ["r", "r", "r"]],
+    "orange": [["g", "g", "g"], ["o", "o", "o"], ["o", "o", "o"]],
+    "green": [["r", "r", "r"], ["g", "g", "g"], ["g", "g", "g"]],
+    "blue": [["o", "o", "o"], ["b", "b", "b"], ["b", "b", "b"]],
+    "white": [["w", "w", "w"], ["w", "w", "w"], ["w", "w", "w"]],
+    "yellow": [["y", "y", "y"], ["y", "y", "y"], ["y", "y", "y"]],
+}
+
+
+class TestStateCache:
+    @pytest.fixture
+    def setup_factory(self):
+        return CubeFactory(StateCache(max_size=2))
+
+    @staticmethod
+    def _write(path, faces, indent=None):
+        path.write_text(json.dumps({"faces": faces}, indent=indent))
+
+    def test_cached_load_returns_fresh_cubes(self, tmp_path, setup_factory):
+        factory = setup_factory
+        self._write(tmp_path / "cube.json", TURNED_FACES)
+
+        first = factory.create_cube_from_file("cube.json", file_dir=tmp_path)
+        second = factory.create_cube_from_file("cube.json", file_dir=tmp_path)
+
+        assert first is not second
+        assert first._red_face is not second._red_face
+        assert StateCodec.encode(first) == StateCodec.encode(second)
+        assert (factory.cache.hits, factory.cache.misses) == (1, 1)
+
+    def test_changed_file_is_reloaded(self, tmp_path, setup_factory):
+        factory = setup_factory
+        path = tmp_path / "cube.json"
+        self._write(path, SOLVED_FACES)
+        assert factory.create_cube_from_file("cube.json", tmp_path).is_solved()
+
+        self._write(path, TURNED_FACES, indent=2)
+        assert not factory.create_cube_from_file("cube.json", tmp_path).is_solved()
+        assert factory.cache.hits == 0
+
+    def test_lru_eviction(self, tmp_path, setup_factory):
+        factory = setup_factory
+        for name in ("a.json", "b.json", "c.json"):
+            self._write(tmp_path / name, SOLVED_FACES)
+        factory.create_cube_from_file("a.json", tmp_path)
+        factory.create_cube_from_file("b.json", tmp_path)
+        factory.create_cube_from_file("a.json", tmp_path)
+        factory.create_cube_from_file("c.json", tmp_path)
+
+        assert len(factory.cache) == 2
+        assert factory.cache.get(tmp_path / "a.json") is not None
+        assert factory.cache.get(tmp_path / "b.json") is None
+
+    def test_deleted_file_is_not_served(self, tmp_path, setup_factory):
+        factory = setup_factory
+        path = tmp_path / "cube.json"
+        self._write(path, SOLVED_FACES)
+        factory.create_cube_from_file("cube.json", tmp_path)
+        os.remove(path)
+
+        with pytest.raises(FileNotFoundError):
+            factory.create_cube_from_file("cube.json", tmp_path)
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError, match="Cache size must be positive!"):
+            StateCache(max_size=0)
@@ -0,0 +1,43 @@
+from rubiks_cube import CubeFactory, FaceColors, StateCodec
+import pytest
+
+
+class TestStateCodec:
+    @pytest.fixture
+    def setup_factory(self):
+        return CubeFactory()
+
+    def test_encode_solved_cube(self, setup_factory):
+        cube = setup_factory.create_solved_cube()
+        assert StateCodec.encode(cube) == StateCodec.solved_state
+
+    def test_decode_round_trip(self, setup_factory):
+        cube = setup_factory.create_solved_cube()
+        cube.shuffle(35, 100)
+        state = StateCodec.encode(cube)
+        decoded = StateCodec.decode(state)
+
+        for face, decoded_face in zip(
+            cube._faces_dict.values(), decoded._faces_dict.values()
+        ):
+            assert face.get_face_matrix() == decoded_face.get_face_matrix()
+        assert StateCodec.encode(decoded) == state
+
+    def test_decode_invalid_length(self):
+        with pytest.raises(ValueError, match="Cube state must contain 54 stickers!"):
+            StateCodec.decode(bytes(53))
+
+    def test_key_matrixes_round_trip(self):
+        faces = {
+            "red": [["b", "b", "b"], ["r", "r", "r"], ["r", "r", "r"]],
+            "orange": [["g", "g", "g"], ["o", "o", "o"], ["o", "o", "o"]],
+            "green": [["r", "r", "r"], ["g", "g", "g"], ["g", "g", "g"]],
+            "blue": [["o", "o", "o"], ["b", "b", "b"], ["b", "b", "b"]],
+            "white": [["w", "w", "w"], ["w", "w", "w"], ["w", "w", "w"]],
+            "yellow": [["y", "y", "y"], ["y", "y", "y"], ["y", "y", "y"]],
+        }
+        state = StateCodec.encode_key_matrixes(faces)
+
+        assert state[:3] == bytes([3, 3, 3])
+        assert StateCodec.decode(state)._red_face.get_row(0) == [FaceColors.BLUE] * 3
+        assert StateCodec.decode_key_matrixes(state) == faces
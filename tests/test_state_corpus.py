@@ -0,0 +1,131 @@
+from rubiks_cube import (
+    CompactCube,
+    CorpusWriter,
+    CubeFactory,
+    Notation,
+    StateCodec,
+    StateCorpus,
+)
+import random
+import pytest
+
+
+def random_states(count: int, seed: int) -> list[tuple[int, ...]]:
+    rng = random.Random(seed)
+    return [
+        CompactCube.apply_sequence(
+            CompactCube.solved, [rng.choice(Notation.moves) for _ in range(3)]
+        )
+        for _ in range(count)
+    ]
+
+
+@pytest.fixture
+def setup_corpus(tmp_path):
+    states = random_states(500, 1)
+    path = tmp_path / "states.rcc"
+    # A small run size forces many runs through the external merge.
+    with CorpusWriter(path, run_size=37) as writer:
+        writer.extend(states)
+    with StateCorpus(path) as corpus:
+        yield corpus, states
+
+
+class TestStateCorpus:
+    def test_random_access(self, setup_corpus):
+        corpus, states = setup_corpus
+        assert len(corpus) == len(states)
+        assert corpus[123] == states[123]
+        assert corpus[-1] == states[-1]
+        assert StateCodec.encode(corpus.cube(7)) == StateCodec.encode(
+            CompactCube.to_cube(states[7])
+        )
+        with pytest.raises(IndexError):
+            corpus[len(states)]
+
+    def test_iterates_cubes(self, setup_corpus):
+        corpus, states = setup_corpus
+        cubes = iter(corpus)
+        assert CompactCube.from_cube(next(cubes)) == states[0]
+        assert sum(1 for _ in cubes) == len(states) - 1
+
+    def test_index_is_sorted(self, setup_corpus):
+        corpus, states = setup_corpus
+        keys = [corpus._keys[i] for i in range(len(corpus))]
+        assert keys == sorted(bytes(state) for state in states)
+
+    def test_find(self, setup_corpus):
+        corpus, states = setup_corpus
+        for number in (0, 99, 250, 499):
+            assert corpus.find(states[number]) == states.index(states[number])
+        assert states[42] in corpus
+        missing = CompactCube.apply_sequence(
+            CompactCube.solved, Notation.parse("R U F' L2 D B")
+        )
+        assert missing not in corpus
+        assert corpus.find(missing) is None
+
+    def test_contains_cubes_and_other_objects(self, setup_corpus):
+        corpus, states = setup_corpus
+        assert all(cube in corpus for cube in corpus.sample(20, 3))
+        cube = CubeFactory().create_solved_cube()
+        Notation.apply(cube, Notation.parse("R U F' L2 D B"))
+        assert cube not in corpus
+        for other in (None, 5, "R U", list(states[0]), states[0][:-1], (300,) * 20):
+            assert other not in corpus
+
+    def test_sample(self, setup_corpus):
+        corpus, states = setup_corpus
+        first = [CompactCube.from_cube(cube) for cube in corpus.sample(50, 9)]
+        second = [
+            CompactCube.from_cube(cube) for cube in corpus.sample(50, random.Random(9))
+        ]
+        assert first == second
+        assert all(state in corpus for state in first)
+        with pytest.raises(ValueError):
+            corpus.sample(len(states) + 1)
+
+    def test_add_cube(self, tmp_path):
+        path = tmp_path / "cubes.rcc"
+        cube = CubeFactory().create_solved_cube()
+        with CorpusWriter(path) as writer:
+            assert writer.add_cube(cube) == 0
+            Notation.apply(cube, ["R"])
+            assert writer.add_cube(cube) == 1
+        with StateCorpus(path) as corpus:
+            assert corpus[0] == CompactCube.solved
+            assert corpus.find(CompactCube.apply(CompactCube.solved, "R")) == 1
+        assert not any(p.is_dir() for p in tmp_path.iterdir())
+
+    def test_rejects_wrong_length(self, tmp_path):
+        path = tmp_path / "short.rcc"
+        with CorpusWriter(path) as writer:
+            writer.add(CompactCube.solved)
+            with pytest.raises(ValueError):
+                writer.add((1, 2, 3))
+            assert writer.add(CompactCube.apply(CompactCube.solved, "U")) == 1
+        with StateCorpus(path) as corpus:
+            assert len(corpus) == 2
+            assert corpus[1] == CompactCube.apply(CompactCube.solved, "U")
+
+    def test_empty_corpus(self, tmp_path):
+        path = tmp_path / "empty.rcc"
+        CorpusWriter(path).close()
+        with StateCorpus(path) as corpus:
+            assert len(corpus) == 0
+            assert CompactCube.solved not in corpus
+
+    def test_invalid_files(self, tmp_path):
+        path = tmp_path / "broken.rcc"
+        path.write_bytes(b"not a corpus at all")
+        with pytest.raises(ValueError):
+            StateCorpus(path)
+        with CorpusWriter(path) as writer:
+            writer.extend(random_states(3, 2))
+        StateCorpus.index_path(path).write_bytes(
+            StateCorpus.index_path(path).read_bytes()[:-1]
+        )
+        with pytest.raises(ValueError):
+            StateCorpus(path)
+        with pytest.raises(ValueError):
+            CorpusWriter(path, run_size=0)
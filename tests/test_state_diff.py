@@ -0,0 +1,74 @@
+from rubiks_cube import CompactCube, IDASolver, Notation, StateDiffer
+from rubiks_cube.cubie_cube import CubieCube
+import random
+import pytest
+
+
+def setup_state(text):
+    return CompactCube.apply_sequence(CompactCube.solved, Notation.parse(text))
+
+
+def setup_stickers(state):
+    return CompactCube.to_cubie(state).to_facelets()
+
+
+class TestStateDiffer:
+    def test_identical_states(self):
+        state = setup_state("R U F'")
+        diff = StateDiffer.diff(state, state, relative=True)
+        assert diff.corners == diff.edges == diff.stickers == ()
+        assert diff.relative == CompactCube.solved
+
+    def test_single_move(self):
+        diff = StateDiffer.diff(CompactCube.solved, setup_state("U"))
+        assert diff.corners == (0, 1, 2, 3)
+        assert diff.edges == (0, 1, 2, 3)
+        # A U turn moves the twelve side stickers of the top layer.
+        assert len(diff.stickers) == 12
+        assert diff.relative is None
+
+    def test_stickers_match_sticker_diff(self):
+        rng = random.Random(6)
+        for _ in range(100):
+            first = CompactCube.apply_sequence(
+                CompactCube.solved, [rng.choice(Notation.moves) for _ in range(20)]
+            )
+            second = CompactCube.apply_sequence(
+                first, [rng.choice(Notation.moves) for _ in range(3)]
+            )
+            expected = StateDiffer.diff_stickers(
+                setup_stickers(first), setup_stickers(second)
+            )
+            assert StateDiffer.diff(first, second).stickers == expected
+
+    def test_relative(self):
+        first = setup_state("R U2 D' B D'")
+        moves = Notation.parse("F L' U")
+        second = CompactCube.apply_sequence(first, moves)
+
+        relative = StateDiffer.relative(first, second)
+        assert relative == CompactCube.apply_sequence(CompactCube.solved, moves)
+        assert CompactCube.multiply(first, relative) == second
+
+    def test_distance(self):
+        first = setup_state("R U2 D' B D' F L2")
+        second = CompactCube.apply_sequence(first, Notation.parse("B' R2 D"))
+        result = StateDiffer.distance(first, second, IDASolver())
+
+        assert result.status == "solved"
+        assert len(result.moves) == 3
+        assert CompactCube.apply_sequence(first, result.moves) == second
+
+    @pytest.mark.parametrize("text", ["R", "F2 L", "U R' B2 D L'"])
+    def test_inverse(self, text):
+        state = setup_state(text)
+        inverse = CompactCube.inverse(state)
+        undo = Notation.invert(Notation.parse(text))
+        assert inverse == CompactCube.apply_sequence(CompactCube.solved, undo)
+        product = CompactCube.to_cubie(state).multiply(CompactCube.to_cubie(inverse))
+        assert product == CubieCube()
+
+    def test_diff_many(self):
+        states = [setup_state(text) for text in ("R", "R U", "R U F")]
+        diffs = StateDiffer.diff_many(zip(states, states[1:]), relative=True)
+        assert [diff.relative for diff in diffs] == [setup_state("U"), setup_state("F")]
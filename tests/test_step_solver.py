@@ -0,0 +1,84 @@
+from rubiks_cube import CompactCube, CubeFactory, CubieCube, Notation, StepSolver
+import random
+import pytest
+
+
+@pytest.fixture(scope="module")
+def setup_cache_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("step_tables")
+
+
+@pytest.fixture(scope="module")
+def setup_solver(setup_cache_dir):
+    return StepSolver(setup_cache_dir)
+
+
+class TestStepSolver:
+    def test_stage_names(self, setup_solver):
+        rng = random.Random(4)
+        moves = [rng.choice(Notation.moves) for _ in range(30)]
+        state = CompactCube.apply_sequence(CompactCube.solved, moves)
+        stages = setup_solver.solve_state(state)
+
+        assert [stage.name for stage in stages] == [
+            "cross", "F2L 1", "F2L 2", "F2L 3", "F2L 4", "OLL", "PLL",
+        ]
+        assert sorted(stage.case for stage in stages[1:5]) == ["BL", "BR", "FL", "FR"]
+
+    def test_stages_solve_random_cubes(self, setup_solver):
+        rng = random.Random(8)
+        for _ in range(200):
+            moves = [rng.choice(Notation.moves) for _ in range(25)]
+            state = CompactCube.apply_sequence(CompactCube.solved, moves)
+            stages = setup_solver.solve_state(state)
+
+            state = CompactCube.apply_sequence(state, stages[0].moves)
+            assert state[12:16] == CompactCube.solved[12:16]
+            for stage in stages[1:5]:
+                state = CompactCube.apply_sequence(state, stage.moves)
+            assert state[4:8] == CompactCube.solved[4:8]
+            assert state[12:] == CompactCube.solved[12:]
+            for stage in stages[5:]:
+                state = CompactCube.apply_sequence(state, stage.moves)
+            assert state == CompactCube.solved
+
+    def test_solve_cube(self, setup_solver):
+        cube = CubeFactory().create_solved_cube()
+        Notation.apply(cube, Notation.parse("R U2 D' B D' F L2 U R' B2 D F' L"))
+        stages = setup_solver.solve(cube)
+
+        for stage in stages:
+            Notation.apply(cube, stage.moves)
+        assert cube.is_solved() is True
+
+    def test_solved_cube(self, setup_solver):
+        stages = setup_solver.solve_state(CompactCube.solved)
+        assert all(stage.moves == [] for stage in stages)
+
+    def test_unsolvable_cube(self, setup_solver):
+        cube = CubieCube(co=[1, 0, 0, 0, 0, 0, 0, 0]).to_cube()
+        with pytest.raises(ValueError):
+            setup_solver.solve(cube)
+
+    def test_default_keeps_tables_in_memory(
+        self, setup_solver, tmp_path, monkeypatch
+    ):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        solver = StepSolver()
+        assert solver.cache_dir is None
+        assert solver._cross_table == setup_solver._cross_table
+        assert list(tmp_path.iterdir()) == []
+        assert StepSolver.default_cache_dir() == tmp_path / "xdg" / "rubiks_cube"
+
+    def test_tables_cached_on_disk(self, setup_solver, setup_cache_dir, monkeypatch):
+        assert (setup_cache_dir / StepSolver.cross_table_name).exists()
+        assert (setup_cache_dir / StepSolver.f2l_table_name).exists()
+
+        monkeypatch.setattr(StepSolver, "_tables", {})
+        monkeypatch.setattr(
+            "rubiks_cube.step_solver._build_cross_table",
+            lambda: pytest.fail("table was rebuilt"),
+        )
+        solver = StepSolver(setup_cache_dir)
+        assert solver._cross_table == setup_solver._cross_table
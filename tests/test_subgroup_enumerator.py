@@ -0,0 +1,86 @@
+from rubiks_cube import CompactCube, DistanceDistribution, Notation, SubgroupIndex
+import random
+import pytest
+
+
+def setup_histogram(moves):
+    seen = {CompactCube.solved}
+    frontier = [CompactCube.solved]
+    histogram = [1]
+    while True:
+        next_frontier = []
+        for state in frontier:
+            for move in moves:
+                child = CompactCube.apply(state, move)
+                if child not in seen:
+                    seen.add(child)
+                    next_frontier.append(child)
+        if not next_frontier:
+            return histogram
+        histogram.append(len(next_frontier))
+        frontier = next_frontier
+
+
+class TestSubgroupIndex:
+    def test_parse_generators(self):
+        assert SubgroupIndex.parse_generators("U, R2") == ("U", "U2", "U'", "R2")
+        with pytest.raises(ValueError):
+            SubgroupIndex.parse_generators("X")
+        with pytest.raises(ValueError):
+            SubgroupIndex.parse_generators("")
+
+    def test_size(self):
+        # Four corners and four edges turn in place, without orientation.
+        assert SubgroupIndex("U").size == 24 * 24
+        # R twists corners but flips no edges.
+        assert SubgroupIndex("U R").size == 720 * 3**5 * 5040
+
+    def test_rank_round_trip(self):
+        index = SubgroupIndex("U R F")
+        rng = random.Random(3)
+        for _ in range(50):
+            moves = [rng.choice(index.moves) for _ in range(30)]
+            state = CompactCube.apply_sequence(CompactCube.solved, moves)
+            rank = index.rank(state)
+            assert 0 <= rank < index.size
+            assert index.unrank(rank) == state
+
+
+class TestDistanceDistribution:
+    @pytest.mark.parametrize("generators", ["U", "U2 R2", "R2 U"])
+    def test_matches_breadth_first_search(self, tmp_path, generators):
+        histogram = DistanceDistribution(generators, tmp_path).run()
+        expected = setup_histogram(SubgroupIndex.parse_generators(generators))
+        assert histogram == expected
+
+    def test_processes(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(DistanceDistribution, "slice_size", 1 << 16)
+        histogram = DistanceDistribution("R2 U", tmp_path, processes=2).run()
+        assert histogram == setup_histogram(Notation.parse("R2 U U2 U'"))
+
+    def test_resume(self, tmp_path):
+        partial = DistanceDistribution("R2 U", tmp_path).run(max_depth=5)
+        assert partial == [1, 4, 6, 12, 18, 36]
+
+        histogram = DistanceDistribution("R2 U", tmp_path).run()
+        assert histogram[:6] == partial
+        assert sum(histogram) == 14400
+
+    def test_resume_after_interrupted_level(self, tmp_path, monkeypatch):
+        distribution = DistanceDistribution("U2 R2", tmp_path)
+        distribution.run(max_depth=2)
+
+        def interrupt(self, progress, table):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(DistanceDistribution, "_save_progress", interrupt)
+        with pytest.raises(KeyboardInterrupt):
+            distribution.run()
+        monkeypatch.undo()
+
+        assert distribution.run() == [1, 2, 2, 2, 2, 2, 1]
+
+    def test_other_generators_rejected(self, tmp_path):
+        DistanceDistribution("U", tmp_path).run()
+        with pytest.raises(ValueError):
+            DistanceDistribution("R", tmp_path).run()
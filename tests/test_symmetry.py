@@ -0,0 +1,51 @@
+from rubiks_cube import CompactCube, CubeSymmetry, Notation
+import random
+
+
+class TestCubeSymmetry:
+    def test_group(self):
+        states = {
+            CubeSymmetry.conjugate(
+                CompactCube.apply_sequence(CompactCube.solved, ["R", "U"]), symmetry
+            )
+            for symmetry in range(CubeSymmetry.count)
+        }
+        assert len(states) == 48
+        assert CubeSymmetry.relabel(["R", "U2", "F'"], 0) == ["R", "U2", "F'"]
+        assert all(
+            CubeSymmetry.conjugate(CompactCube.solved, symmetry) == CompactCube.solved
+            for symmetry in range(CubeSymmetry.count)
+        )
+
+    def test_conjugate_matches_relabeled_moves(self):
+        rng = random.Random(3)
+        for symmetry in range(CubeSymmetry.count):
+            moves = [rng.choice(Notation.moves) for _ in range(20)]
+            state = CompactCube.apply_sequence(CompactCube.solved, moves)
+            relabeled = CubeSymmetry.relabel(moves, symmetry)
+            assert CubeSymmetry.conjugate(state, symmetry) == CompactCube.apply_sequence(
+                CompactCube.solved, relabeled
+            )
+
+    def test_inverse(self):
+        state = CompactCube.apply_sequence(CompactCube.solved, Notation.parse("R U2 D' B D'"))
+        for symmetry in range(CubeSymmetry.count):
+            inverse = CubeSymmetry.inverse(symmetry)
+            assert CubeSymmetry.conjugate(CubeSymmetry.conjugate(state, symmetry), inverse) == state
+            assert CubeSymmetry.relabel(CubeSymmetry.relabel(["R", "F'"], symmetry), inverse) == ["R", "F'"]
+
+    def test_canonical_shared_by_variants(self):
+        state = CompactCube.apply_sequence(CompactCube.solved, Notation.parse("F R' B2 L U"))
+        canonical, symmetry = CubeSymmetry.canonical(state)
+        assert CubeSymmetry.conjugate(state, symmetry) == canonical
+        for other in range(CubeSymmetry.count):
+            variant = CubeSymmetry.conjugate(state, other)
+            assert CubeSymmetry.canonical(variant)[0] == canonical
+
+    def test_mirror_reverses_turns(self):
+        mirrored = [
+            symmetry
+            for symmetry in range(CubeSymmetry.count)
+            if CubeSymmetry.relabel(["U"], symmetry)[0].endswith("'")
+        ]
+        assert len(mirrored) == 24
@@ -1,6 +1,6 @@
 import pytest
 from pathlib import Path
-from rubiks_cube import Validator
+from rubiks_cube import CubieCube, StateCodec, Validator
 
 class TestInputValidation:
     @pytest.mark.parametrize(
@@ -158,4 +158,48 @@ class TestInputValidation:
             "y": [["y", "y", "y"], ["y", "y", "y"], ["y", "y", "y"]],
         }
         with pytest.raises(KeyError):
-            Validator._validate_center_colors(invalid_data)
\ No newline at end of file
+            Validator._validate_center_colors(invalid_data)
+
+    def test_state_validation_valid(self):
+        cubie_cube = CubieCube()
+        for face_key in "rbwgoy":
+            cubie_cube.move(face_key)
+        Validator.validate_state(cubie_cube.to_facelets())
+
+    def test_solvability_validation_on_file_data(self):
+        invalid_data = {
+            "red": [["r", "r", "r"], ["r", "r", "r"], ["r", "r", "r"]],
+            "orange": [["o", "o", "o"], ["o", "o", "o"], ["o", "o", "o"]],
+            "green": [["g", "g", "g"], ["g", "g", "g"], ["g", "g", "g"]],
+            "blue": [["b", "b", "b"], ["b", "b", "b"], ["b", "b", "b"]],
+            "white": [["w", "w", "w"], ["w", "w", "w"], ["w", "w", "y"]],
+            "yellow": [["y", "y", "y"], ["y", "y", "y"], ["y", "y", "w"]],
+        }
+        with pytest.raises(ValueError):
+            Validator.validate_file_data(invalid_data)
+
+    def test_color_count_validation_invalid(self):
+        state = bytearray(StateCodec.solved_state)
+        state[9] = 0
+        with pytest.raises(ValueError, match="Color 'r' appears 10 times instead of 9!"):
+            Validator.validate_state(bytes(state))
+
+    def test_piece_identity_validation_invalid(self):
+        cubie_cube = CubieCube(cp=[0, 0, 2, 3, 4, 5, 6, 7])
+        with pytest.raises(ValueError, match="Corner URF appears 2 times instead of once!"):
+            Validator._validate_piece_identities(cubie_cube)
+
+    def test_corner_twist_validation_invalid(self):
+        cubie_cube = CubieCube(co=[1, 0, 0, 0, 0, 0, 0, 0])
+        with pytest.raises(ValueError, match="a corner is twisted!"):
+            Validator.validate_state(cubie_cube.to_facelets())
+
+    def test_edge_flip_validation_invalid(self):
+        cubie_cube = CubieCube(eo=[1] + [0] * 11)
+        with pytest.raises(ValueError, match="an edge is flipped!"):
+            Validator.validate_state(cubie_cube.to_facelets())
+
+    def test_permutation_parity_validation_invalid(self):
+        cubie_cube = CubieCube(ep=[1, 0] + list(range(2, 12)))
+        with pytest.raises(ValueError, match="two pieces are swapped!"):
+            Validator.validate_state(cubie_cube.to_facelets())